@@ -0,0 +1,84 @@
+"""initial schema
+
+Revision ID: a3cdd5ec3cf7
+Revises: 
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3cdd5ec3cf7'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'users',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('email', sa.String(length=255), nullable=False),
+        sa.Column('hashed_password', sa.String(length=255), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+
+    op.create_table(
+        'prayers',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('subject', sa.String(length=100), nullable=False),
+        sa.Column('title', sa.String(length=200), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('prayer_type', sa.String(length=50), nullable=False),
+        sa.Column('prayer_targets', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('category_tags', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('status', sa.Enum('ACTIVE', 'ANSWERED', name='prayerstatus', native_enum=False, length=50), nullable=False),
+        sa.Column('start_date', sa.Date(), nullable=False),
+        sa.Column('answer_date', sa.Date(), nullable=True),
+        sa.Column('answer_content', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_prayers_user_id'), 'prayers', ['user_id'], unique=False)
+    op.create_index(op.f('ix_prayers_subject'), 'prayers', ['subject'], unique=False)
+    op.create_index(op.f('ix_prayers_status'), 'prayers', ['status'], unique=False)
+    op.create_index(op.f('ix_prayers_start_date'), 'prayers', ['start_date'], unique=False)
+
+    op.create_table(
+        'prayer_progress',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('prayer_id', sa.UUID(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.Column('recorded_date', sa.Date(), nullable=False),
+        sa.Column('tags', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['prayer_id'], ['prayers.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_prayer_progress_prayer_id'), 'prayer_progress', ['prayer_id'], unique=False)
+    op.create_index(op.f('ix_prayer_progress_recorded_date'), 'prayer_progress', ['recorded_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_prayer_progress_recorded_date'), table_name='prayer_progress')
+    op.drop_index(op.f('ix_prayer_progress_prayer_id'), table_name='prayer_progress')
+    op.drop_table('prayer_progress')
+    op.drop_index(op.f('ix_prayers_start_date'), table_name='prayers')
+    op.drop_index(op.f('ix_prayers_status'), table_name='prayers')
+    op.drop_index(op.f('ix_prayers_subject'), table_name='prayers')
+    op.drop_index(op.f('ix_prayers_user_id'), table_name='prayers')
+    op.drop_table('prayers')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
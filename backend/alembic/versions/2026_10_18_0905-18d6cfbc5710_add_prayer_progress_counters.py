@@ -0,0 +1,42 @@
+"""add prayer progress counters
+
+Revision ID: 18d6cfbc5710
+Revises: a3cdd5ec3cf7
+Create Date: 2026-10-18 09:05:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '18d6cfbc5710'
+down_revision: Union[str, None] = 'a3cdd5ec3cf7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('prayers', sa.Column('progress_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('prayers', sa.Column('last_progress_date', sa.Date(), nullable=True))
+
+    # 기존 응답 과정으로 집계 채우기
+    op.execute(
+        """
+        UPDATE prayers p
+        SET progress_count = agg.progress_count,
+            last_progress_date = agg.last_progress_date
+        FROM (
+            SELECT prayer_id, count(*) AS progress_count, max(recorded_date) AS last_progress_date
+            FROM prayer_progress
+            GROUP BY prayer_id
+        ) agg
+        WHERE p.id = agg.prayer_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('prayers', 'last_progress_date')
+    op.drop_column('prayers', 'progress_count')
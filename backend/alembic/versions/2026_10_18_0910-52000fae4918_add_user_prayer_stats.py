@@ -0,0 +1,68 @@
+"""add user prayer stats
+
+Revision ID: 52000fae4918
+Revises: 18d6cfbc5710
+Create Date: 2026-10-18 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '52000fae4918'
+down_revision: Union[str, None] = '18d6cfbc5710'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_prayer_stats',
+        sa.Column('user_id', sa.UUID(), nullable=False),
+        sa.Column('total_prayers', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('active_prayers', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('answered_prayers', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('answered_without_content', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('by_subject', postgresql.JSONB(astext_type=sa.Text()), server_default='{}', nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id')
+    )
+
+    # 기존 사용자 요약 생성 (이후에는 rebuild_stats.py로 재생성 가능)
+    op.execute(
+        """
+        INSERT INTO user_prayer_stats (
+            user_id, total_prayers, active_prayers, answered_prayers,
+            answered_without_content, by_subject, updated_at
+        )
+        SELECT
+            u.id,
+            coalesce(sum(s.total), 0),
+            coalesce(sum(s.active), 0),
+            coalesce(sum(s.answered), 0),
+            coalesce(sum(s.without_content), 0),
+            coalesce(jsonb_object_agg(s.subject, s.total) FILTER (WHERE s.subject IS NOT NULL), '{}'::jsonb),
+            timezone('utc', now())
+        FROM users u
+        LEFT JOIN (
+            SELECT
+                user_id,
+                subject,
+                count(*) AS total,
+                count(*) FILTER (WHERE status = 'ACTIVE') AS active,
+                count(*) FILTER (WHERE status = 'ANSWERED') AS answered,
+                count(*) FILTER (WHERE status = 'ANSWERED' AND answer_content IS NULL) AS without_content
+            FROM prayers
+            GROUP BY user_id, subject
+        ) s ON s.user_id = u.id
+        GROUP BY u.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_prayer_stats')
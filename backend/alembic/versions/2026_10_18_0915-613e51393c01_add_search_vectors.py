@@ -0,0 +1,62 @@
+"""add search vectors
+
+Revision ID: 613e51393c01
+Revises: 52000fae4918
+Create Date: 2026-10-18 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '613e51393c01'
+down_revision: Union[str, None] = '52000fae4918'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column(
+        'prayers',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple'::regconfig, coalesce(content, '')), 'B') || "
+                "setweight(to_tsvector('simple'::regconfig, coalesce(answer_content, '')), 'C')",
+                persisted=True
+            ),
+            nullable=True
+        )
+    )
+    op.add_column(
+        'prayer_progress',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('simple'::regconfig, coalesce(content, ''))", persisted=True),
+            nullable=True
+        )
+    )
+
+    op.create_index('ix_prayers_search_vector', 'prayers', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_prayers_title_trgm', 'prayers', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_prayers_content_trgm', 'prayers', ['content'], unique=False, postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'})
+    op.create_index('ix_prayer_progress_search_vector', 'prayer_progress', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_prayer_progress_content_trgm', 'prayer_progress', ['content'], unique=False, postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_prayer_progress_content_trgm', table_name='prayer_progress')
+    op.drop_index('ix_prayer_progress_search_vector', table_name='prayer_progress')
+    op.drop_index('ix_prayers_content_trgm', table_name='prayers')
+    op.drop_index('ix_prayers_title_trgm', table_name='prayers')
+    op.drop_index('ix_prayers_search_vector', table_name='prayers')
+    op.drop_column('prayer_progress', 'search_vector')
+    op.drop_column('prayers', 'search_vector')
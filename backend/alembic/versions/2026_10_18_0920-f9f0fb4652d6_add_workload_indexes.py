@@ -0,0 +1,71 @@
+"""add workload indexes
+
+실제 조회 패턴(WHERE user_id = ? ORDER BY created_at DESC 등)에 맞춘 복합/부분 인덱스로
+단일 컬럼 인덱스를 대체합니다. 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY로 생성합니다.
+
+Revision ID: f9f0fb4652d6
+Revises: 613e51393c01
+Create Date: 2026-10-18 09:20:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f9f0fb4652d6'
+down_revision: Union[str, None] = '613e51393c01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_prayers_user_created', 'prayers',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_prayers_user_status', 'prayers', ['user_id', 'status'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_prayers_user_subject', 'prayers', ['user_id', 'subject'],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_prayers_answered_without_content', 'prayers',
+            ['user_id', sa.text('answer_date DESC')],
+            unique=False, postgresql_concurrently=True,
+            postgresql_where=sa.text("status = 'ANSWERED' AND answer_content IS NULL")
+        )
+        op.create_index(
+            'ix_prayer_progress_prayer_recorded', 'prayer_progress',
+            ['prayer_id', sa.text('recorded_date DESC')],
+            unique=False, postgresql_concurrently=True
+        )
+
+        # 복합 인덱스로 대체된 단일 컬럼 인덱스
+        op.drop_index('ix_prayers_user_id', table_name='prayers', postgresql_concurrently=True)
+        op.drop_index('ix_prayers_subject', table_name='prayers', postgresql_concurrently=True)
+        op.drop_index('ix_prayers_status', table_name='prayers', postgresql_concurrently=True)
+        op.drop_index('ix_prayers_start_date', table_name='prayers', postgresql_concurrently=True)
+        op.drop_index('ix_prayer_progress_prayer_id', table_name='prayer_progress', postgresql_concurrently=True)
+        op.drop_index('ix_prayer_progress_recorded_date', table_name='prayer_progress', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    op.create_index('ix_prayer_progress_recorded_date', 'prayer_progress', ['recorded_date'], unique=False)
+    op.create_index('ix_prayer_progress_prayer_id', 'prayer_progress', ['prayer_id'], unique=False)
+    op.create_index('ix_prayers_start_date', 'prayers', ['start_date'], unique=False)
+    op.create_index('ix_prayers_status', 'prayers', ['status'], unique=False)
+    op.create_index('ix_prayers_subject', 'prayers', ['subject'], unique=False)
+    op.create_index('ix_prayers_user_id', 'prayers', ['user_id'], unique=False)
+
+    op.drop_index('ix_prayer_progress_prayer_recorded', table_name='prayer_progress')
+    op.drop_index('ix_prayers_answered_without_content', table_name='prayers')
+    op.drop_index('ix_prayers_user_subject', table_name='prayers')
+    op.drop_index('ix_prayers_user_status', table_name='prayers')
+    op.drop_index('ix_prayers_user_created', table_name='prayers')
@@ -0,0 +1,61 @@
+"""add prayer sort indexes
+
+Revision ID: 7c1e2b9d4a10
+Revises: f9f0fb4652d6
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e2b9d4a10'
+down_revision: Union[str, None] = 'f9f0fb4652d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 마이그레이션은 작성 시점의 정의를 고정 (애플리케이션 코드가 바뀌어도 결과가 같도록)
+KOREAN_COLLATION = "ko_kr"
+CREATE_KOREAN_COLLATION = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_collation WHERE collname = 'ko_kr') THEN
+        BEGIN
+            CREATE COLLATION ko_kr (provider = icu, locale = 'ko-KR');
+        EXCEPTION WHEN feature_not_supported THEN
+            CREATE COLLATION ko_kr FROM "C";
+        END;
+    END IF;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    op.execute(CREATE_KOREAN_COLLATION)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_prayers_user_start_date', 'prayers',
+            ['user_id', sa.text('start_date DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_prayers_user_answer_date', 'prayers',
+            ['user_id', sa.text("coalesce(answer_date, '0001-01-01'::date) DESC"), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_prayers_user_title', 'prayers',
+            ['user_id', sa.text(f'title COLLATE {KOREAN_COLLATION}'), 'id'],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_prayers_user_title', table_name='prayers')
+    op.drop_index('ix_prayers_user_answer_date', table_name='prayers')
+    op.drop_index('ix_prayers_user_start_date', table_name='prayers')
+    op.execute(f"DROP COLLATION IF EXISTS {KOREAN_COLLATION}")
@@ -0,0 +1,25 @@
+"""add user data version
+
+Revision ID: b5d83e0f2c41
+Revises: 7c1e2b9d4a10
+Create Date: 2026-10-18 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d83e0f2c41'
+down_revision: Union[str, None] = '7c1e2b9d4a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_prayer_stats', sa.Column('data_version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('user_prayer_stats', 'data_version')
@@ -0,0 +1,41 @@
+"""add progress timeline index
+
+응답 과정 타임라인의 (recorded_date, id) 커서 페이지네이션을 위해
+(prayer_id, recorded_date DESC) 인덱스를 id까지 포함한 인덱스로 교체합니다.
+
+Revision ID: f257a767b8a1
+Revises: b5d83e0f2c41
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f257a767b8a1'
+down_revision: Union[str, None] = 'b5d83e0f2c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_prayer_progress_prayer_timeline', 'prayer_progress',
+            ['prayer_id', sa.text('recorded_date DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_prayer_progress_prayer_recorded', table_name='prayer_progress',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_prayer_progress_prayer_recorded', 'prayer_progress',
+        ['prayer_id', sa.text('recorded_date DESC')], unique=False
+    )
+    op.drop_index('ix_prayer_progress_prayer_timeline', table_name='prayer_progress')
@@ -0,0 +1,93 @@
+"""add prayer_progress user_id
+
+응답 과정에 기도 소유자(user_id)를 비정규화하여 사용자별 피드와 소유 확인을
+prayers 조인 없이 처리합니다. 긴 잠금을 피하기 위해
+- 기존 행은 id 키셋 배치마다 따로 커밋하며 prayers에서 채우고
+- NOT NULL은 검증된 CHECK 제약으로 전체 스캔 없이 설정하고
+- 외래 키는 NOT VALID로 추가한 뒤 별도로 VALIDATE하며
+- 피드용 인덱스는 CONCURRENTLY로 생성합니다.
+
+Revision ID: 48e7ce82e54f
+Revises: f257a767b8a1
+Create Date: 2026-10-18 11:30:00.000000
+
+"""
+import uuid
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# 백필 배치 크기 (배치마다 커밋)
+BACKFILL_BATCH_SIZE = 10000
+
+# id 키셋 순서로 한 배치씩 채우고 배치의 마지막 id를 반환받아 다음 배치 시작점으로 사용
+# (user_id IS NULL을 찾는 인덱스가 없어 매 배치 테이블을 처음부터 다시 스캔하지 않도록)
+BACKFILL_BATCH = sa.text(
+    "WITH batch AS ("
+    "SELECT id FROM prayer_progress WHERE id > :last_id ORDER BY id LIMIT :batch_size"
+    ") "
+    "UPDATE prayer_progress SET user_id = prayers.user_id "
+    "FROM batch, prayers "
+    "WHERE prayer_progress.id = batch.id AND prayers.id = prayer_progress.prayer_id "
+    "RETURNING prayer_progress.id"
+)
+
+# 백필 중 이전 버전 애플리케이션이 추가한 행 등 남은 행 채우기 (전체 한 번)
+BACKFILL_REMAINING = (
+    "UPDATE prayer_progress SET user_id = prayers.user_id "
+    "FROM prayers "
+    "WHERE prayers.id = prayer_progress.prayer_id AND prayer_progress.user_id IS NULL"
+)
+
+# revision identifiers, used by Alembic.
+revision: str = '48e7ce82e54f'
+down_revision: Union[str, None] = 'f257a767b8a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('prayer_progress', sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True))
+
+    # 이후 단계는 각 문장이 따로 커밋되어 테이블 잠금을 짧게 유지
+    with op.get_context().autocommit_block():
+        if not op.get_context().as_sql:
+            bind = op.get_bind()
+            last_id = uuid.UUID(int=0)
+            while True:
+                ids = bind.execute(
+                    BACKFILL_BATCH, {"last_id": last_id, "batch_size": BACKFILL_BATCH_SIZE}
+                ).scalars().all()
+                if not ids:
+                    break
+                last_id = max(ids)
+        op.execute(BACKFILL_REMAINING)
+
+        # 검증된 CHECK (user_id IS NOT NULL)이 있으면 SET NOT NULL이 테이블을 다시 스캔하지 않음
+        op.execute(
+            "ALTER TABLE prayer_progress ADD CONSTRAINT prayer_progress_user_id_backfilled "
+            "CHECK (user_id IS NOT NULL) NOT VALID"
+        )
+        op.execute("ALTER TABLE prayer_progress VALIDATE CONSTRAINT prayer_progress_user_id_backfilled")
+        op.alter_column('prayer_progress', 'user_id', nullable=False)
+        op.drop_constraint('prayer_progress_user_id_backfilled', 'prayer_progress', type_='check')
+
+        op.create_foreign_key(
+            'prayer_progress_user_id_fkey', 'prayer_progress', 'users',
+            ['user_id'], ['id'], ondelete='CASCADE', postgresql_not_valid=True
+        )
+        op.execute("ALTER TABLE prayer_progress VALIDATE CONSTRAINT prayer_progress_user_id_fkey")
+
+        op.create_index(
+            'ix_prayer_progress_user_timeline', 'prayer_progress',
+            ['user_id', sa.text('recorded_date DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_prayer_progress_user_timeline', table_name='prayer_progress')
+    op.drop_constraint('prayer_progress_user_id_fkey', 'prayer_progress', type_='foreignkey')
+    op.drop_column('prayer_progress', 'user_id')
@@ -0,0 +1,35 @@
+"""add rate_limit_buckets
+
+여러 워커가 로그인 요청 제한 토큰 버킷을 공유하기 위한 테이블입니다.
+재시작 후 비워져도 버킷이 가득 찬 상태로 돌아갈 뿐이므로 UNLOGGED로 만듭니다.
+
+Revision ID: c4e81f0a9d37
+Revises: 48e7ce82e54f
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e81f0a9d37'
+down_revision: Union[str, None] = '48e7ce82e54f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'rate_limit_buckets',
+        sa.Column('key', sa.String(length=320), nullable=False),
+        sa.Column('tokens', sa.Float(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+        prefixes=['UNLOGGED']
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('rate_limit_buckets')
@@ -1,10 +1,15 @@
-from typing import AsyncGenerator
-from fastapi import Depends, HTTPException, status
+import hashlib
+from datetime import date
+from typing import AsyncGenerator, Dict, Optional
+from uuid import UUID
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from app.core.database import AsyncSessionLocal
+from app.core.replica import read_router
 from app.core.security import decode_token
 from app.models.user import User
+from app.services.summary_service import SummaryService
 from app.services.user_service import UserService
 
 
@@ -20,11 +25,19 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """현재 인증된 사용자 가져오기"""
+def get_session_factory() -> async_sessionmaker:
+    """요청 처리 후에도 쓰는 세션(스트리밍 응답 등)을 만들기 위한 세션 팩토리"""
+    return AsyncSessionLocal
+
+
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> UUID:
+    """검증된 액세스 토큰의 사용자 ID (users 테이블 조회 없음)
+    
+    사용자 ID만 필요한 조회 엔드포인트에서 사용합니다.
+    삭제된 사용자의 토큰도 만료 전까지는 통과하지만 조회 결과는 비어 있습니다.
+    """
     token = credentials.credentials
     
     # 토큰 디코드
@@ -51,17 +64,42 @@ async def get_current_user(
             detail="Invalid token payload"
         )
     
-    # 사용자 조회
     try:
-        from uuid import UUID
-        user_uuid = UUID(user_id)
+        return UUID(user_id)
     except ValueError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid user ID"
         )
+
+
+async def get_read_db(
+    user_id: UUID = Depends(get_current_user_id)
+) -> AsyncGenerator[AsyncSession, None]:
+    """조회 전용(READ ONLY) 세션 의존성
     
-    user = await UserService.get_by_id(db, user_uuid)
+    DATABASE_READ_URL이 있으면 복제본을 사용하고, 사용자가 방금 쓴 경우나
+    복제본 상태 확인이 실패한 경우에는 기본 DB를 사용합니다.
+    """
+    session_factory = await read_router.session_factory(user_id)
+    # async with 블록을 빠져나갈 때 세션이 닫힘 (별도 close() 불필요)
+    async with session_factory() as session:
+        yield session
+
+
+async def get_read_session_factory(
+    user_id: UUID = Depends(get_current_user_id)
+) -> async_sessionmaker:
+    """요청 처리 후에도 쓰는 조회 전용 세션(스트리밍 응답 등)의 팩토리 (get_read_db와 같은 라우팅)"""
+    return await read_router.session_factory(user_id)
+
+
+async def get_current_user(
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """현재 인증된 사용자 가져오기 (캐시된 읽기 전용 사본)"""
+    user = await UserService.get_cached_by_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -69,3 +107,48 @@ async def get_current_user(
         )
     
     return user
+
+
+def make_etag(user_id, version: int, today: date) -> str:
+    """사용자, 데이터 버전, 서버 날짜로 강한 ETag 생성
+
+    기도 일수(prayer_days)와 기간 정렬은 오늘 날짜로 계산되므로 날짜가 바뀌면 ETag도 바뀝니다.
+    """
+    digest = hashlib.sha256(f"{user_id}:{version}:{today}".encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (목록, W/ 접두사, * 허용)"""
+    if not if_none_match:
+        return False
+    
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+async def check_not_modified(
+    request: Request,
+    response: Response,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
+) -> Dict[str, str]:
+    """사용자 데이터 버전 기반 조건부 GET
+    
+    데이터와 같은 조회 세션(get_read_db)에서 버전을 읽어 ETag가 응답 내용과 어긋나지 않게 합니다.
+    If-None-Match가 현재 ETag와 같으면 조회 쿼리 실행 전에 304로 응답하고,
+    아니면 응답에 ETag 헤더를 설정한 뒤 같은 헤더를 반환합니다
+    (Response를 직접 반환하는 엔드포인트에서 사용).
+    """
+    version = await SummaryService.get_version(db, user_id)
+    if version is None:
+        return {}
+    
+    etag = make_etag(user_id, version, date.today())
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    return headers
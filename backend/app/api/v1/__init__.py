@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1 import auth, prayers, progress, dashboard
+from app.api.v1 import auth, prayers, progress, dashboard, search, export, imports
 
 api_router = APIRouter()
 
@@ -7,4 +7,8 @@ api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(prayers.router, prefix="/prayers", tags=["prayers"])
 api_router.include_router(progress.router, prefix="/prayers", tags=["progress"])
+api_router.include_router(progress.feed_router, prefix="/progress", tags=["progress"])
 api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(export.router, prefix="/export", tags=["export"])
+api_router.include_router(imports.router, prefix="/import", tags=["import"])
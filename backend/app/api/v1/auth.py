@@ -1,14 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import math
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db, get_current_user
 from app.schemas.user import UserCreate, UserLogin, UserWithToken, UserResponse
 from app.services.user_service import UserService
-from app.core.security import create_access_token, create_refresh_token
+from app.core.security import create_access_token, create_refresh_token, PasswordHasherBusy
+from app.core.rate_limit import login_rate_limiter
 
 
 router = APIRouter()
 
 
+def hasher_busy() -> HTTPException:
+    """해싱 대기열이 가득 찼을 때 응답 (기다리지 않고 바로 거절)"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is temporarily overloaded, please retry",
+        headers={"Retry-After": "1"}
+    )
+
+
 @router.post("/register", response_model=UserWithToken, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
@@ -24,7 +35,10 @@ async def register(
         )
     
     # 사용자 생성
-    user = await UserService.create_user(db, user_data)
+    try:
+        user = await UserService.create_user(db, user_data)
+    except PasswordHasherBusy:
+        raise hasher_busy()
     
     # 토큰 생성
     access_token = create_access_token(subject=str(user.id))
@@ -40,11 +54,25 @@ async def register(
 @router.post("/login", response_model=UserWithToken)
 async def login(
     login_data: UserLogin,
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
-    """로그인"""
+    """로그인 (IP/이메일별 시도 제한, 초과 시 비밀번호 검증 없이 429)"""
+    # 시도 제한 (프록시 뒤에서는 uvicorn --proxy-headers로 실제 클라이언트 IP 사용)
+    client_ip = request.client.host if request.client else "unknown"
+    retry_after = await login_rate_limiter.check(client_ip, login_data.email)
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))}
+        )
+    
     # 사용자 인증
-    user = await UserService.authenticate(db, login_data.email, login_data.password)
+    try:
+        user = await UserService.authenticate(db, login_data.email, login_data.password)
+    except PasswordHasherBusy:
+        raise hasher_busy()
     
     if not user:
         raise HTTPException(
@@ -1,69 +1,74 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Dict, List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.api.deps import get_db, get_current_user
-from app.models.user import User
-from app.schemas.dashboard import DashboardStats, RecentPrayersResponse
-from app.schemas.prayer import PrayerWithProgress, PrayerResponse
+from app.api.deps import get_read_db, get_current_user_id, check_not_modified
+from app.schemas.dashboard import DashboardStats, RecentPrayersResponse, SubjectStats
+from app.schemas.prayer import PrayerResponse, PrayerWithProgress
 from app.services.stats_service import StatsService
-from app.services.prayer_service import PrayerService
-from app.services.progress_service import ProgressService
+from app.utils.fields import parse_fields
 
 
 router = APIRouter()
 
 
-@router.get("/stats", response_model=DashboardStats)
+@router.get("/stats", response_model=DashboardStats, dependencies=[Depends(check_not_modified)])
 async def get_dashboard_stats(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """대시보드 통계"""
-    stats = await StatsService.get_dashboard_stats(db, current_user.id)
+    stats = await StatsService.get_dashboard_stats(db, user_id)
     return DashboardStats(**stats)
 
 
 @router.get("/recent", response_model=RecentPrayersResponse)
 async def get_recent_prayers(
     limit: int = Query(5, ge=1, le=20),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    fields: Optional[str] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    cache_headers: Dict[str, str] = Depends(check_not_modified),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """최근 기도 목록"""
-    prayers = await StatsService.get_recent_prayers(db, current_user.id, limit)
+    """최근 기도 목록 (fields로 항목 필드 선택)"""
+    try:
+        selected = parse_fields(fields, PrayerWithProgress)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
-    # 각 기도에 progress_count와 prayer_days 추가
-    prayers_with_progress = []
-    for prayer in prayers:
-        progress_count = await ProgressService.get_progress_count(db, prayer.id)
-        prayer_days = PrayerService.calculate_prayer_days(prayer)
-
-        prayer_dict = PrayerResponse.model_validate(prayer).model_dump()
-        prayer_dict["progress_count"] = progress_count
-        prayer_dict["prayer_days"] = prayer_days
-
-        prayers_with_progress.append(PrayerWithProgress(**prayer_dict))
+    prayers_with_progress = await StatsService.get_recent_prayers(
+        db, user_id, limit, selected
+    )
 
-    return RecentPrayersResponse(
+    response = dict(
         items=prayers_with_progress,
         total=len(prayers_with_progress)
     )
+    if selected is not None:
+        return JSONResponse(jsonable_encoder(response), headers=cache_headers)
+
+    return RecentPrayersResponse(**response)
 
 
-@router.get("/subject-stats")
+@router.get("/subject-stats", response_model=List[SubjectStats], dependencies=[Depends(check_not_modified)])
 async def get_subject_stats(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """주제별 통계"""
-    stats = await StatsService.get_dashboard_stats(db, current_user.id)
-    return stats.get("by_subject", [])
+    return await StatsService.get_subject_stats(db, user_id)
 
 
-@router.get("/answered-without-content")
+@router.get("/answered-without-content", dependencies=[Depends(check_not_modified)])
 async def get_answered_without_content(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """응답 받았지만 내용 미작성 기도 목록"""
-    prayers = await StatsService.get_answered_without_content(db, current_user.id)
+    prayers = await StatsService.get_answered_without_content(db, user_id)
     return [PrayerResponse.model_validate(prayer) for prayer in prayers]
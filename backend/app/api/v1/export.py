@@ -0,0 +1,40 @@
+from typing import Literal
+from uuid import UUID
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.api.deps import get_current_user_id, get_read_session_factory
+from app.services.export_service import ExportService
+
+
+router = APIRouter()
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+@router.get("/")
+async def export_prayers(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    user_id: UUID = Depends(get_current_user_id),
+    session_factory: async_sessionmaker = Depends(get_read_session_factory)
+):
+    """기도 및 응답 과정 전체 내보내기 (NDJSON 또는 CSV 스트리밍)
+    
+    서버 측 커서로 청크 단위 조회하여 계정 크기와 무관하게 메모리 사용량이 일정합니다.
+    """
+    async def stream():
+        # 요청 의존성의 세션은 응답 전송 전에 닫히므로 별도 세션 사용
+        async with session_factory() as session:
+            rows = ExportService.csv if format == "csv" else ExportService.ndjson
+            async for chunk in rows(session, user_id):
+                yield chunk
+    
+    return StreamingResponse(
+        stream(),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="prayer-note-export.{format}"'}
+    )
@@ -0,0 +1,30 @@
+from typing import Literal
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_db, get_current_user
+from app.models.user import User
+from app.schemas.imports import ImportResponse
+from app.services.import_service import ImportService
+
+
+router = APIRouter()
+
+
+@router.post("/", response_model=ImportResponse)
+async def import_prayers(
+    file: UploadFile = File(...),
+    format: Literal["ndjson", "csv"] = "ndjson",
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """CSV/NDJSON 파일에서 기도 및 응답 과정 대량 가져오기
+    
+    내보내기와 같은 형식을 받습니다. 유효한 행만 가져오고 실패한 행은 errors로 보고합니다.
+    """
+    try:
+        return await ImportService.import_file(db, current_user.id, file.file, format)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
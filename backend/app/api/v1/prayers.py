@@ -1,8 +1,16 @@
-from typing import Optional
+from typing import Dict, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.api.deps import get_db, get_current_user
+from app.api.deps import (
+    get_db,
+    get_read_db,
+    get_current_user,
+    get_current_user_id,
+    check_not_modified
+)
 from app.models.user import User
 from app.models.prayer import PrayerStatus
 from app.schemas.prayer import (
@@ -11,10 +19,13 @@ from app.schemas.prayer import (
     PrayerAnswer,
     PrayerResponse,
     PrayerWithProgress,
-    PrayerListResponse
+    PrayerDetail,
+    PrayerListResponse,
+    PrayerBulkRequest,
+    PrayerBulkResponse
 )
-from app.services.prayer_service import PrayerService
-from app.services.progress_service import ProgressService
+from app.services.prayer_service import PrayerService, DEFAULT_PRAYER_SORT
+from app.utils.fields import parse_fields
 import math
 
 
@@ -32,6 +43,26 @@ async def create_prayer(
     return PrayerResponse.model_validate(prayer)
 
 
+@router.post("/bulk", response_model=PrayerBulkResponse)
+async def bulk_prayers(
+    bulk_data: PrayerBulkRequest,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """기도 일괄 생성/수정/응답/삭제 (최대 1000건, 단일 트랜잭션)
+    
+    항목별 결과의 status는 단건 API의 상태 코드와 같습니다 (201/200/204/404/409).
+    """
+    results = await PrayerService.bulk_apply(db, current_user.id, bulk_data.operations)
+    failed = sum(1 for result in results if result.error)
+    
+    return PrayerBulkResponse(
+        results=results,
+        succeeded=len(results) - failed,
+        failed=failed
+    )
+
+
 @router.get("/", response_model=PrayerListResponse)
 async def get_prayers(
     status_filter: Optional[PrayerStatus] = Query(None, alias="status"),
@@ -39,50 +70,76 @@ async def get_prayers(
     search: Optional[str] = None,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    sort_by: str = DEFAULT_PRAYER_SORT,
+    fields: Optional[str] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    cache_headers: Dict[str, str] = Depends(check_not_modified),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """기도 목록 조회"""
-    prayers, total = await PrayerService.get_prayers(
-        db=db,
-        user_id=current_user.id,
-        status=status_filter,
-        subject=subject,
-        search=search,
-        page=page,
-        limit=limit
-    )
+    """기도 목록 조회
     
-    # 각 기도에 progress_count와 prayer_days 추가
-    prayers_with_progress = []
-    for prayer in prayers:
-        progress_count = await ProgressService.get_progress_count(db, prayer.id)
-        prayer_days = PrayerService.calculate_prayer_days(prayer)
-        
-        prayer_dict = PrayerResponse.model_validate(prayer).model_dump()
-        prayer_dict["progress_count"] = progress_count
-        prayer_dict["prayer_days"] = prayer_days
-        
-        prayers_with_progress.append(PrayerWithProgress(**prayer_dict))
-    
-    pages = math.ceil(total / limit)
-    
-    return PrayerListResponse(
+    cursor를 전달하면 이전 응답의 next_cursor 이후 항목을 조회합니다.
+    include_total=false이면 total/pages 계산을 생략합니다.
+    sort_by: created_at, start_date, answer_date, duration, title 각각 _desc/_asc
+    fields: 쉼표로 구분한 항목 필드 (예: title,subject,status) - 해당 컬럼만 조회/응답
+    """
+    try:
+        selected = parse_fields(fields, PrayerWithProgress)
+        prayers_with_progress, total, next_cursor = await PrayerService.get_prayers(
+            db=db,
+            user_id=user_id,
+            status=status_filter,
+            subject=subject,
+            search=search,
+            page=page,
+            limit=limit,
+            cursor=cursor,
+            include_total=include_total,
+            sort_by=sort_by,
+            fields=selected
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    pages = math.ceil(total / limit) if total is not None else None
+    
+    response = dict(
         items=prayers_with_progress,
         total=total,
-        page=page,
-        pages=pages
+        page=None if cursor else page,
+        pages=pages,
+        next_cursor=next_cursor
     )
+    if selected is not None:
+        # 선택한 필드만 직렬화 (전체 필드 기준의 response_model 검증 생략)
+        return JSONResponse(jsonable_encoder(response), headers=cache_headers)
+    
+    return PrayerListResponse(**response)
 
 
 @router.get("/{prayer_id}", response_model=PrayerResponse)
 async def get_prayer(
     prayer_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    fields: Optional[str] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    cache_headers: Dict[str, str] = Depends(check_not_modified),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """특정 기도 상세 조회"""
-    prayer = await PrayerService.get_prayer_by_id(db, prayer_id, current_user.id)
+    """특정 기도 상세 조회 (fields로 응답 필드 선택)"""
+    try:
+        selected = parse_fields(fields, PrayerResponse)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    prayer = await PrayerService.get_prayer_by_id(db, prayer_id, user_id, selected)
     
     if not prayer:
         raise HTTPException(
@@ -90,9 +147,38 @@ async def get_prayer(
             detail="Prayer not found"
         )
     
+    if selected is not None:
+        return JSONResponse(
+            jsonable_encoder(PrayerService.to_fields(prayer, PrayerResponse, selected)),
+            headers=cache_headers
+        )
+    
     return PrayerResponse.model_validate(prayer)
 
 
+@router.get(
+    "/{prayer_id}/detail",
+    response_model=PrayerDetail,
+    dependencies=[Depends(check_not_modified)]
+)
+async def get_prayer_detail(
+    prayer_id: UUID,
+    progress_limit: Optional[int] = Query(None, ge=1, le=1000),
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """응답 과정을 포함한 기도 상세 조회 (progress_limit으로 최근 기록 개수 제한)"""
+    prayer = await PrayerService.get_prayer_detail(db, prayer_id, user_id, progress_limit)
+    
+    if not prayer:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Prayer not found"
+        )
+    
+    return prayer
+
+
 @router.patch("/{prayer_id}", response_model=PrayerResponse)
 async def update_prayer(
     prayer_id: UUID,
@@ -1,38 +1,95 @@
+from typing import Dict, Literal, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.api.deps import get_db, get_current_user
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.api.deps import (
+    get_db,
+    get_read_db,
+    get_current_user,
+    get_current_user_id,
+    get_read_session_factory,
+    check_not_modified
+)
 from app.models.user import User
 from app.schemas.prayer_progress import (
     ProgressCreate,
     ProgressUpdate,
     ProgressResponse,
-    ProgressListResponse
+    ProgressListResponse,
+    ProgressFeedResponse,
+    ProgressBatchCreate,
+    ProgressBatchResponse
 )
 from app.services.progress_service import ProgressService
 
 
 router = APIRouter()
 
+# 기도와 무관한 응답 과정 조회 (/progress)
+feed_router = APIRouter()
+
 
 @router.get("/{prayer_id}/progress", response_model=ProgressListResponse)
 async def get_progress_list(
     prayer_id: UUID,
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db)
+    limit: Optional[int] = Query(None, ge=1, le=100),
+    cursor: Optional[str] = None,
+    format: Literal["json", "ndjson"] = "json",
+    user_id: UUID = Depends(get_current_user_id),
+    cache_headers: Dict[str, str] = Depends(check_not_modified),
+    db: AsyncSession = Depends(get_read_db),
+    session_factory: async_sessionmaker = Depends(get_read_session_factory)
 ):
-    """특정 기도의 응답 과정 목록"""
-    progress_list = await ProgressService.get_progress_list(db, prayer_id, current_user.id)
+    """특정 기도의 응답 과정 목록 (최근 기록순)
+    
+    limit과 next_cursor로 페이지 단위 조회하고, format=ndjson이면 커서 이후 전체를 한 줄씩 스트리밍합니다.
+    """
+    if format == "ndjson":
+        total = await ProgressService.get_owned_progress_count(db, prayer_id, user_id)
+        if total is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Prayer not found"
+            )
+        
+        try:
+            query = ProgressService.timeline_query(prayer_id, cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        if limit is not None:
+            query = query.limit(limit)
+        
+        async def stream():
+            # 요청 의존성의 세션은 응답 전송 전에 닫히므로 별도 세션 사용
+            async with session_factory() as session:
+                async for chunk in ProgressService.stream_progress(session, query):
+                    yield chunk
+        
+        return StreamingResponse(stream(), media_type="application/x-ndjson", headers=cache_headers)
+    
+    try:
+        page = await ProgressService.get_progress_list(db, prayer_id, user_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
-    if progress_list is None:
+    if page is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Prayer not found"
         )
     
+    progress_list, total, next_cursor = page
     return ProgressListResponse(
         items=[ProgressResponse.model_validate(p) for p in progress_list],
-        total=len(progress_list)
+        total=total,
+        next_cursor=next_cursor
     )
 
 
@@ -55,6 +112,52 @@ async def create_progress(
     return ProgressResponse.model_validate(progress)
 
 
+@router.post("/progress/batch", response_model=ProgressBatchResponse)
+async def create_progress_batch(
+    batch_data: ProgressBatchCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """여러 기도에 응답 과정 일괄 추가 (최대 1000건, 단일 트랜잭션)
+    
+    항목별 결과의 status는 단건 API와 같습니다 (201/404).
+    """
+    results = await ProgressService.create_progress_batch(db, current_user.id, batch_data.items)
+    failed = sum(1 for result in results if result.error)
+    
+    return ProgressBatchResponse(
+        results=results,
+        succeeded=len(results) - failed,
+        failed=failed
+    )
+
+
+@feed_router.get(
+    "/feed",
+    response_model=ProgressFeedResponse,
+    dependencies=[Depends(check_not_modified)]
+)
+async def get_progress_feed(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """모든 기도에 걸친 응답 과정 피드 (최근 기록순, next_cursor로 다음 페이지)"""
+    try:
+        items, next_cursor = await ProgressService.get_progress_feed(db, user_id, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return ProgressFeedResponse(
+        items=[ProgressResponse.model_validate(p) for p in items],
+        next_cursor=next_cursor
+    )
+
+
 @router.patch("/progress/{progress_id}", response_model=ProgressResponse)
 async def update_progress(
     progress_id: UUID,
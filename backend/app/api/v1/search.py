@@ -0,0 +1,22 @@
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.deps import get_read_db, get_current_user_id, check_not_modified
+from app.schemas.search import SearchResponse
+from app.services.search_service import SearchService
+
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResponse, dependencies=[Depends(check_not_modified)])
+async def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """기도 및 응답 과정 통합 검색"""
+    hits = await SearchService.search(db, user_id, q, limit)
+
+    return SearchResponse(items=hits, total=len(hits))
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Literal, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,12 +14,58 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     
+    # Connection pool (워커 프로세스별, 최대 연결 수 = DB_POOL_SIZE + DB_MAX_OVERFLOW)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # 풀에서 연결을 기다리는 최대 시간(초), 초과 시 오류
+    DB_POOL_TIMEOUT: float = 30
+    # 이 시간(초)보다 오래된 연결은 다시 연결 (-1이면 사용 안 함)
+    DB_POOL_RECYCLE: int = 1800
+    # 연결을 꺼낼 때 살아 있는지 확인 (페일오버 후 끊긴 연결 제거)
+    DB_POOL_PRE_PING: bool = True
+    # 새 연결 타임아웃(초), 쿼리 타임아웃(초, 없으면 제한 없음)
+    DB_CONNECT_TIMEOUT: float = 10
+    DB_COMMAND_TIMEOUT: Optional[float] = None
+    # 연결별 asyncpg 준비된 문장(prepared statement) 캐시 크기 (0이면 사용 안 함, pgbouncer 트랜잭션 모드 등)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    # 엔진별 SQL 컴파일 캐시 크기 (문장 구조별 한 항목)
+    DB_QUERY_CACHE_SIZE: int = 500
+    
+    # Read replica (없으면 모든 조회를 기본 DB로)
+    DATABASE_READ_URL: Optional[str] = None
+    # 쓰기 후 이 시간(초) 동안 해당 사용자의 조회는 기본 DB로 (복제 지연 대비)
+    READ_STICKY_SECONDS: float = 5
+    # 복제본 상태 확인 주기와 타임아웃(초), 실패하면 다음 확인까지 기본 DB로
+    READ_REPLICA_HEALTH_INTERVAL: float = 10
+    READ_REPLICA_HEALTH_TIMEOUT: float = 1
+    
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # Password hashing (bcrypt 스레드 풀 크기와 추가 대기 가능한 작업 수)
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_QUEUE_SIZE: int = 16
+    
+    # 인증 사용자 캐시 (get_current_user, 0이면 사용 안 함)
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    
+    # 검증된 JWT payload 캐시 (decode_token, 토큰 exp를 넘지 않음, 0이면 사용 안 함)
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    
+    # 로그인 시도 제한 (토큰 버킷, burst 0이면 사용 안 함)
+    # memory: 워커 프로세스별 / postgres: rate_limit_buckets 테이블을 모든 워커가 공유
+    LOGIN_RATE_LIMIT_STORE: Literal["memory", "postgres"] = "memory"
+    LOGIN_RATE_LIMIT_IP_BURST: int = 20
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 10
+    LOGIN_RATE_LIMIT_EMAIL_BURST: int = 5
+    LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE: float = 2
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = 100000
+    
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = []
     
@@ -1,15 +1,95 @@
+import time
 from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import DDL, event, exc
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.core import metrics
 from app.core.config import settings
 
-# 비동기 엔진 생성
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
+
+DB_POOL_CHECKOUT = metrics.histogram(
+    "db_pool_checkout_seconds",
+    "Time to obtain a pooled connection (waiting, new connections and pre-ping included)",
+    ["engine"]
+)
+DB_POOL_TIMEOUTS = metrics.counter(
+    "db_pool_timeouts_total",
+    "Connection checkouts that gave up after DB_POOL_TIMEOUT",
+    ["engine"]
+)
+DB_POOL_SIZE = metrics.gauge("db_pool_size", "Configured pool size", ["engine"])
+DB_POOL_CHECKED_OUT = metrics.gauge("db_pool_checked_out", "Connections currently in use", ["engine"])
+DB_POOL_CHECKED_IN = metrics.gauge("db_pool_checked_in", "Idle connections in the pool", ["engine"])
+DB_POOL_OVERFLOW = metrics.gauge(
+    "db_pool_overflow",
+    "Connections open beyond pool_size (negative while the pool is not yet full)",
+    ["engine"]
 )
 
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """연결을 얻는 데 걸린 시간과 타임아웃을 지표로 기록하는 연결 풀"""
+
+    metrics_name = "primary"
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc(engine=self.metrics_name)
+            raise
+        finally:
+            DB_POOL_CHECKOUT.observe(time.perf_counter() - started, engine=self.metrics_name)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+
+def create_engine(url: str, name: str) -> AsyncEngine:
+    """설정(DB_POOL_*, DB_*_TIMEOUT, DB_*_CACHE_SIZE)에 따른 비동기 엔진 생성 및 풀 지표 등록
+
+    name은 지표의 engine 라벨입니다. 풀 상태 게이지는 /metrics 수집 시점의 값을 읽습니다.
+    """
+    connect_args = {
+        "timeout": settings.DB_CONNECT_TIMEOUT,
+        "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE
+    }
+    if settings.DB_COMMAND_TIMEOUT is not None:
+        connect_args["command_timeout"] = settings.DB_COMMAND_TIMEOUT
+
+    async_engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        connect_args=connect_args
+    )
+    async_engine.pool.metrics_name = name
+
+    # engine.pool은 dispose() 후 새 풀로 바뀌므로 매번 현재 풀을 읽음
+    DB_POOL_SIZE.set_function(lambda: async_engine.pool.size(), engine=name)
+    DB_POOL_CHECKED_OUT.set_function(lambda: async_engine.pool.checkedout(), engine=name)
+    DB_POOL_CHECKED_IN.set_function(lambda: async_engine.pool.checkedin(), engine=name)
+    DB_POOL_OVERFLOW.set_function(lambda: async_engine.pool.overflow(), engine=name)
+    return async_engine
+
+
+# 비동기 엔진 생성
+engine = create_engine(settings.DATABASE_URL, "primary")
+
+# 읽기 전용 복제본 엔진 (DATABASE_READ_URL이 없으면 None, app.core.replica에서 라우팅)
+read_engine = create_engine(settings.DATABASE_READ_URL, "replica") if settings.DATABASE_READ_URL else None
+
 # 비동기 세션 팩토리
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -22,6 +102,35 @@ AsyncSessionLocal = async_sessionmaker(
 # Base 클래스 생성
 Base = declarative_base()
 
+# 한글 부분 문자열 검색 인덱스(gin_trgm_ops)에 필요한 확장
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+)
+
+# 제목 정렬용 한국어 콜레이션 (ICU 미지원 빌드에서는 코드포인트 순서인 "C"로 대체,
+# 한글 음절은 코드포인트 순서가 가나다순과 같음)
+KOREAN_COLLATION = "ko_kr"
+CREATE_KOREAN_COLLATION = f"""
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_collation WHERE collname = '{KOREAN_COLLATION}') THEN
+        BEGIN
+            CREATE COLLATION {KOREAN_COLLATION} (provider = icu, locale = 'ko-KR');
+        EXCEPTION WHEN feature_not_supported THEN
+            CREATE COLLATION {KOREAN_COLLATION} FROM "C";
+        END;
+    END IF;
+END
+$$
+"""
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL(CREATE_KOREAN_COLLATION)
+)
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     데이터베이스 세션 의존성
@@ -44,7 +153,7 @@ async def init_db():
     """데이터베이스 초기화 (테이블 생성)"""
     # 모든 모델을 임포트하여 Base.metadata에 등록
     # 순환 참조 방지를 위해 함수 내부에서 import
-    from app.models import User, Prayer, PrayerProgress  # noqa: F401
+    from app.models import User, Prayer, PrayerProgress, UserPrayerStats, RateLimitBucket  # noqa: F401
 
     async with engine.begin() as conn:
         # 변경된 메타데이터를 DB에 반영
@@ -52,4 +161,6 @@ async def init_db():
 
 async def close_db():
     """데이터베이스 연결 종료"""
-    await engine.dispose()
\ No newline at end of file
+    await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
\ No newline at end of file
@@ -0,0 +1,142 @@
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Optional, Tuple
+from sqlalchemy import delete, func, literal
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.rate_limit_bucket import RateLimitBucket
+
+
+LOGIN_RATE_LIMITED = metrics.counter(
+    "login_rate_limited_total",
+    "Login attempts rejected by the rate limiter before password verification",
+    ["key_type"]
+)
+
+# 마지막 시도 후 이 시간이 지난 버킷은 가득 찬 것과 같으므로 삭제 가능
+RATE_LIMIT_IDLE_SECONDS = 3600
+
+
+def _refill(tokens: float, elapsed: float, capacity: float, rate: float) -> float:
+    """토큰 버킷 갱신: 경과 시간만큼 채우고(capacity 이하) 한 개 소비, -1 아래로는 내려가지 않음
+
+    결과가 0 이상이면 허용입니다. 거절된 시도도 채워진 만큼을 소비하므로
+    간격 없이 계속 시도하면 계속 거절됩니다.
+    """
+    return max(-1.0, min(capacity, tokens + elapsed * rate) - 1)
+
+
+class MemoryRateLimitStore:
+    """프로세스 메모리 토큰 버킷 저장소 (워커별로 따로 계산, 이벤트 루프 스레드에서 사용)
+
+    키가 max_keys를 넘으면 가장 오래 시도가 없던 키부터 제거합니다 (제거된 키는 가득 찬 버킷).
+    """
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        # 키 -> (남은 토큰, 마지막 시도 시각(monotonic))
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    async def take(self, key: str, capacity: float, rate: float) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (capacity, now))
+        tokens = _refill(tokens, now - updated, capacity, rate)
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return tokens
+
+
+class PostgresRateLimitStore:
+    """rate_limit_buckets 테이블 토큰 버킷 저장소 (여러 워커/서버가 공유)
+
+    시도마다 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 갱신하므로 동시 시도도 행 잠금으로 순서가 정해집니다.
+    요청 트랜잭션과 무관하게 별도 세션에서 바로 커밋합니다.
+    """
+
+    # 이 횟수마다 오래된 버킷 정리
+    PURGE_EVERY = 1000
+
+    def __init__(self, session_factory: async_sessionmaker):
+        self.session_factory = session_factory
+        self._takes = 0
+
+    async def take(self, key: str, capacity: float, rate: float) -> float:
+        now = func.now()
+        elapsed = func.extract("epoch", now - RateLimitBucket.updated_at)
+        refilled = func.least(literal(capacity), RateLimitBucket.tokens + elapsed * literal(rate)) - 1
+        statement = (
+            insert(RateLimitBucket)
+            .values(key=key, tokens=capacity - 1, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[RateLimitBucket.key],
+                set_={"tokens": func.greatest(-1.0, refilled), "updated_at": now}
+            )
+            .returning(RateLimitBucket.tokens)
+        )
+
+        self._takes += 1
+        async with self.session_factory() as session:
+            tokens = (await session.execute(statement)).scalar_one()
+            if self._takes % self.PURGE_EVERY == 0:
+                await session.execute(
+                    delete(RateLimitBucket).where(
+                        RateLimitBucket.updated_at < now - timedelta(seconds=RATE_LIMIT_IDLE_SECONDS)
+                    )
+                )
+            await session.commit()
+        return tokens
+
+
+class LoginRateLimiter:
+    """로그인 시도 제한 (클라이언트 IP와 이메일별 토큰 버킷)
+
+    burst는 버킷 크기, per_minute는 분당 채워지는 시도 수이며 burst가 0이면 해당 키는 제한하지 않습니다.
+    IP 버킷에서 거절되면 이메일 버킷은 소비하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        store,
+        ip_limit: Tuple[float, float],
+        email_limit: Tuple[float, float]
+    ):
+        self.store = store
+        self.limits = (("ip", ip_limit), ("email", email_limit))
+
+    async def check(self, ip: str, email: str) -> Optional[float]:
+        """허용이면 None, 거절이면 다시 시도할 수 있을 때까지의 초"""
+        keys = {"ip": ip, "email": email.strip().lower()}
+        for key_type, (burst, per_minute) in self.limits:
+            if burst <= 0:
+                continue
+
+            rate = per_minute / 60
+            tokens = await self.store.take(f"login:{key_type}:{keys[key_type]}", burst, rate)
+            if tokens < 0:
+                LOGIN_RATE_LIMITED.inc(key_type=key_type)
+                return (1 - tokens) / rate if rate > 0 else float(RATE_LIMIT_IDLE_SECONDS)
+        return None
+
+
+def create_login_rate_limiter() -> LoginRateLimiter:
+    """설정(LOGIN_RATE_LIMIT_*)에 따른 로그인 제한기"""
+    if settings.LOGIN_RATE_LIMIT_STORE == "postgres":
+        store = PostgresRateLimitStore(AsyncSessionLocal)
+    else:
+        store = MemoryRateLimitStore(settings.LOGIN_RATE_LIMIT_MAX_KEYS)
+
+    return LoginRateLimiter(
+        store,
+        ip_limit=(settings.LOGIN_RATE_LIMIT_IP_BURST, settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE),
+        email_limit=(settings.LOGIN_RATE_LIMIT_EMAIL_BURST, settings.LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE)
+    )
+
+
+login_rate_limiter = create_login_rate_limiter()
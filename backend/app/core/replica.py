@@ -0,0 +1,138 @@
+import asyncio
+import time
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from app.core import metrics
+from app.core.config import settings
+from app.core.database import engine, read_engine
+from app.utils.cache import TTLCache
+
+
+READ_ROUTES = metrics.counter(
+    "db_read_routes_total",
+    "Read-only sessions by target database and routing reason",
+    ["target", "reason"]
+)
+REPLICA_HEALTHY = metrics.gauge(
+    "db_replica_healthy",
+    "1 if the last replica health check succeeded"
+)
+
+# 세션 info에 이번 트랜잭션에서 데이터를 쓴 사용자 ID를 모으는 키
+WRITTEN_USERS_KEY = "written_user_ids"
+
+# 쓰기 직후 기본 DB 고정을 기억하는 최대 사용자 수
+MAX_STICKY_USERS = 100000
+
+
+def _read_only_sessionmaker(async_engine: AsyncEngine) -> async_sessionmaker:
+    """READ ONLY 트랜잭션으로 시작하는 세션 팩토리 (엔진의 연결 풀 공유)"""
+    return async_sessionmaker(
+        async_engine.execution_options(postgresql_readonly=True),
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+
+
+class ReadRouter:
+    """조회 세션을 복제본 또는 기본 DB로 보내는 라우터
+
+    - 복제본이 없으면 항상 기본 DB
+    - 사용자가 쓴 뒤 sticky_seconds 동안은 그 사용자의 조회를 기본 DB로 (자기 쓰기 읽기 보장)
+    - 복제본 상태 확인(SELECT 1)이 실패하면 다음 확인까지 기본 DB로
+
+    쓰기 기록은 워커 프로세스별이므로 여러 워커에서는 같은 사용자를 같은 워커로 보내거나
+    sticky_seconds를 복제 지연보다 넉넉하게 잡아야 합니다.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replica: Optional[async_sessionmaker] = None,
+        replica_engine: Optional[AsyncEngine] = None,
+        sticky_seconds: float = 5,
+        health_interval: float = 10,
+        health_timeout: float = 1
+    ):
+        self.primary = primary
+        self.replica = replica
+        self.replica_engine = replica_engine
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self._recent_writes: TTLCache[bool] = TTLCache(
+            "read_sticky", maxsize=MAX_STICKY_USERS, ttl=sticky_seconds
+        )
+        self._healthy = True
+        self._checked_at = float("-inf")
+        self._checking = False
+
+    def record_write(self, user_id: UUID) -> None:
+        """사용자의 쓰기 커밋 기록 (이후 sticky_seconds 동안 기본 DB에서 조회)"""
+        self._recent_writes.set(user_id, True)
+
+    async def replica_healthy(self) -> bool:
+        """복제본 상태 (health_interval마다 한 번만 실제로 확인, 확인 중에는 직전 결과)"""
+        now = time.monotonic()
+        if self._checking or now - self._checked_at < self.health_interval:
+            return self._healthy
+
+        self._checking = True
+        try:
+            async with asyncio.timeout(self.health_timeout):
+                async with self.replica_engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            healthy = True
+        except Exception:
+            healthy = False
+        finally:
+            self._checking = False
+
+        self._healthy = healthy
+        self._checked_at = time.monotonic()
+        REPLICA_HEALTHY.set(1 if healthy else 0)
+        return healthy
+
+    async def session_factory(self, user_id: Optional[UUID]) -> async_sessionmaker:
+        """이 사용자의 조회에 쓸 읽기 전용 세션 팩토리"""
+        if self.replica is None:
+            return self.primary
+
+        if user_id is not None and self._recent_writes.get(user_id):
+            READ_ROUTES.inc(target="primary", reason="sticky")
+            return self.primary
+
+        if not await self.replica_healthy():
+            READ_ROUTES.inc(target="primary", reason="replica_unhealthy")
+            return self.primary
+
+        READ_ROUTES.inc(target="replica", reason="replica")
+        return self.replica
+
+
+read_router = ReadRouter(
+    primary=_read_only_sessionmaker(engine),
+    replica=_read_only_sessionmaker(read_engine) if read_engine is not None else None,
+    replica_engine=read_engine,
+    sticky_seconds=settings.READ_STICKY_SECONDS,
+    health_interval=settings.READ_REPLICA_HEALTH_INTERVAL,
+    health_timeout=settings.READ_REPLICA_HEALTH_TIMEOUT
+)
+
+
+def record_user_write(db: AsyncSession, user_id: UUID) -> None:
+    """이번 트랜잭션에서 사용자 데이터를 썼음을 표시 (커밋되면 read_router에 기록)"""
+    db.info.setdefault(WRITTEN_USERS_KEY, set()).add(user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _record_committed_writes(session: Session) -> None:
+    for user_id in session.info.pop(WRITTEN_USERS_KEY, ()):
+        read_router.record_write(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_writes(session: Session) -> None:
+    session.info.pop(WRITTEN_USERS_KEY, None)
@@ -1,8 +1,37 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Callable, Optional, TypeVar, Union
 from jose import JWTError, jwt
 import bcrypt
 from app.core.config import settings
+from app.core import metrics
+from app.utils.cache import TTLCache
+
+
+T = TypeVar("T")
+
+PASSWORD_HASH_QUEUE_WAIT = metrics.histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a password hash job waited for a worker thread",
+    ["operation"]
+)
+PASSWORD_HASH_DURATION = metrics.histogram(
+    "password_hash_duration_seconds",
+    "Time spent computing bcrypt hashes on the worker pool",
+    ["operation"]
+)
+PASSWORD_HASH_REJECTED = metrics.counter(
+    "password_hash_rejected_total",
+    "Password hash jobs rejected because the queue was full",
+    ["operation"]
+)
+PASSWORD_HASH_PENDING = metrics.gauge(
+    "password_hash_pending",
+    "Password hash jobs running or waiting on the worker pool"
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -20,6 +49,88 @@ def get_password_hash(password: str) -> str:
     return hashed.decode('utf-8')
 
 
+class PasswordHasherBusy(Exception):
+    """비밀번호 해싱 대기열이 가득 참"""
+
+
+class PasswordHasher:
+    """bcrypt 전용 스레드 풀 (이벤트 루프 차단 방지)
+
+    bcrypt는 해싱 중 GIL을 해제하므로 스레드로 충분히 병렬 처리됩니다.
+    실행 중이거나 대기 중인 작업이 workers + max_queue개를 넘으면
+    기다리지 않고 바로 PasswordHasherBusy를 발생시킵니다.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.pending = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers,
+                thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def run(self, operation: str, function: Callable[..., T], *args) -> T:
+        """풀에서 function 실행 (대기 시간과 해싱 시간을 지표로 기록)"""
+        # pending은 이벤트 루프 스레드에서만 변경
+        if self.pending >= self.capacity:
+            PASSWORD_HASH_REJECTED.inc(operation=operation)
+            raise PasswordHasherBusy()
+
+        submitted = time.perf_counter()
+        timings = {}
+
+        def timed():
+            started = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                timings["wait"] = started - submitted
+                timings["duration"] = time.perf_counter() - started
+
+        self.pending += 1
+        PASSWORD_HASH_PENDING.inc()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), timed)
+        finally:
+            self.pending -= 1
+            PASSWORD_HASH_PENDING.dec()
+            if timings:
+                PASSWORD_HASH_QUEUE_WAIT.observe(timings["wait"], operation=operation)
+                PASSWORD_HASH_DURATION.observe(timings["duration"], operation=operation)
+
+    def shutdown(self) -> None:
+        """풀 종료 (애플리케이션 종료 시)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_QUEUE_SIZE
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (해싱 풀에서 실행, 대기열이 가득 차면 PasswordHasherBusy)"""
+    return await password_hasher.run("verify", verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (해싱 풀에서 실행, 대기열이 가득 차면 PasswordHasherBusy)"""
+    return await password_hasher.run("hash", get_password_hash, password)
+
+
 def create_access_token(
     subject: Union[str, int],
     expires_delta: Optional[timedelta] = None
@@ -62,14 +173,35 @@ def create_refresh_token(
     return encoded_jwt
 
 
+# 서명 검증을 마친 토큰 payload 캐시 (토큰 SHA-256 -> payload, exp까지만 유효)
+token_cache: TTLCache[dict] = TTLCache(
+    "jwt",
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS
+)
+
+
 def decode_token(token: str) -> Optional[dict]:
-    """토큰 디코드"""
+    """토큰 디코드 (검증된 payload는 exp 전까지 캐시)
+    
+    같은 토큰으로 동시에 여러 요청을 보낼 때 매번 서명을 검증하지 않도록
+    토큰 해시를 키로 payload를 보관합니다. 검증에 실패한 토큰은 캐시하지 않습니다.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return dict(payload)
+
     try:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        return payload
     except JWTError:
         return None
+
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        token_cache.set(key, dict(payload), ttl=exp - time.time())
+    return payload
@@ -1,18 +1,23 @@
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from app.core.database import init_db, close_db
+from app.core.database import close_db
+from app.core.metrics import registry, PROMETHEUS_CONTENT_TYPE
+from app.core.security import password_hasher
 from app.api.v1 import api_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """애플리케이션 생명주기 관리"""
-    # 시작 시
-    await init_db()
+    """애플리케이션 생명주기 관리
+
+    스키마는 Alembic 마이그레이션(alembic upgrade head)으로만 관리하므로 시작 시 테이블을 만들지 않습니다.
+    """
     yield
     # 종료 시
+    password_hasher.shutdown()
     await close_db()
 
 
@@ -55,3 +60,9 @@ async def root():
 async def health_check():
     """헬스 체크"""
     return {"status": "ok"}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 형식 지표"""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,5 +1,7 @@
 from app.models.user import User
 from app.models.prayer import Prayer, PrayerStatus
 from app.models.prayer_progress import PrayerProgress
+from app.models.user_prayer_stats import UserPrayerStats
+from app.models.rate_limit_bucket import RateLimitBucket
 
-__all__ = ["User", "Prayer", "PrayerStatus", "PrayerProgress"]
+__all__ = ["User", "Prayer", "PrayerStatus", "PrayerProgress", "UserPrayerStats", "RateLimitBucket"]
@@ -1,10 +1,10 @@
 import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, Integer, Date, DateTime, ForeignKey, Computed, Index, text, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 import enum
-from app.core.database import Base
+from app.core.database import Base, KOREAN_COLLATION
 
 
 class PrayerStatus(str, enum.Enum):
@@ -16,12 +16,39 @@ class PrayerStatus(str, enum.Enum):
 class Prayer(Base):
     """기도 모델"""
     __tablename__ = "prayers"
+    __table_args__ = (
+        # 목록 조회: WHERE user_id = ? ORDER BY created_at DESC, id DESC
+        Index("ix_prayers_user_created", "user_id", text("created_at DESC"), text("id DESC")),
+        # 정렬 기준별 목록 조회 (역방향 스캔으로 오름차순도 처리)
+        Index("ix_prayers_user_start_date", "user_id", text("start_date DESC"), text("id DESC")),
+        Index(
+            "ix_prayers_user_answer_date",
+            "user_id",
+            text("coalesce(answer_date, '0001-01-01'::date) DESC"),
+            text("id DESC")
+        ),
+        Index("ix_prayers_user_title", "user_id", text(f"title COLLATE {KOREAN_COLLATION}"), "id"),
+        # 상태/주제 필터
+        Index("ix_prayers_user_status", "user_id", "status"),
+        Index("ix_prayers_user_subject", "user_id", "subject"),
+        # 응답 받았지만 내용 미작성 기도 (StatsService.get_answered_without_content)
+        Index(
+            "ix_prayers_answered_without_content",
+            "user_id",
+            text("answer_date DESC"),
+            postgresql_where=text("status = 'ANSWERED' AND answer_content IS NULL")
+        ),
+        # 전문 검색 및 한글 부분 문자열 검색 (pg_trgm)
+        Index("ix_prayers_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_prayers_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_prayers_content_trgm", "content", postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"}),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # 기본 정보
-    subject = Column(String(100), nullable=False, index=True)
+    subject = Column(String(100), nullable=False)
     title = Column(String(200), nullable=False)
     content = Column(Text, nullable=False)
     prayer_type = Column(String(50), nullable=False)
@@ -31,18 +58,39 @@ class Prayer(Base):
     category_tags = Column(JSONB, default=list, nullable=False)
     
     # 상태 및 날짜
-    status = Column(SQLEnum(PrayerStatus, native_enum=False, length=50), default=PrayerStatus.ACTIVE, nullable=False, index=True)
-    start_date = Column(Date, nullable=False, index=True)
+    status = Column(SQLEnum(PrayerStatus, native_enum=False, length=50), default=PrayerStatus.ACTIVE, nullable=False)
+    start_date = Column(Date, nullable=False)
     answer_date = Column(Date, nullable=True)
     answer_content = Column(Text, nullable=True)
     
+    # 응답 과정 집계 (ProgressService에서 함께 갱신)
+    progress_count = Column(Integer, default=0, server_default="0", nullable=False)
+    last_progress_date = Column(Date, nullable=True)
+    
+    # 검색용 tsvector (제목 > 내용 > 응답 내용 순 가중치, 목록 조회 시 로드하지 않음)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple'::regconfig, coalesce(content, '')), 'B') || "
+            "setweight(to_tsvector('simple'::regconfig, coalesce(answer_content, '')), 'C')",
+            persisted=True
+        )
+    ))
+    
     # 타임스탬프
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # 관계
     user = relationship("User", back_populates="prayers")
-    progress_records = relationship("PrayerProgress", back_populates="prayer", cascade="all, delete-orphan")
+    # 응답 과정은 DB의 ON DELETE CASCADE로 삭제 (자식 행을 로드하지 않음)
+    progress_records = relationship(
+        "PrayerProgress",
+        back_populates="prayer",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
     
     def __repr__(self):
         return f"<Prayer(id={self.id}, title={self.title}, status={self.status})>"
@@ -1,23 +1,40 @@
 import uuid
 from datetime import datetime, date
-from sqlalchemy import Column, Text, Date, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Text, Date, DateTime, ForeignKey, Computed, Index, text
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from app.core.database import Base
 
 
 class PrayerProgress(Base):
     """기도 응답 과정 기록 모델"""
     __tablename__ = "prayer_progress"
+    __table_args__ = (
+        # 기도별 응답 과정 타임라인: WHERE prayer_id = ? ORDER BY recorded_date DESC, id DESC (커서 포함)
+        Index("ix_prayer_progress_prayer_timeline", "prayer_id", text("recorded_date DESC"), text("id DESC")),
+        # 사용자별 응답 과정 피드: WHERE user_id = ? ORDER BY recorded_date DESC, id DESC
+        Index("ix_prayer_progress_user_timeline", "user_id", text("recorded_date DESC"), text("id DESC")),
+        # 전문 검색 및 한글 부분 문자열 검색 (pg_trgm)
+        Index("ix_prayer_progress_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_prayer_progress_content_trgm", "content", postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"}),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    prayer_id = Column(UUID(as_uuid=True), ForeignKey("prayers.id", ondelete="CASCADE"), nullable=False, index=True)
+    prayer_id = Column(UUID(as_uuid=True), ForeignKey("prayers.id", ondelete="CASCADE"), nullable=False)
+    # 기도 소유자 (피드/소유 확인 시 prayers 조인 없이 조회, 항상 기도의 user_id와 같음)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     
     # 기록 내용
     content = Column(Text, nullable=False)
-    recorded_date = Column(Date, nullable=False, index=True)
+    recorded_date = Column(Date, nullable=False)
     tags = Column(JSONB, default=list, nullable=False)
     
+    # 검색용 tsvector (목록 조회 시 로드하지 않음)
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple'::regconfig, coalesce(content, ''))", persisted=True)
+    ))
+    
     # 타임스탬프
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
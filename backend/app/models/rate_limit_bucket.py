@@ -0,0 +1,18 @@
+from sqlalchemy import Column, String, Float, DateTime
+from app.core.database import Base
+
+
+class RateLimitBucket(Base):
+    """요청 제한 토큰 버킷 (여러 워커가 공유하는 Postgres 저장소용, 로그 없는 테이블)"""
+    __tablename__ = "rate_limit_buckets"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+    
+    # 제한 대상 키 (예: login:ip:127.0.0.1, login:email:user@example.com)
+    key = Column(String(320), primary_key=True)
+    
+    # 남은 토큰 수 (마지막 시도 직후 기준)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    
+    def __repr__(self):
+        return f"<RateLimitBucket(key={self.key}, tokens={self.tokens})>"
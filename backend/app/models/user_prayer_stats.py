@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from app.core.database import Base
+
+
+class UserPrayerStats(Base):
+    """사용자별 기도 통계 요약 모델 (PrayerService/ProgressService 쓰기 시 함께 갱신)"""
+    __tablename__ = "user_prayer_stats"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    
+    # 상태별 개수
+    total_prayers = Column(Integer, default=0, server_default="0", nullable=False)
+    active_prayers = Column(Integer, default=0, server_default="0", nullable=False)
+    answered_prayers = Column(Integer, default=0, server_default="0", nullable=False)
+    answered_without_content = Column(Integer, default=0, server_default="0", nullable=False)
+    
+    # 주제별 개수 {주제: 개수}
+    by_subject = Column(JSONB, default=dict, server_default="{}", nullable=False)
+    
+    # 사용자 데이터 버전 (기도/응답 과정 쓰기마다 증가, ETag로 사용)
+    data_version = Column(BigInteger, default=0, server_default="0", nullable=False)
+    
+    # 타임스탬프
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<UserPrayerStats(user_id={self.user_id}, total={self.total_prayers})>"
@@ -12,19 +12,36 @@ from app.schemas.prayer import (
     PrayerAnswer,
     PrayerResponse,
     PrayerWithProgress,
+    PrayerDetail,
     PrayerListResponse,
+    PrayerBulkRequest,
+    PrayerBulkResult,
+    PrayerBulkResponse,
 )
 from app.schemas.prayer_progress import (
     ProgressCreate,
     ProgressUpdate,
     ProgressResponse,
     ProgressListResponse,
+    ProgressFeedResponse,
+    ProgressBatchCreate,
+    ProgressBatchResult,
+    ProgressBatchResponse,
 )
 from app.schemas.dashboard import (
     SubjectStats,
     DashboardStats,
     RecentPrayersResponse,
 )
+from app.schemas.search import (
+    SearchHit,
+    SearchResponse,
+)
+from app.schemas.imports import (
+    PrayerImport,
+    ImportRowError,
+    ImportResponse,
+)
 
 __all__ = [
     "UserCreate",
@@ -38,12 +55,25 @@ __all__ = [
     "PrayerAnswer",
     "PrayerResponse",
     "PrayerWithProgress",
+    "PrayerDetail",
     "PrayerListResponse",
+    "PrayerBulkRequest",
+    "PrayerBulkResult",
+    "PrayerBulkResponse",
     "ProgressCreate",
     "ProgressUpdate",
     "ProgressResponse",
     "ProgressListResponse",
+    "ProgressFeedResponse",
+    "ProgressBatchCreate",
+    "ProgressBatchResult",
+    "ProgressBatchResponse",
     "SubjectStats",
     "DashboardStats",
     "RecentPrayersResponse",
+    "SearchHit",
+    "SearchResponse",
+    "PrayerImport",
+    "ImportRowError",
+    "ImportResponse",
 ]
@@ -14,6 +14,7 @@ class DashboardStats(BaseModel):
     total_prayers: int
     active_prayers: int
     answered_prayers: int
+    answered_without_content: int = 0
     answer_rate: float
     by_subject: List[SubjectStats]
 
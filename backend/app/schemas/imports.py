@@ -0,0 +1,31 @@
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel, Field
+from app.models.prayer import PrayerStatus
+from app.schemas.prayer import PrayerCreate
+from app.schemas.prayer_progress import ProgressCreate
+
+
+# 가져오기 기도 (내보내기 형식의 상태/응답 필드 포함, id/작성 시각 등 나머지 필드는 무시)
+class PrayerImportFields(PrayerCreate):
+    status: PrayerStatus = PrayerStatus.ACTIVE
+    answer_date: Optional[date] = None
+    answer_content: Optional[str] = Field(None, min_length=1, max_length=1000)
+
+
+# NDJSON 가져오기 한 줄 (기도 + 응답 과정 배열)
+class PrayerImport(PrayerImportFields):
+    progress: List[ProgressCreate] = Field(default_factory=list)
+
+
+# 가져오기 실패 행 (row는 CSV 데이터 행 / NDJSON 줄 번호, 1부터)
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ImportResponse(BaseModel):
+    prayers: int
+    progress: int
+    failed: int
+    errors: List[ImportRowError]
@@ -1,8 +1,9 @@
 from datetime import datetime, date
-from typing import Optional, List
+from typing import Annotated, Optional, List, Literal, Union
 from uuid import UUID
 from pydantic import BaseModel, Field
 from app.models.prayer import PrayerStatus
+from app.schemas.prayer_progress import ProgressResponse
 
 
 # 기도 생성
@@ -56,12 +57,70 @@ class PrayerResponse(BaseModel):
 # 기도 응답 (응답 과정 포함)
 class PrayerWithProgress(PrayerResponse):
     progress_count: int = 0
+    last_progress_date: Optional[date] = None
     prayer_days: int = 0
 
 
+# 기도 상세 (응답 과정 포함, 최근 기록순, 나머지는 progress_next_cursor로 이어서 조회)
+class PrayerDetail(PrayerWithProgress):
+    progress: List[ProgressResponse] = Field(default_factory=list)
+    progress_next_cursor: Optional[str] = None
+
+
 # 기도 목록 응답
 class PrayerListResponse(BaseModel):
     items: List[PrayerWithProgress]
-    total: int
-    page: int
-    pages: int
+    total: Optional[int] = None
+    page: Optional[int] = None
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+# 일괄 작업 항목
+class PrayerBulkCreate(BaseModel):
+    op: Literal["create"]
+    data: PrayerCreate
+
+
+class PrayerBulkUpdate(BaseModel):
+    op: Literal["update"]
+    id: UUID
+    data: PrayerUpdate
+
+
+class PrayerBulkAnswer(BaseModel):
+    op: Literal["answer"]
+    id: UUID
+    data: PrayerAnswer
+
+
+class PrayerBulkDelete(BaseModel):
+    op: Literal["delete"]
+    id: UUID
+
+
+PrayerBulkOperation = Annotated[
+    Union[PrayerBulkCreate, PrayerBulkUpdate, PrayerBulkAnswer, PrayerBulkDelete],
+    Field(discriminator="op")
+]
+
+
+# 일괄 작업 요청
+class PrayerBulkRequest(BaseModel):
+    operations: List[PrayerBulkOperation] = Field(..., min_length=1, max_length=1000)
+
+
+# 일괄 작업 항목별 결과 (status는 단건 API의 HTTP 상태 코드와 동일)
+class PrayerBulkResult(BaseModel):
+    index: int
+    op: str
+    id: Optional[UUID] = None
+    status: int
+    error: Optional[str] = None
+
+
+# 일괄 작업 응답
+class PrayerBulkResponse(BaseModel):
+    results: List[PrayerBulkResult]
+    succeeded: int
+    failed: int
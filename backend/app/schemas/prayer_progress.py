@@ -35,3 +35,34 @@ class ProgressResponse(BaseModel):
 class ProgressListResponse(BaseModel):
     items: List[ProgressResponse]
     total: int
+    next_cursor: Optional[str] = None
+
+
+# 모든 기도의 응답 과정 피드 (최근 기록순)
+class ProgressFeedResponse(BaseModel):
+    items: List[ProgressResponse]
+    next_cursor: Optional[str] = None
+
+
+# 여러 기도에 응답 과정 일괄 추가
+class ProgressBatchItem(ProgressCreate):
+    prayer_id: UUID
+
+
+class ProgressBatchCreate(BaseModel):
+    items: List[ProgressBatchItem] = Field(..., min_length=1, max_length=1000)
+
+
+# 일괄 추가 항목별 결과 (status는 단건 API의 HTTP 상태 코드와 동일)
+class ProgressBatchResult(BaseModel):
+    index: int
+    prayer_id: UUID
+    id: Optional[UUID] = None
+    status: int
+    error: Optional[str] = None
+
+
+class ProgressBatchResponse(BaseModel):
+    results: List[ProgressBatchResult]
+    succeeded: int
+    failed: int
@@ -0,0 +1,21 @@
+from datetime import date
+from typing import Optional, List, Literal
+from uuid import UUID
+from pydantic import BaseModel
+
+
+# 검색 결과 항목
+class SearchHit(BaseModel):
+    type: Literal["prayer", "progress"]
+    prayer_id: UUID
+    progress_id: Optional[UUID] = None
+    recorded_date: Optional[date] = None
+    title: str
+    snippet: str
+    rank: float
+
+
+# 검색 결과 목록
+class SearchResponse(BaseModel):
+    items: List[SearchHit]
+    total: int
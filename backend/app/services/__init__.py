@@ -2,5 +2,7 @@ from app.services.user_service import UserService
 from app.services.prayer_service import PrayerService
 from app.services.progress_service import ProgressService
 from app.services.stats_service import StatsService
+from app.services.summary_service import SummaryService
+from app.services.search_service import SearchService
 
-__all__ = ["UserService", "PrayerService", "ProgressService", "StatsService"]
+__all__ = ["UserService", "PrayerService", "ProgressService", "StatsService", "SummaryService", "SearchService"]
@@ -0,0 +1,142 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, List, Tuple
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.prayer import Prayer
+from app.models.prayer_progress import PrayerProgress
+
+
+# 서버 측 커서에서 한 번에 가져오는 기도 수 (메모리 사용량 상한)
+EXPORT_CHUNK_SIZE = 500
+
+PRAYER_EXPORT_COLUMNS = [
+    Prayer.id,
+    Prayer.subject,
+    Prayer.title,
+    Prayer.content,
+    Prayer.prayer_type,
+    Prayer.prayer_targets,
+    Prayer.category_tags,
+    Prayer.status,
+    Prayer.start_date,
+    Prayer.answer_date,
+    Prayer.answer_content,
+    Prayer.created_at,
+    Prayer.updated_at,
+]
+
+PROGRESS_EXPORT_COLUMNS = [
+    PrayerProgress.id,
+    PrayerProgress.content,
+    PrayerProgress.recorded_date,
+    PrayerProgress.tags,
+    PrayerProgress.created_at,
+    PrayerProgress.updated_at,
+]
+
+# CSV는 응답 과정마다 한 행 (응답 과정이 없는 기도는 progress_* 열이 빈 한 행)
+CSV_HEADER = (
+    [column.key if column.key != "id" else "prayer_id" for column in PRAYER_EXPORT_COLUMNS]
+    + [f"progress_{column.key}" for column in PROGRESS_EXPORT_COLUMNS]
+)
+
+
+def _to_json_value(value: Any) -> Any:
+    """내보내기용 JSON 값 변환"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _to_csv_value(value: Any) -> Any:
+    """내보내기용 CSV 값 변환 (목록은 JSON 배열 문자열)"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return json.dumps(value, ensure_ascii=False)
+    return _to_json_value(value)
+
+
+class ExportService:
+    """사용자 데이터 내보내기"""
+
+    @staticmethod
+    async def iter_prayers(
+        db: AsyncSession,
+        user_id: UUID
+    ) -> AsyncIterator[List[Tuple[Dict, List[Dict]]]]:
+        """기도와 응답 과정을 청크 단위로 조회
+
+        기도는 서버 측 커서(yield_per)로 EXPORT_CHUNK_SIZE개씩 가져오고,
+        청크마다 해당 기도들의 응답 과정을 한 번에 조회하여 (기도, [응답 과정]) 목록을 내보냅니다.
+        """
+        prayers = await db.stream(
+            select(*PRAYER_EXPORT_COLUMNS)
+            .where(Prayer.user_id == user_id)
+            .order_by(Prayer.created_at, Prayer.id)
+            .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        )
+
+        async for chunk in prayers.partitions():
+            prayer_ids = [row.id for row in chunk]
+            progress_result = await db.execute(
+                select(PrayerProgress.prayer_id, *PROGRESS_EXPORT_COLUMNS)
+                .where(PrayerProgress.prayer_id.in_(prayer_ids))
+                .order_by(PrayerProgress.prayer_id, PrayerProgress.recorded_date, PrayerProgress.id)
+            )
+
+            progress_by_prayer: Dict[UUID, List[Dict]] = {}
+            for row in progress_result:
+                record = dict(row._mapping)
+                progress_by_prayer.setdefault(record.pop("prayer_id"), []).append(record)
+
+            yield [
+                (dict(row._mapping), progress_by_prayer.get(row.id, []))
+                for row in chunk
+            ]
+
+    @staticmethod
+    async def ndjson(db: AsyncSession, user_id: UUID) -> AsyncIterator[str]:
+        """기도 한 건당 한 줄의 NDJSON (응답 과정은 progress 배열로 포함)"""
+        async for chunk in ExportService.iter_prayers(db, user_id):
+            lines = []
+            for prayer, progress in chunk:
+                record = {key: _to_json_value(value) for key, value in prayer.items()}
+                record["progress"] = [
+                    {key: _to_json_value(value) for key, value in item.items()}
+                    for item in progress
+                ]
+                lines.append(json.dumps(record, ensure_ascii=False))
+            yield "\n".join(lines) + "\n"
+
+    @staticmethod
+    async def csv(db: AsyncSession, user_id: UUID) -> AsyncIterator[str]:
+        """응답 과정마다 한 행의 CSV (기도 열 반복)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_HEADER)
+
+        async for chunk in ExportService.iter_prayers(db, user_id):
+            for prayer, progress in chunk:
+                prayer_values = [_to_csv_value(value) for value in prayer.values()]
+                if not progress:
+                    writer.writerow(prayer_values + [""] * len(PROGRESS_EXPORT_COLUMNS))
+                for item in progress:
+                    writer.writerow(prayer_values + [_to_csv_value(value) for value in item.values()])
+
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+        # 기도가 없어도 헤더는 내보냄
+        if buffer.tell():
+            yield buffer.getvalue()
@@ -0,0 +1,332 @@
+import asyncio
+import csv
+import io
+from pydantic_core import from_json, to_json
+from typing import Any, AsyncIterator, BinaryIO, Iterator, List, Optional, Tuple
+from uuid import UUID
+from pydantic import ValidationError
+from sqlalchemy import (
+    Table, MetaData, Column, Integer, Text, Date, Interval,
+    select, insert, func, cast, literal, literal_column
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
+from app.models.prayer import Prayer, PrayerStatus
+from app.models.prayer_progress import PrayerProgress
+from app.schemas.imports import PrayerImport, PrayerImportFields, ImportRowError, ImportResponse
+from app.schemas.prayer_progress import ProgressCreate
+from app.services.summary_service import SummaryService
+
+
+# 응답에 포함하는 실패 행 수 상한 (failed에는 전체 개수)
+MAX_IMPORT_ERRORS = 1000
+
+# 기도 행과 응답 과정 행을 함께 담는 임시 스테이징 테이블 (트랜잭션 종료 시 삭제)
+IMPORT_STAGING = Table(
+    "prayer_import_staging",
+    MetaData(),
+    Column("row_no", Integer, nullable=False),
+    # 응답 과정 행이면 기도 행의 row_no, 기도 행이면 NULL
+    Column("prayer_row", Integer),
+    Column("id", PG_UUID(as_uuid=True), server_default=func.gen_random_uuid(), nullable=False),
+    Column("subject", Text),
+    Column("title", Text),
+    Column("content", Text, nullable=False),
+    Column("prayer_type", Text),
+    Column("prayer_targets", Text),
+    Column("category_tags", Text),
+    Column("start_date", Date),
+    Column("recorded_date", Date),
+    Column("tags", Text),
+    # 기도 상태(PrayerStatus 이름)와 최종 응답
+    Column("status", Text),
+    Column("answer_date", Date),
+    Column("answer_content", Text),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+# 검증 루프가 이벤트 루프를 점유하지 않도록 이 행 수마다 양보
+IMPORT_YIELD_EVERY = 1000
+
+CSV_REQUIRED_COLUMNS = frozenset({"subject", "title", "content", "prayer_type", "start_date"})
+CSV_PROGRESS_COLUMNS = ("progress_content", "progress_recorded_date", "progress_tags")
+
+
+class _ImportReport:
+    """가져오기 집계 및 실패 행 수집"""
+
+    def __init__(self):
+        self.prayers = 0
+        self.progress = 0
+        self.failed = 0
+        self.errors: List[ImportRowError] = []
+
+    def fail(self, row: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_IMPORT_ERRORS:
+            self.errors.append(ImportRowError(row=row, error=error))
+
+
+def _error_message(exc: ValidationError, prefix: str = "") -> str:
+    """검증 오류를 '필드: 메시지' 형식으로 변환"""
+    messages = []
+    for error in exc.errors():
+        loc = ".".join(str(part) for part in error["loc"])
+        messages.append(f"{prefix}{loc}: {error['msg']}" if loc else error["msg"])
+    return "; ".join(messages)
+
+
+# COPY 열 순서 (id는 서버에서 생성)
+STAGING_COPY_COLUMNS = [column.name for column in IMPORT_STAGING.columns if column.name != "id"]
+
+
+def _prayer_record(row: int, prayer: PrayerImportFields) -> Tuple:
+    return (
+        row, None,
+        prayer.subject, prayer.title, prayer.content, prayer.prayer_type,
+        to_json(prayer.prayer_targets).decode(),
+        to_json(prayer.category_tags).decode(),
+        prayer.start_date, None, None,
+        prayer.status.name, prayer.answer_date, prayer.answer_content,
+    )
+
+
+def _progress_record(row: int, prayer_row: int, progress: ProgressCreate) -> Tuple:
+    return (
+        row, prayer_row,
+        None, None, progress.content, None, None, None, None,
+        progress.recorded_date,
+        to_json(progress.tags).decode(),
+        None, None, None,
+    )
+
+
+def _csv_list(value: Optional[str]) -> Any:
+    """CSV 목록 열 (JSON 배열 문자열, 빈 값은 빈 목록)
+
+    JSON이 아니면 원래 문자열을 그대로 두어 스키마 검증 오류로 보고되게 합니다.
+    """
+    if not value:
+        return []
+    try:
+        return from_json(value)
+    except ValueError:
+        return value
+
+
+def _ndjson_records(file: io.TextIOBase, report: _ImportReport) -> Iterator[Tuple]:
+    """NDJSON 한 줄 = 기도 하나 (progress 배열 포함), 한 줄이라도 오류면 줄 전체 제외"""
+    for row, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = PrayerImport.model_validate_json(line)
+        except ValidationError as e:
+            report.fail(row, _error_message(e))
+            continue
+
+        report.prayers += 1
+        yield _prayer_record(row, item)
+        for progress in item.progress:
+            report.progress += 1
+            yield _progress_record(row, row, progress)
+
+
+def _csv_records(file: io.TextIOBase, report: _ImportReport) -> Iterator[Tuple]:
+    """CSV 한 행 = 기도 + 응답 과정 하나 (내보내기 CSV와 같은 열 이름)
+
+    prayer_ref(또는 내보내기의 prayer_id)가 같은 연속된 행은 하나의 기도로 묶고,
+    기도 열은 그룹의 첫 행에서 읽습니다. 첫 행이 실패하면 그룹 전체가 제외됩니다.
+    """
+    reader = csv.DictReader(file)
+    missing = CSV_REQUIRED_COLUMNS - set(reader.fieldnames or ())
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(sorted(missing))}")
+
+    # 현재 그룹의 기준 키와 첫 행 번호 (첫 행이 실패한 그룹이면 group_valid False)
+    group_ref: Optional[str] = None
+    group_row = 0
+    group_valid = False
+
+    for row, values in enumerate(reader, start=1):
+        ref = values.get("prayer_ref") or values.get("prayer_id")
+        in_group = bool(ref) and ref == group_ref
+
+        if in_group and not group_valid:
+            report.fail(row, f"Prayer in row {group_row} is invalid")
+            continue
+
+        prayer = progress = None
+        errors = []
+        if not in_group:
+            try:
+                prayer = PrayerImportFields.model_validate({
+                    "subject": values["subject"],
+                    "title": values["title"],
+                    "content": values["content"],
+                    "prayer_type": values["prayer_type"],
+                    "prayer_targets": _csv_list(values.get("prayer_targets")),
+                    "category_tags": _csv_list(values.get("category_tags")),
+                    "start_date": values["start_date"],
+                    # 선택 열 (빈 값은 없는 것으로)
+                    "status": values.get("status") or PrayerStatus.ACTIVE,
+                    "answer_date": values.get("answer_date") or None,
+                    "answer_content": values.get("answer_content") or None,
+                })
+            except ValidationError as e:
+                errors.append(_error_message(e))
+        if any(values.get(name) for name in CSV_PROGRESS_COLUMNS):
+            try:
+                progress = ProgressCreate.model_validate({
+                    "content": values.get("progress_content"),
+                    "recorded_date": values.get("progress_recorded_date"),
+                    "tags": _csv_list(values.get("progress_tags")),
+                })
+            except ValidationError as e:
+                errors.append(_error_message(e, prefix="progress_"))
+
+        if errors:
+            report.fail(row, "; ".join(errors))
+            if not in_group:
+                group_ref, group_row, group_valid = ref, row, False
+            continue
+
+        if not in_group:
+            group_ref, group_row, group_valid = ref, row, True
+            report.prayers += 1
+            yield _prayer_record(row, prayer)
+        if progress is not None:
+            report.progress += 1
+            yield _progress_record(row, group_row, progress)
+
+
+async def _cooperative(records: Iterator[Tuple]) -> AsyncIterator[Tuple]:
+    """동기 검증 제너레이터를 COPY용 비동기 이터레이터로 변환 (주기적으로 다른 요청에 양보)"""
+    for count, record in enumerate(records, start=1):
+        yield record
+        if count % IMPORT_YIELD_EVERY == 0:
+            await asyncio.sleep(0)
+
+
+class ImportService:
+    """CSV/NDJSON 대량 가져오기"""
+
+    @staticmethod
+    async def import_file(
+        db: AsyncSession,
+        user_id: UUID,
+        file: BinaryIO,
+        format: str
+    ) -> ImportResponse:
+        """파일의 기도와 응답 과정을 가져오기
+
+        행을 읽으면서 PrayerImportFields/ProgressCreate로 검증하고 유효한 행만
+        COPY로 임시 스테이징 테이블에 적재한 뒤, 한 문장으로 prayers/prayer_progress에 병합합니다.
+        잘못된 형식(필수 열 누락, UTF-8 아님)은 ValueError를 발생시킵니다.
+        """
+        report = _ImportReport()
+        text_file = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        read_records = _csv_records if format == "csv" else _ndjson_records
+
+        await db.execute(CreateTable(IMPORT_STAGING))
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        try:
+            await raw_connection.driver_connection.copy_records_to_table(
+                IMPORT_STAGING.name,
+                records=_cooperative(read_records(text_file, report)),
+                columns=STAGING_COPY_COLUMNS
+            )
+        except UnicodeDecodeError:
+            raise ValueError("File must be UTF-8 encoded")
+        finally:
+            # 업로드 파일은 호출한 쪽에서 닫음
+            text_file.detach()
+
+        if report.prayers:
+            await db.execute(ImportService._merge_statement(user_id))
+            await SummaryService.rebuild(db, user_id)
+        await db.commit()
+
+        return ImportResponse(
+            prayers=report.prayers,
+            progress=report.progress,
+            failed=report.failed,
+            errors=report.errors
+        )
+
+    @staticmethod
+    def _merge_statement(user_id: UUID):
+        """스테이징 테이블을 prayers/prayer_progress로 병합하는 단일 INSERT
+
+        기도 INSERT는 CTE로 함께 실행하고, 응답 과정 집계(progress_count, last_progress_date)도
+        스테이징에서 바로 계산합니다. created_at은 파일 순서를 유지하도록 행 번호만큼 늘립니다.
+        """
+        staged = IMPORT_STAGING.c
+        prayer_rows = IMPORT_STAGING.alias("prayer_rows")
+        imported_at = func.timezone("utc", func.now())
+        created_at = imported_at + staged.row_no * literal_column("interval '1 microsecond'", Interval)
+
+        progress_totals = (
+            select(
+                staged.prayer_row,
+                func.count().label("count"),
+                func.max(staged.recorded_date).label("last_date")
+            )
+            .where(staged.prayer_row.isnot(None))
+            .group_by(staged.prayer_row)
+            .subquery()
+        )
+
+        imported_prayers = insert(Prayer).from_select(
+            [
+                "id", "user_id", "subject", "title", "content", "prayer_type",
+                "prayer_targets", "category_tags", "status", "start_date",
+                "answer_date", "answer_content",
+                "progress_count", "last_progress_date", "created_at", "updated_at"
+            ],
+            select(
+                staged.id,
+                literal(user_id, Prayer.user_id.type),
+                staged.subject,
+                staged.title,
+                staged.content,
+                staged.prayer_type,
+                cast(staged.prayer_targets, JSONB),
+                cast(staged.category_tags, JSONB),
+                staged.status,
+                staged.start_date,
+                staged.answer_date,
+                staged.answer_content,
+                func.coalesce(progress_totals.c.count, 0),
+                progress_totals.c.last_date,
+                created_at,
+                created_at
+            )
+            .select_from(
+                IMPORT_STAGING.outerjoin(progress_totals, progress_totals.c.prayer_row == staged.row_no)
+            )
+            .where(staged.prayer_row.is_(None))
+        ).cte("imported_prayers")
+
+        # 응답 과정 행의 기도 ID는 같은 스테이징의 기도 행(prayer_row)에서 가져옴
+        return insert(PrayerProgress).from_select(
+            ["id", "prayer_id", "user_id", "content", "recorded_date", "tags", "created_at", "updated_at"],
+            select(
+                staged.id,
+                prayer_rows.c.id,
+                literal(user_id, PrayerProgress.user_id.type),
+                staged.content,
+                staged.recorded_date,
+                cast(staged.tags, JSONB),
+                created_at,
+                created_at
+            )
+            .join_from(
+                IMPORT_STAGING,
+                prayer_rows,
+                (prayer_rows.c.row_no == staged.prayer_row) & prayer_rows.c.prayer_row.is_(None)
+            )
+        ).add_cte(imported_prayers)
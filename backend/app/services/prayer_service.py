@@ -1,11 +1,128 @@
-from typing import Optional, List
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, FrozenSet, Tuple, Type, Union
 from uuid import UUID
 from datetime import datetime, date
-from sqlalchemy import select, func, and_, or_
+from http import HTTPStatus
+from sqlalchemy import select, insert, update, delete, func, and_, case, bindparam, literal_column, Date
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only
+from sqlalchemy.sql import Select
+from pydantic import BaseModel
+from app.core.database import KOREAN_COLLATION
 from app.models.prayer import Prayer, PrayerStatus
-from app.schemas.prayer import PrayerCreate, PrayerUpdate, PrayerAnswer
+from app.schemas.prayer import (
+    PrayerCreate,
+    PrayerUpdate,
+    PrayerAnswer,
+    PrayerResponse,
+    PrayerWithProgress,
+    PrayerDetail,
+    PrayerBulkOperation,
+    PrayerBulkResult
+)
+from app.schemas.prayer_progress import ProgressResponse
+from app.services.progress_service import ProgressService
+from app.services.search_service import SearchService
+from app.services.summary_service import SummaryService, PrayerSnapshot
+from app.utils.fields import sparse_model
+from app.utils.pagination import (
+    SortColumns,
+    encode_cursor,
+    decode_cursor,
+    order_by_clauses,
+    keyset_condition
+)
+
+
+def _sort_orders(name: str, column) -> dict[str, SortColumns]:
+    """컬럼 하나에 대한 내림차순/오름차순 정렬 정의 (id로 순서 고정)"""
+    return {
+        f"{name}_desc": [(column, True), (Prayer.id, True)],
+        f"{name}_asc": [(column, False), (Prayer.id, False)],
+    }
+
+
+# 응답일: 응답 전 기도는 가장 이른 날짜로 취급 (ix_prayers_user_answer_date 식과 동일)
+ANSWER_DATE_SORT = func.coalesce(Prayer.answer_date, literal_column("'0001-01-01'::date", Date))
+
+# 기도 기간(일): 진행 중인 기도는 오늘까지 계산되므로 인덱스 없이 사용자 범위 내에서 정렬
+# (calculate_prayer_days와 같이 응답된 기도만 응답일 기준)
+PRAYER_DURATION_SORT = case(
+    (
+        and_(Prayer.status == PrayerStatus.ANSWERED, Prayer.answer_date.isnot(None)),
+        Prayer.answer_date
+    ),
+    else_=func.current_date()
+) - Prayer.start_date
+
+# 목록 정렬 기준: 정렬 키 -> (컬럼, 내림차순 여부) 목록 (마지막은 항상 id)
+PRAYER_SORTS = {
+    **_sort_orders("created_at", Prayer.created_at),
+    **_sort_orders("start_date", Prayer.start_date),
+    **_sort_orders("answer_date", ANSWER_DATE_SORT),
+    **_sort_orders("duration", PRAYER_DURATION_SORT),
+    **_sort_orders("title", Prayer.title.collate(KOREAN_COLLATION)),
+}
+DEFAULT_PRAYER_SORT = "created_at_desc"
+
+# 계산 필드 -> 계산에 필요한 컬럼 (fields 파라미터로 일부 필드만 조회할 때 사용)
+DERIVED_FIELD_COLUMNS = {
+    "prayer_days": ("status", "start_date", "answer_date"),
+}
+
+
+# 자주 실행되는 조회는 값을 바인드 파라미터로 둔 문장을 재사용하여
+# 요청마다 select() 구성과 캐시 키 계산을 반복하지 않음 (SQL 컴파일 캐시도 바로 적중)
+PRAYER_BY_ID = select(Prayer).where(
+    Prayer.id == bindparam("prayer_id"),
+    Prayer.user_id == bindparam("user_id")
+)
+
+
+@lru_cache(maxsize=256)
+def _prayer_by_id_statement(fields: Optional[FrozenSet[str]]) -> Select:
+    """특정 기도 조회 문장 (필드 조합별로 캐시)"""
+    if fields is None:
+        return PRAYER_BY_ID
+    return PRAYER_BY_ID.options(*PrayerService.load_fields(fields))
+
+
+@lru_cache(maxsize=256)
+def _prayer_list_statements(
+    sort_key: str,
+    by_status: bool,
+    by_subject: bool,
+    keyset: bool,
+    fields: Optional[FrozenSet[str]]
+) -> Tuple[Select, Select, Select]:
+    """기도 목록 문장 (필터 조합/정렬/필드별로 캐시, 값은 모두 바인드 파라미터)
+
+    (필터만 적용한 기본 문장, 목록 문장, 개수 문장)을 반환합니다.
+    검색어 조건은 검색어에 따라 구조가 달라지므로 호출하는 쪽에서 기본 문장에 덧붙입니다.
+    """
+    sort_columns = PRAYER_SORTS[sort_key]
+
+    base = select(Prayer).where(Prayer.user_id == bindparam("user_id"))
+    if by_status:
+        base = base.where(Prayer.status == bindparam("status"))
+    if by_subject:
+        base = base.where(Prayer.subject == bindparam("subject"))
+
+    # 다음 페이지 존재 여부 확인을 위해 limit은 한 건 더 조회하는 값으로 전달
+    query = base.order_by(*order_by_clauses(sort_columns))
+    if keyset:
+        query = query.where(keyset_condition(sort_columns, [
+            bindparam(f"cursor_{i}", type_=column.type)
+            for i, (column, _) in enumerate(sort_columns)
+        ]))
+    else:
+        query = query.offset(bindparam("offset"))
+    query = query.options(*PrayerService.load_fields(fields)).limit(bindparam("limit")).add_columns(
+        *[column.label(f"sort_{i}") for i, (column, _) in enumerate(sort_columns)]
+    )
+
+    count_query = select(func.count()).select_from(base.subquery())
+    return base, query, count_query
 
 
 class PrayerService:
@@ -31,8 +148,9 @@ class PrayerService:
         )
         
         db.add(prayer)
+        await db.flush()
+        await SummaryService.apply_change(db, user_id, None, SummaryService.snapshot(prayer))
         await db.commit()
-        await db.refresh(prayer)
         
         return prayer
     
@@ -40,21 +158,44 @@ class PrayerService:
     async def get_prayer_by_id(
         db: AsyncSession,
         prayer_id: UUID,
-        user_id: UUID
+        user_id: UUID,
+        fields: Optional[FrozenSet[str]] = None
     ) -> Optional[Prayer]:
-        """특정 기도 조회"""
+        """특정 기도 조회 (fields가 주어지면 해당 컬럼만 로드)"""
         result = await db.execute(
-            select(Prayer)
-            .options(selectinload(Prayer.progress_records))
-            .where(
-                and_(
-                    Prayer.id == prayer_id,
-                    Prayer.user_id == user_id
-                )
-            )
+            _prayer_by_id_statement(fields),
+            {"prayer_id": prayer_id, "user_id": user_id}
         )
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_prayer_detail(
+        db: AsyncSession,
+        prayer_id: UUID,
+        user_id: UUID,
+        progress_limit: Optional[int] = None
+    ) -> Optional[PrayerDetail]:
+        """응답 과정을 포함한 기도 상세 조회
+        
+        응답 과정은 최근 기록순이며 progress_limit이 주어지면 그 개수까지만 포함합니다
+        (전체 개수는 progress_count, 나머지는 progress_next_cursor로 응답 과정 목록에서 조회).
+        """
+        prayer_result = await db.execute(
+            PRAYER_BY_ID,
+            {"prayer_id": prayer_id, "user_id": user_id}
+        )
+        prayer = prayer_result.scalar_one_or_none()
+        if prayer is None:
+            return None
+        
+        progress, next_cursor = await ProgressService.get_progress_page(db, prayer_id, progress_limit)
+        
+        return PrayerDetail(
+            **PrayerService.to_prayer_with_progress(prayer).model_dump(),
+            progress=[ProgressResponse.model_validate(p) for p in progress],
+            progress_next_cursor=next_cursor
+        )
+    
     @staticmethod
     async def get_prayers(
         db: AsyncSession,
@@ -63,42 +204,136 @@ class PrayerService:
         subject: Optional[str] = None,
         search: Optional[str] = None,
         page: int = 1,
-        limit: int = 10
-    ) -> tuple[List[Prayer], int]:
-        """기도 목록 조회 (필터링 및 페이지네이션)"""
-        # 기본 쿼리
-        query = select(Prayer).where(Prayer.user_id == user_id)
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        sort_by: str = DEFAULT_PRAYER_SORT,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> tuple[List[Union[PrayerWithProgress, BaseModel]], Optional[int], Optional[str]]:
+        """기도 목록 조회 (필터링, 정렬 및 페이지네이션)
         
-        # 필터링
-        if status:
-            query = query.where(Prayer.status == status)
+        cursor가 주어지면 OFFSET 대신 키셋 페이지네이션을 사용하고,
+        include_total이 False이면 전체 개수 조회를 생략합니다.
+        sort_by는 PRAYER_SORTS의 키 중 하나이며, cursor는 같은 정렬로 발급된 것이어야 합니다.
+        fields가 주어지면 해당 컬럼만 조회하여 선택한 필드만 가진 모델로 반환합니다.
+        잘못된 sort_by나 cursor는 ValueError를 발생시킵니다.
+        """
+        if sort_by not in PRAYER_SORTS:
+            raise ValueError("Invalid sort_by")
+        sort_key = sort_by
+        sort_columns = PRAYER_SORTS[sort_key]
+        
+        # 잘못된 커서는 쿼리 실행 전에 거부
+        cursor_values = decode_cursor(cursor, sort_key, sort_columns) if cursor else None
         
+        # 필터 조합별로 캐시된 문장과 바인드 값
+        base, query, count_query = _prayer_list_statements(
+            sort_key, bool(status), bool(subject), bool(cursor), fields
+        )
+        params: Dict[str, Any] = {"user_id": user_id, "limit": limit + 1}
+        if status:
+            params["status"] = status
         if subject:
-            query = query.where(Prayer.subject == subject)
+            params["subject"] = subject
         
         if search:
-            search_term = f"%{search}%"
-            query = query.where(
-                or_(
-                    Prayer.title.ilike(search_term),
-                    Prayer.content.ilike(search_term)
-                )
-            )
+            match = SearchService.prayer_match(search)
+            query = query.where(match)
+            count_query = select(func.count()).select_from(base.where(match).subquery())
         
-        # 전체 개수 조회
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
+        # 전체 개수 조회 (선택)
+        total = None
+        if include_total:
+            total_result = await db.execute(count_query, params)
+            total = total_result.scalar()
         
-        # 페이지네이션 및 정렬
-        query = query.order_by(Prayer.created_at.desc())
-        query = query.offset((page - 1) * limit).limit(limit)
+        # 페이지네이션
+        if cursor_values is not None:
+            params.update({f"cursor_{i}": value for i, value in enumerate(cursor_values)})
+        else:
+            params["offset"] = (page - 1) * limit
         
         # 실행
-        result = await db.execute(query)
-        prayers = result.scalars().all()
+        result = await db.execute(query, params)
+        rows = result.all()
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(sort_key, rows[-1][1:])
+        
+        prayers = [
+            PrayerService.to_prayer_with_progress(prayer, fields)
+            for prayer, *_ in rows
+        ]
+        
+        return prayers, total, next_cursor
+    
+    @staticmethod
+    async def fetch_with_progress(
+        db: AsyncSession,
+        query: Select,
+        fields: Optional[FrozenSet[str]] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Union[PrayerWithProgress, BaseModel]]:
+        """기도 조회 쿼리를 실행하여 PrayerWithProgress 목록으로 변환 (params는 바인드 값)"""
+        if fields is not None:
+            query = query.options(*PrayerService.load_fields(fields))
+        result = await db.execute(query, params)
+        
+        return [
+            PrayerService.to_prayer_with_progress(prayer, fields)
+            for prayer in result.scalars().all()
+        ]
+    
+    @staticmethod
+    def load_fields(fields: Optional[FrozenSet[str]]) -> list:
+        """선택한 필드에 필요한 컬럼만 로드하는 옵션 (fields가 없으면 전체 로드)"""
+        if fields is None:
+            return []
+        
+        columns = set()
+        for name in fields:
+            columns.update(DERIVED_FIELD_COLUMNS.get(name, (name,)))
+        
+        return [load_only(*[getattr(Prayer, column) for column in sorted(columns)])]
+    
+    @staticmethod
+    def to_fields(
+        prayer: Prayer,
+        model: Type[BaseModel],
+        fields: FrozenSet[str]
+    ) -> BaseModel:
+        """선택한 필드만 가진 응답 모델로 변환 (로드하지 않은 컬럼은 접근하지 않음)"""
+        values = {
+            name: (
+                PrayerService.calculate_prayer_days(prayer)
+                if name == "prayer_days"
+                else getattr(prayer, name)
+            )
+            for name in fields
+        }
+        return sparse_model(model, fields)(**values)
+    
+    @staticmethod
+    def to_prayer_with_progress(
+        prayer: Prayer,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> Union[PrayerWithProgress, BaseModel]:
+        """Prayer 모델을 PrayerWithProgress 스키마로 변환
         
-        return list(prayers), total
+        progress_count와 last_progress_date는 prayers 테이블에 비정규화되어 있어
+        추가 조회가 필요 없습니다.
+        """
+        if fields is not None:
+            return PrayerService.to_fields(prayer, PrayerWithProgress, fields)
+        
+        prayer_dict = PrayerResponse.model_validate(prayer).model_dump()
+        prayer_dict["progress_count"] = prayer.progress_count
+        prayer_dict["last_progress_date"] = prayer.last_progress_date
+        prayer_dict["prayer_days"] = PrayerService.calculate_prayer_days(prayer)
+        
+        return PrayerWithProgress(**prayer_dict)
     
     @staticmethod
     async def update_prayer(
@@ -108,20 +343,9 @@ class PrayerService:
         prayer_data: PrayerUpdate
     ) -> Optional[Prayer]:
         """기도 수정"""
-        prayer = await PrayerService.get_prayer_by_id(db, prayer_id, user_id)
-        
-        if not prayer:
-            return None
-        
-        # 업데이트
-        update_data = prayer_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(prayer, field, value)
-        
-        await db.commit()
-        await db.refresh(prayer)
-        
-        return prayer
+        return await PrayerService._update_returning(
+            db, prayer_id, user_id, prayer_data.model_dump(exclude_unset=True)
+        )
     
     @staticmethod
     async def delete_prayer(
@@ -129,13 +353,23 @@ class PrayerService:
         prayer_id: UUID,
         user_id: UUID
     ) -> bool:
-        """기도 삭제"""
-        prayer = await PrayerService.get_prayer_by_id(db, prayer_id, user_id)
+        """기도 삭제 (응답 과정은 ON DELETE CASCADE로 함께 삭제, 단일 DELETE)"""
+        result = await db.execute(
+            delete(Prayer)
+            .where(
+                and_(
+                    Prayer.id == prayer_id,
+                    Prayer.user_id == user_id
+                )
+            )
+            .returning(Prayer.status, Prayer.subject, Prayer.answer_content)
+        )
+        deleted = result.one_or_none()
         
-        if not prayer:
+        if deleted is None:
             return False
         
-        await db.delete(prayer)
+        await SummaryService.apply_change(db, user_id, SummaryService.snapshot(deleted), None)
         await db.commit()
         
         return True
@@ -148,20 +382,179 @@ class PrayerService:
         answer_data: PrayerAnswer
     ) -> Optional[Prayer]:
         """최종 응답 기록"""
-        prayer = await PrayerService.get_prayer_by_id(db, prayer_id, user_id)
+        return await PrayerService._update_returning(
+            db,
+            prayer_id,
+            user_id,
+            {
+                "status": PrayerStatus.ANSWERED,
+                "answer_date": answer_data.answer_date,
+                "answer_content": answer_data.answer_content
+            }
+        )
+    
+    @staticmethod
+    async def _update_returning(
+        db: AsyncSession,
+        prayer_id: UUID,
+        user_id: UUID,
+        values: dict
+    ) -> Optional[Prayer]:
+        """UPDATE ... WHERE id AND user_id RETURNING으로 기도 한 건 수정 후 커밋
         
-        if not prayer:
-            return None
+        수정 전 요약 속성은 같은 문장에서 잠근 행(before)에서 함께 반환받아
+        조회 없이 요약을 갱신합니다. 대상이 없으면 None을 반환합니다.
+        """
+        before = (
+            select(Prayer.id, Prayer.status, Prayer.subject, Prayer.answer_content)
+            .where(
+                and_(
+                    Prayer.id == prayer_id,
+                    Prayer.user_id == user_id
+                )
+            )
+            .with_for_update()
+            .subquery("before")
+        )
+        result = await db.execute(
+            update(Prayer)
+            .where(Prayer.id == before.c.id)
+            .values(**values, updated_at=datetime.utcnow())
+            .returning(Prayer, before.c.status, before.c.subject, before.c.answer_content)
+            # 세션에 이미 로드된 기도에도 수정 값 반영 (이전 값으로 요약을 계산하지 않도록)
+            .execution_options(synchronize_session="fetch")
+        )
+        row = result.one_or_none()
         
-        prayer.status = PrayerStatus.ANSWERED
-        prayer.answer_date = answer_data.answer_date
-        prayer.answer_content = answer_data.answer_content
+        if row is None:
+            return None
         
+        prayer = row[0]
+        await SummaryService.apply_change(
+            db, user_id, SummaryService.snapshot(row), SummaryService.snapshot(prayer)
+        )
         await db.commit()
-        await db.refresh(prayer)
         
         return prayer
     
+    @staticmethod
+    async def bulk_apply(
+        db: AsyncSession,
+        user_id: UUID,
+        operations: List[PrayerBulkOperation]
+    ) -> List[PrayerBulkResult]:
+        """기도 일괄 생성/수정/응답/삭제 (단일 트랜잭션)
+        
+        생성은 다중 행 INSERT ... RETURNING, 수정/응답은 기본 키 기준 일괄 UPDATE,
+        삭제는 단일 DELETE(응답 과정은 ON DELETE CASCADE)로 처리하고 한 번만 커밋합니다.
+        대상 기도가 없거나 같은 기도를 여러 번 지정한 항목은 건너뛰고 결과에 오류로 표시합니다.
+        """
+        results: List[Optional[PrayerBulkResult]] = [None] * len(operations)
+        
+        # 대상 기도의 현재 상태를 한 번에 조회 (소유 확인 및 요약 계산용)
+        target_ids = {operation.id for operation in operations if operation.op != "create"}
+        before = {}
+        if target_ids:
+            rows = await db.execute(
+                select(Prayer.id, Prayer.status, Prayer.subject, Prayer.answer_content)
+                .where(
+                    Prayer.user_id == user_id,
+                    Prayer.id.in_(target_ids)
+                )
+                .with_for_update()
+            )
+            before = {row.id: SummaryService.snapshot(row) for row in rows}
+        
+        now = datetime.utcnow()
+        creates = []
+        updates = []
+        deletes = []
+        changes = []
+        seen = set()
+        
+        for index, operation in enumerate(operations):
+            if operation.op == "create":
+                creates.append((index, {
+                    **operation.data.model_dump(),
+                    "user_id": user_id,
+                    "status": PrayerStatus.ACTIVE
+                }))
+                changes.append((None, PrayerSnapshot(PrayerStatus.ACTIVE, operation.data.subject, False)))
+                continue
+            
+            if operation.id not in before:
+                results[index] = PrayerBulkResult(
+                    index=index, op=operation.op, id=operation.id,
+                    status=HTTPStatus.NOT_FOUND, error="Prayer not found"
+                )
+                continue
+            
+            if operation.id in seen:
+                results[index] = PrayerBulkResult(
+                    index=index, op=operation.op, id=operation.id,
+                    status=HTTPStatus.CONFLICT, error="Duplicate prayer id in batch"
+                )
+                continue
+            seen.add(operation.id)
+            
+            snapshot = before[operation.id]
+            if operation.op == "update":
+                values = operation.data.model_dump(exclude_unset=True, exclude_none=True)
+                updates.append({"id": operation.id, **values, "updated_at": now})
+                changes.append((snapshot, snapshot._replace(subject=values.get("subject", snapshot.subject))))
+                result_status = HTTPStatus.OK
+            elif operation.op == "answer":
+                updates.append({
+                    "id": operation.id,
+                    "status": PrayerStatus.ANSWERED,
+                    "answer_date": operation.data.answer_date,
+                    "answer_content": operation.data.answer_content,
+                    "updated_at": now
+                })
+                changes.append((snapshot, PrayerSnapshot(PrayerStatus.ANSWERED, snapshot.subject, False)))
+                result_status = HTTPStatus.OK
+            else:
+                deletes.append(operation.id)
+                changes.append((snapshot, None))
+                result_status = HTTPStatus.NO_CONTENT
+            
+            results[index] = PrayerBulkResult(
+                index=index, op=operation.op, id=operation.id, status=result_status
+            )
+        
+        # 생성: 다중 행 INSERT, 입력 순서대로 id 반환
+        if creates:
+            created_ids = (
+                await db.execute(
+                    insert(Prayer).returning(Prayer.id, sort_by_parameter_order=True),
+                    [values for _, values in creates]
+                )
+            ).scalars().all()
+            for (index, _), prayer_id in zip(creates, created_ids):
+                results[index] = PrayerBulkResult(
+                    index=index, op="create", id=prayer_id, status=HTTPStatus.CREATED
+                )
+        
+        # 수정/응답: 기본 키 기준 일괄 UPDATE (소유 확인은 위 조회에서 완료)
+        if updates:
+            await db.execute(update(Prayer), updates)
+        
+        if deletes:
+            await db.execute(
+                delete(Prayer)
+                .where(
+                    Prayer.user_id == user_id,
+                    Prayer.id.in_(deletes)
+                )
+                .execution_options(synchronize_session=False)
+            )
+        
+        if changes:
+            await SummaryService.apply_changes(db, user_id, changes)
+            await db.commit()
+        
+        return results
+    
     @staticmethod
     def calculate_prayer_days(prayer: Prayer) -> int:
         """기도 일수 계산"""
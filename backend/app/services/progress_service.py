@@ -1,10 +1,39 @@
-from typing import Optional, List
+from collections import defaultdict
+from http import HTTPStatus
+from typing import AsyncIterator, Optional, List, Dict, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, insert, update, func, and_, values, column, Integer, Date
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
 from app.models.prayer import Prayer
 from app.models.prayer_progress import PrayerProgress
-from app.schemas.prayer_progress import ProgressCreate, ProgressUpdate
+from app.schemas.prayer_progress import (
+    ProgressCreate,
+    ProgressUpdate,
+    ProgressResponse,
+    ProgressBatchItem,
+    ProgressBatchResult
+)
+from app.services.summary_service import SummaryService
+from app.utils.pagination import (
+    SortColumns,
+    encode_cursor,
+    decode_cursor,
+    order_by_clauses,
+    keyset_condition
+)
+
+
+# 응답 과정 타임라인/피드 정렬 (최근 기록순, ix_prayer_progress_prayer_timeline / user_timeline)
+PROGRESS_TIMELINE_SORT = "recorded_date_desc"
+PROGRESS_TIMELINE_COLUMNS: SortColumns = [
+    (PrayerProgress.recorded_date, True),
+    (PrayerProgress.id, True),
+]
+
+# NDJSON 스트리밍 시 서버 측 커서에서 한 번에 가져오는 행 수
+PROGRESS_STREAM_CHUNK_SIZE = 500
 
 
 class ProgressService:
@@ -18,22 +47,36 @@ class ProgressService:
         progress_data: ProgressCreate
     ) -> Optional[PrayerProgress]:
         """응답 과정 생성"""
-        # 기도가 사용자 소유인지 확인
+        # 소유 확인과 집계 갱신을 한 번에 (기도 행 잠금으로 동시 추가에도 안전)
         prayer_result = await db.execute(
-            select(Prayer).where(
+            update(Prayer)
+            .where(
                 and_(
                     Prayer.id == prayer_id,
                     Prayer.user_id == user_id
                 )
             )
+            .values(
+                progress_count=Prayer.progress_count + 1,
+                last_progress_date=func.greatest(
+                    Prayer.last_progress_date,
+                    progress_data.recorded_date
+                ),
+                # 집계 갱신은 기도 수정으로 보지 않음
+                updated_at=Prayer.updated_at
+            )
+            .returning(Prayer.id)
+            .execution_options(synchronize_session=False)
         )
-        prayer = prayer_result.scalar_one_or_none()
         
-        if not prayer:
+        if prayer_result.scalar_one_or_none() is None:
             return None
         
+        await SummaryService.bump_version(db, user_id)
+        
         progress = PrayerProgress(
             prayer_id=prayer_id,
+            user_id=user_id,
             content=progress_data.content,
             recorded_date=progress_data.recorded_date,
             tags=progress_data.tags
@@ -45,35 +88,200 @@ class ProgressService:
         
         return progress
     
+    @staticmethod
+    async def create_progress_batch(
+        db: AsyncSession,
+        user_id: UUID,
+        items: List[ProgressBatchItem]
+    ) -> List[ProgressBatchResult]:
+        """여러 기도에 응답 과정 일괄 추가 (단일 트랜잭션)
+        
+        기도별 추가 개수로 집계를 갱신하는 UPDATE ... FROM (VALUES) 한 번으로 소유 확인과
+        행 잠금을 함께 처리하고, 소유한 기도의 기록만 다중 행 INSERT로 추가합니다.
+        """
+        # 기도별 추가 개수와 가장 최근 기록일
+        added = defaultdict(lambda: [0, None])
+        for item in items:
+            counter = added[item.prayer_id]
+            counter[0] += 1
+            counter[1] = max(counter[1] or item.recorded_date, item.recorded_date)
+        
+        batch = values(
+            column("prayer_id", PG_UUID(as_uuid=True)),
+            column("added", Integer),
+            column("last_date", Date),
+            name="batch"
+        ).data([(prayer_id, count, last_date) for prayer_id, (count, last_date) in added.items()])
+        
+        prayer_result = await db.execute(
+            update(Prayer)
+            .where(
+                and_(
+                    Prayer.id == batch.c.prayer_id,
+                    Prayer.user_id == user_id
+                )
+            )
+            .values(
+                progress_count=Prayer.progress_count + batch.c.added,
+                last_progress_date=func.greatest(Prayer.last_progress_date, batch.c.last_date),
+                # 집계 갱신은 기도 수정으로 보지 않음
+                updated_at=Prayer.updated_at
+            )
+            .returning(Prayer.id)
+            .execution_options(synchronize_session=False)
+        )
+        owned = set(prayer_result.scalars().all())
+        
+        results: List[Optional[ProgressBatchResult]] = [None] * len(items)
+        inserts = []
+        for index, item in enumerate(items):
+            if item.prayer_id in owned:
+                inserts.append((index, {
+                    "prayer_id": item.prayer_id,
+                    "user_id": user_id,
+                    "content": item.content,
+                    "recorded_date": item.recorded_date,
+                    "tags": item.tags
+                }))
+            else:
+                results[index] = ProgressBatchResult(
+                    index=index, prayer_id=item.prayer_id,
+                    status=HTTPStatus.NOT_FOUND, error="Prayer not found"
+                )
+        
+        if inserts:
+            progress_ids = (
+                await db.execute(
+                    insert(PrayerProgress).returning(PrayerProgress.id, sort_by_parameter_order=True),
+                    [row for _, row in inserts]
+                )
+            ).scalars().all()
+            for (index, row), progress_id in zip(inserts, progress_ids):
+                results[index] = ProgressBatchResult(
+                    index=index, prayer_id=row["prayer_id"], id=progress_id,
+                    status=HTTPStatus.CREATED
+                )
+            
+            await SummaryService.bump_version(db, user_id)
+            await db.commit()
+        
+        return results
+    
     @staticmethod
     async def get_progress_list(
+        db: AsyncSession,
+        prayer_id: UUID,
+        user_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Optional[Tuple[List[PrayerProgress], int, Optional[str]]]:
+        """특정 기도의 응답 과정 목록 조회 (최근 기록순)
+        
+        (응답 과정 목록, 전체 개수, 다음 커서)를 반환하고 기도가 없으면 None을 반환합니다.
+        limit이 없으면 커서 이후 전체를 반환합니다. 잘못된 cursor는 ValueError를 발생시킵니다.
+        """
+        total = await ProgressService.get_owned_progress_count(db, prayer_id, user_id)
+        
+        if total is None:
+            return None
+        
+        items, next_cursor = await ProgressService.get_progress_page(db, prayer_id, limit, cursor)
+        return items, total, next_cursor
+    
+    @staticmethod
+    async def get_owned_progress_count(
         db: AsyncSession,
         prayer_id: UUID,
         user_id: UUID
-    ) -> Optional[List[PrayerProgress]]:
-        """특정 기도의 응답 과정 목록 조회"""
-        # 기도가 사용자 소유인지 확인
-        prayer_result = await db.execute(
-            select(Prayer).where(
+    ) -> Optional[int]:
+        """사용자 소유 기도의 응답 과정 수 (기도가 없으면 None)"""
+        result = await db.execute(
+            select(Prayer.progress_count).where(
                 and_(
                     Prayer.id == prayer_id,
                     Prayer.user_id == user_id
                 )
             )
         )
-        prayer = prayer_result.scalar_one_or_none()
+        return result.scalar_one_or_none()
+    
+    @staticmethod
+    async def get_progress_page(
+        db: AsyncSession,
+        prayer_id: UUID,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[PrayerProgress], Optional[str]]:
+        """응답 과정 타임라인 한 페이지와 다음 커서 (소유 확인은 호출하는 쪽에서)"""
+        query = ProgressService.timeline_query(prayer_id, cursor)
+        if limit is not None:
+            # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+            query = query.limit(limit + 1)
         
-        if not prayer:
-            return None
+        items = list((await db.execute(query)).scalars().all())
         
-        # 응답 과정 조회
-        result = await db.execute(
+        next_cursor = None
+        if limit is not None and len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(PROGRESS_TIMELINE_SORT, [last.recorded_date, last.id])
+        
+        return items, next_cursor
+    
+    @staticmethod
+    def timeline_query(prayer_id: UUID, cursor: Optional[str] = None) -> Select:
+        """기도의 응답 과정 타임라인 조회 쿼리 ((recorded_date, id) 내림차순, 커서 이후)"""
+        query = (
             select(PrayerProgress)
             .where(PrayerProgress.prayer_id == prayer_id)
-            .order_by(PrayerProgress.recorded_date.desc())
+            .order_by(*order_by_clauses(PROGRESS_TIMELINE_COLUMNS))
         )
+        if cursor:
+            values = decode_cursor(cursor, PROGRESS_TIMELINE_SORT, PROGRESS_TIMELINE_COLUMNS)
+            query = query.where(keyset_condition(PROGRESS_TIMELINE_COLUMNS, values))
+        return query
+    
+    @staticmethod
+    async def get_progress_feed(
+        db: AsyncSession,
+        user_id: UUID,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[PrayerProgress], Optional[str]]:
+        """사용자의 모든 기도에 걸친 응답 과정 피드 (최근 기록순, 커서 페이지네이션)
         
-        return list(result.scalars().all())
+        ix_prayer_progress_user_timeline 인덱스만으로 처리하며 prayers와 조인하지 않습니다.
+        잘못된 cursor는 ValueError를 발생시킵니다.
+        """
+        query = (
+            select(PrayerProgress)
+            .where(PrayerProgress.user_id == user_id)
+            .order_by(*order_by_clauses(PROGRESS_TIMELINE_COLUMNS))
+            .limit(limit + 1)
+        )
+        if cursor:
+            values = decode_cursor(cursor, PROGRESS_TIMELINE_SORT, PROGRESS_TIMELINE_COLUMNS)
+            query = query.where(keyset_condition(PROGRESS_TIMELINE_COLUMNS, values))
+        
+        items = list((await db.execute(query)).scalars().all())
+        
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(PROGRESS_TIMELINE_SORT, [last.recorded_date, last.id])
+        
+        return items, next_cursor
+    
+    @staticmethod
+    async def stream_progress(db: AsyncSession, query: Select) -> AsyncIterator[str]:
+        """타임라인 쿼리를 서버 측 커서로 읽어 NDJSON 청크로 반환"""
+        result = await db.stream(query.execution_options(yield_per=PROGRESS_STREAM_CHUNK_SIZE))
+        async for chunk in result.scalars().partitions():
+            yield "".join(
+                ProgressResponse.model_validate(progress).model_dump_json() + "\n"
+                for progress in chunk
+            )
     
     @staticmethod
     async def get_progress_by_id(
@@ -81,14 +289,12 @@ class ProgressService:
         progress_id: UUID,
         user_id: UUID
     ) -> Optional[PrayerProgress]:
-        """특정 응답 과정 조회"""
+        """특정 응답 과정 조회 (비정규화된 user_id로 소유 확인)"""
         result = await db.execute(
-            select(PrayerProgress)
-            .join(Prayer)
-            .where(
+            select(PrayerProgress).where(
                 and_(
                     PrayerProgress.id == progress_id,
-                    Prayer.user_id == user_id
+                    PrayerProgress.user_id == user_id
                 )
             )
         )
@@ -107,11 +313,21 @@ class ProgressService:
         if not progress:
             return None
         
-        # 업데이트
         update_data = progress_data.model_dump(exclude_unset=True)
+        
+        # 기록 날짜가 바뀌면 기도 행을 먼저 잠그고 마지막 기록일 재계산
+        if "recorded_date" in update_data:
+            await ProgressService._lock_prayer(db, progress.prayer_id)
+        
+        # 업데이트
         for field, value in update_data.items():
             setattr(progress, field, value)
         
+        if "recorded_date" in update_data:
+            await db.flush()
+            await ProgressService._refresh_prayer_counters(db, progress.prayer_id)
+        
+        await SummaryService.bump_version(db, user_id)
         await db.commit()
         await db.refresh(progress)
         
@@ -129,20 +345,112 @@ class ProgressService:
         if not progress:
             return False
         
+        prayer_id = progress.prayer_id
+        await ProgressService._lock_prayer(db, prayer_id)
         await db.delete(progress)
+        await db.flush()
+        await ProgressService._refresh_prayer_counters(db, prayer_id)
+        await SummaryService.bump_version(db, user_id)
         await db.commit()
         
         return True
     
     @staticmethod
-    async def get_progress_count(
-        db: AsyncSession,
-        prayer_id: UUID
-    ) -> int:
-        """특정 기도의 응답 과정 개수"""
-        result = await db.execute(
-            select(func.count())
-            .select_from(PrayerProgress)
-            .where(PrayerProgress.prayer_id == prayer_id)
+    async def _lock_prayer(db: AsyncSession, prayer_id: UUID) -> None:
+        """응답 과정 수정/삭제 전 기도 행 잠금
+        
+        재계산 UPDATE의 하위 쿼리는 문장 시작 시점의 스냅샷을 보므로, 행 잠금을 UPDATE에서
+        기다리면 먼저 커밋된 다른 삭제를 놓칩니다. 잠금을 먼저 잡아 재계산이 항상
+        커밋된 최신 기록을 보도록 합니다.
+        """
+        await db.execute(select(Prayer.id).where(Prayer.id == prayer_id).with_for_update())
+    
+    @staticmethod
+    async def _refresh_prayer_counters(db: AsyncSession, prayer_id: UUID) -> None:
+        """기도의 응답 과정 집계를 현재 기록 기준으로 재계산 (기도 행 잠금 후 호출, 커밋하지 않음)"""
+        await db.execute(
+            update(Prayer)
+            .where(Prayer.id == prayer_id)
+            .values(
+                progress_count=select(func.count(PrayerProgress.id))
+                .where(PrayerProgress.prayer_id == prayer_id)
+                .scalar_subquery(),
+                last_progress_date=select(func.max(PrayerProgress.recorded_date))
+                .where(PrayerProgress.prayer_id == prayer_id)
+                .scalar_subquery(),
+                updated_at=Prayer.updated_at
+            )
+            .execution_options(synchronize_session=False)
         )
-        return result.scalar()
+    
+    @staticmethod
+    async def reconcile_counters(
+        db: AsyncSession,
+        chunk_size: int = 1000
+    ) -> Dict:
+        """모든 기도의 응답 과정 집계를 청크 단위로 재계산하고 불일치 보고
+        
+        청크마다 기도 행을 잠근 뒤 실제 기록과 비교하여 어긋난 행만 수정하고 커밋합니다.
+        """
+        checked = 0
+        drifted = []
+        last_id = None
+        
+        while True:
+            # 청크 대상 기도 잠금
+            chunk_query = select(Prayer.id).order_by(Prayer.id).limit(chunk_size).with_for_update()
+            if last_id is not None:
+                chunk_query = chunk_query.where(Prayer.id > last_id)
+            chunk_ids = list((await db.execute(chunk_query)).scalars().all())
+            
+            if not chunk_ids:
+                break
+            
+            # 저장된 값과 실제 값 비교
+            result = await db.execute(
+                select(
+                    Prayer.id,
+                    Prayer.user_id,
+                    Prayer.progress_count,
+                    Prayer.last_progress_date,
+                    Prayer.updated_at,
+                    func.count(PrayerProgress.id).label("actual_count"),
+                    func.max(PrayerProgress.recorded_date).label("actual_last_date")
+                )
+                .outerjoin(PrayerProgress, PrayerProgress.prayer_id == Prayer.id)
+                .where(Prayer.id.in_(chunk_ids))
+                .group_by(Prayer.id)
+            )
+            
+            fixes = []
+            drifted_users = set()
+            for row in result.all():
+                if (row.progress_count, row.last_progress_date) != (row.actual_count, row.actual_last_date):
+                    drifted.append({
+                        "prayer_id": row.id,
+                        "progress_count": row.progress_count,
+                        "actual_count": row.actual_count,
+                        "last_progress_date": row.last_progress_date,
+                        "actual_last_date": row.actual_last_date
+                    })
+                    fixes.append({
+                        "id": row.id,
+                        "progress_count": row.actual_count,
+                        "last_progress_date": row.actual_last_date,
+                        "updated_at": row.updated_at
+                    })
+                    drifted_users.add(row.user_id)
+            
+            if fixes:
+                await db.execute(update(Prayer), fixes)
+            
+            # 목록에 보이는 집계가 바뀌었으므로 캐시된 응답 무효화
+            for user_id in drifted_users:
+                await SummaryService.bump_version(db, user_id)
+            
+            await db.commit()
+            
+            checked += len(chunk_ids)
+            last_id = chunk_ids[-1]
+        
+        return {"checked": checked, "drifted": drifted}
@@ -0,0 +1,166 @@
+import html
+import re
+from typing import Optional, List
+from uuid import UUID
+from sqlalchemy import select, func, cast, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement
+from app.models.prayer import Prayer
+from app.models.prayer_progress import PrayerProgress
+from app.schemas.search import SearchHit
+
+
+# 한글은 형태소 분석 사전이 없으므로 공백 단위로만 나누는 simple 설정 사용
+SEARCH_CONFIG = "simple"
+
+# 검색 결과 스니펫 강조 옵션
+# 사용자 내용을 HTML 이스케이프한 뒤 <mark>로 바꿀 수 있도록 제어 문자로 강조 구간 표시
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f'StartSel="{HIGHLIGHT_START}", StopSel="{HIGHLIGHT_STOP}", '
+    "MaxWords=30, MinWords=10, MaxFragments=2"
+)
+
+# tsquery 문법에 쓰이는 특수 문자
+TSQUERY_SPECIAL_CHARS = re.compile(r"[&|!():*<>'\\]")
+
+
+class SearchService:
+    """검색 관련 비즈니스 로직"""
+    
+    @staticmethod
+    def highlight(headline: str) -> str:
+        """ts_headline 결과를 HTML 이스케이프하고 강조 구간만 <mark>로 감싸기"""
+        return (
+            html.escape(headline)
+            .replace(HIGHLIGHT_START, "<mark>")
+            .replace(HIGHLIGHT_STOP, "</mark>")
+        )
+    
+    @staticmethod
+    def build_tsquery(search: str) -> Optional[ColumnElement]:
+        """검색어를 단어별 접두어 일치 tsquery로 변환
+        
+        '기도'로 '기도를', '기도가'처럼 조사가 붙은 단어도 찾을 수 있도록
+        각 단어를 접두어(:*) 검색으로 만들고 AND로 묶습니다.
+        """
+        terms = TSQUERY_SPECIAL_CHARS.sub(" ", search).split()
+        if not terms:
+            return None
+        
+        query_text = " & ".join(f"'{term}':*" for term in terms)
+        return func.to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), query_text)
+    
+    @staticmethod
+    def prayer_match(search: str) -> ColumnElement:
+        """기도 검색 조건 (tsvector GIN 인덱스 + 부분 문자열용 trigram 인덱스)"""
+        search_term = f"%{search}%"
+        conditions = [
+            Prayer.title.ilike(search_term),
+            Prayer.content.ilike(search_term)
+        ]
+        
+        tsquery = SearchService.build_tsquery(search)
+        if tsquery is not None:
+            conditions.insert(0, Prayer.search_vector.op("@@")(tsquery))
+        
+        return or_(*conditions)
+    
+    @staticmethod
+    def progress_match(search: str) -> ColumnElement:
+        """응답 과정 검색 조건"""
+        conditions = [PrayerProgress.content.ilike(f"%{search}%")]
+        
+        tsquery = SearchService.build_tsquery(search)
+        if tsquery is not None:
+            conditions.insert(0, PrayerProgress.search_vector.op("@@")(tsquery))
+        
+        return or_(*conditions)
+    
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        user_id: UUID,
+        search: str,
+        limit: int = 20
+    ) -> List[SearchHit]:
+        """기도와 응답 과정 통합 검색 (관련도순, 강조 스니펫 포함)"""
+        tsquery = SearchService.build_tsquery(search)
+        if tsquery is None:
+            return []
+        
+        config = cast(SEARCH_CONFIG, REGCONFIG)
+        
+        # 기도: 전문 검색 순위 + 제목 유사도
+        prayer_rank = (
+            func.ts_rank(Prayer.search_vector, tsquery)
+            + func.word_similarity(search, Prayer.title)
+        ).label("rank")
+        prayer_result = await db.execute(
+            select(
+                Prayer.id,
+                Prayer.title,
+                func.ts_headline(config, Prayer.content, tsquery, HEADLINE_OPTIONS).label("snippet"),
+                prayer_rank
+            )
+            .where(
+                Prayer.user_id == user_id,
+                SearchService.prayer_match(search)
+            )
+            .order_by(prayer_rank.desc())
+            .limit(limit)
+        )
+        
+        # 응답 과정: 전문 검색 순위 + 내용 유사도
+        progress_rank = (
+            func.ts_rank(PrayerProgress.search_vector, tsquery)
+            + func.word_similarity(search, PrayerProgress.content)
+        ).label("rank")
+        progress_result = await db.execute(
+            select(
+                PrayerProgress.id,
+                PrayerProgress.prayer_id,
+                PrayerProgress.recorded_date,
+                # 소유 확인은 비정규화된 user_id로 하고, 제목은 결과 행에 대해서만 조회
+                select(Prayer.title)
+                .where(Prayer.id == PrayerProgress.prayer_id)
+                .scalar_subquery()
+                .label("title"),
+                func.ts_headline(config, PrayerProgress.content, tsquery, HEADLINE_OPTIONS).label("snippet"),
+                progress_rank
+            )
+            .where(
+                PrayerProgress.user_id == user_id,
+                SearchService.progress_match(search)
+            )
+            .order_by(progress_rank.desc())
+            .limit(limit)
+        )
+        
+        hits = [
+            SearchHit(
+                type="prayer",
+                prayer_id=row.id,
+                title=row.title,
+                snippet=SearchService.highlight(row.snippet),
+                rank=row.rank
+            )
+            for row in prayer_result.all()
+        ]
+        hits.extend(
+            SearchHit(
+                type="progress",
+                prayer_id=row.prayer_id,
+                progress_id=row.id,
+                recorded_date=row.recorded_date,
+                title=row.title,
+                snippet=SearchService.highlight(row.snippet),
+                rank=row.rank
+            )
+            for row in progress_result.all()
+        )
+        
+        hits.sort(key=lambda hit: hit.rank, reverse=True)
+        return hits[:limit]
@@ -1,9 +1,30 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, FrozenSet
 from uuid import UUID
-from sqlalchemy import select, func
+from sqlalchemy import select, bindparam, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.prayer import Prayer, PrayerStatus
 from app.schemas.dashboard import SubjectStats
+from app.schemas.prayer import PrayerWithProgress
+from app.services.prayer_service import PrayerService
+from app.services.summary_service import SummaryService
+
+
+# 대시보드 요청마다 실행되는 조회 문장 (값은 바인드 파라미터, 모듈 로드 시 한 번만 구성)
+RECENT_PRAYERS = (
+    select(Prayer)
+    .where(Prayer.user_id == bindparam("user_id"))
+    .order_by(Prayer.created_at.desc())
+    .limit(bindparam("limit"))
+)
+ANSWERED_WITHOUT_CONTENT = (
+    select(Prayer)
+    .where(
+        Prayer.user_id == bindparam("user_id"),
+        Prayer.status == PrayerStatus.ANSWERED,
+        Prayer.answer_content.is_(None)
+    )
+    .order_by(Prayer.answer_date.desc())
+)
 
 
 class StatsService:
@@ -11,94 +32,134 @@ class StatsService:
     
     @staticmethod
     async def get_dashboard_stats(db: AsyncSession, user_id: UUID) -> Dict:
-        """대시보드 통계 조회"""
-        # 전체 기도 개수
-        total_result = await db.execute(
-            select(func.count())
-            .select_from(Prayer)
-            .where(Prayer.user_id == user_id)
-        )
-        total_prayers = total_result.scalar()
+        """대시보드 통계 조회 (user_prayer_stats 요약 행 하나만 읽음)"""
+        summary = await SummaryService.get_summary(db, user_id)
         
-        # 진행 중인 기도 개수
-        active_result = await db.execute(
-            select(func.count())
-            .select_from(Prayer)
-            .where(
-                Prayer.user_id == user_id,
-                Prayer.status == PrayerStatus.ACTIVE
-            )
-        )
-        active_prayers = active_result.scalar()
+        if summary is None:
+            return await StatsService.compute_dashboard_stats(db, user_id)
         
-        # 응답받은 기도 개수
-        answered_result = await db.execute(
-            select(func.count())
-            .select_from(Prayer)
-            .where(
-                Prayer.user_id == user_id,
-                Prayer.status == PrayerStatus.ANSWERED
-            )
-        )
-        answered_prayers = answered_result.scalar()
+        total_prayers = summary.total_prayers
+        answered_prayers = summary.answered_prayers
         
         # 응답률 계산
         answer_rate = (answered_prayers / total_prayers * 100) if total_prayers > 0 else 0.0
         
-        # 주제별 통계
-        subject_result = await db.execute(
+        return {
+            "total_prayers": total_prayers,
+            "active_prayers": summary.active_prayers,
+            "answered_prayers": answered_prayers,
+            "answered_without_content": summary.answered_without_content,
+            "answer_rate": round(answer_rate, 2),
+            "by_subject": StatsService._subject_stats_from_summary(summary.by_subject)
+        }
+    
+    @staticmethod
+    async def compute_dashboard_stats(db: AsyncSession, user_id: UUID) -> Dict:
+        """대시보드 통계를 prayers 테이블에서 직접 계산 (요약 행이 없을 때)
+        
+        주제별 GROUP BY 결과에 상태별 조건부 집계를 윈도우 합계로 붙여
+        전체/진행 중/응답 개수와 주제별 통계를 한 번의 쿼리로 가져옵니다.
+        """
+        subject_count = func.count()
+        result = await db.execute(
             select(
                 Prayer.subject,
-                func.count(Prayer.id).label("count")
+                subject_count.label("count"),
+                func.sum(subject_count).over().label("total_prayers"),
+                func.sum(
+                    func.count().filter(Prayer.status == PrayerStatus.ACTIVE)
+                ).over().label("active_prayers"),
+                func.sum(
+                    func.count().filter(Prayer.status == PrayerStatus.ANSWERED)
+                ).over().label("answered_prayers"),
+                func.sum(
+                    func.count().filter(
+                        Prayer.status == PrayerStatus.ANSWERED,
+                        Prayer.answer_content.is_(None)
+                    )
+                ).over().label("answered_without_content")
             )
             .where(Prayer.user_id == user_id)
             .group_by(Prayer.subject)
-            .order_by(func.count(Prayer.id).desc())
+            .order_by(subject_count.desc(), Prayer.subject)
         )
+        rows = result.all()
+        
+        # 기도가 없으면 결과 행도 없음
+        total_prayers = int(rows[0].total_prayers) if rows else 0
+        active_prayers = int(rows[0].active_prayers) if rows else 0
+        answered_prayers = int(rows[0].answered_prayers) if rows else 0
+        answered_without_content = int(rows[0].answered_without_content) if rows else 0
+        
+        # 응답률 계산
+        answer_rate = (answered_prayers / total_prayers * 100) if total_prayers > 0 else 0.0
         
         by_subject = [
             SubjectStats(subject=row.subject, count=row.count)
-            for row in subject_result.all()
+            for row in rows
         ]
         
         return {
             "total_prayers": total_prayers,
             "active_prayers": active_prayers,
             "answered_prayers": answered_prayers,
+            "answered_without_content": answered_without_content,
             "answer_rate": round(answer_rate, 2),
             "by_subject": by_subject
         }
     
+    @staticmethod
+    async def get_subject_stats(db: AsyncSession, user_id: UUID) -> List[SubjectStats]:
+        """주제별 통계 조회"""
+        summary = await SummaryService.get_summary(db, user_id)
+        
+        if summary is not None:
+            return StatsService._subject_stats_from_summary(summary.by_subject)
+        
+        result = await db.execute(
+            select(
+                Prayer.subject,
+                func.count(Prayer.id).label("count")
+            )
+            .where(Prayer.user_id == user_id)
+            .group_by(Prayer.subject)
+            .order_by(func.count(Prayer.id).desc(), Prayer.subject)
+        )
+        
+        return [
+            SubjectStats(subject=row.subject, count=row.count)
+            for row in result.all()
+        ]
+    
+    @staticmethod
+    def _subject_stats_from_summary(by_subject: Dict[str, int]) -> List[SubjectStats]:
+        """요약의 주제별 개수를 개수 내림차순 목록으로 변환"""
+        return [
+            SubjectStats(subject=subject, count=count)
+            for subject, count in sorted(by_subject.items(), key=lambda item: (-item[1], item[0]))
+        ]
+    
     @staticmethod
     async def get_recent_prayers(
         db: AsyncSession,
         user_id: UUID,
-        limit: int = 5
-    ) -> List[Prayer]:
-        """최근 기도 목록"""
-        result = await db.execute(
-            select(Prayer)
-            .where(Prayer.user_id == user_id)
-            .order_by(Prayer.created_at.desc())
-            .limit(limit)
+        limit: int = 5,
+        fields: Optional[FrozenSet[str]] = None
+    ) -> List[PrayerWithProgress]:
+        """최근 기도 목록 (응답 과정 개수 포함, fields가 주어지면 해당 필드만)"""
+        return await PrayerService.fetch_with_progress(
+            db,
+            RECENT_PRAYERS,
+            fields,
+            {"user_id": user_id, "limit": limit}
         )
 
-        return list(result.scalars().all())
-
     @staticmethod
     async def get_answered_without_content(
         db: AsyncSession,
         user_id: UUID
     ) -> List[Prayer]:
         """응답 받았지만 내용 미작성 기도 목록"""
-        result = await db.execute(
-            select(Prayer)
-            .where(
-                Prayer.user_id == user_id,
-                Prayer.status == PrayerStatus.ANSWERED,
-                Prayer.answer_content.is_(None)
-            )
-            .order_by(Prayer.answer_date.desc())
-        )
+        result = await db.execute(ANSWERED_WITHOUT_CONTENT, {"user_id": user_id})
 
         return list(result.scalars().all())
@@ -0,0 +1,223 @@
+from collections import Counter
+from typing import Iterable, Optional, NamedTuple, Tuple
+from uuid import UUID
+from sqlalchemy import select, update, bindparam, func, literal, Integer
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.replica import record_user_write
+from app.models.prayer import Prayer, PrayerStatus
+from app.models.user import User
+from app.models.user_prayer_stats import UserPrayerStats
+
+
+# 요청마다 실행되는 조회 문장 (값은 바인드 파라미터, 모듈 로드 시 한 번만 구성)
+DATA_VERSION = select(UserPrayerStats.data_version).where(
+    UserPrayerStats.user_id == bindparam("user_id")
+)
+SUMMARY = (
+    select(UserPrayerStats)
+    .where(UserPrayerStats.user_id == bindparam("user_id"))
+    .execution_options(populate_existing=True)
+)
+
+
+class PrayerSnapshot(NamedTuple):
+    """통계 요약에 영향을 주는 기도 속성"""
+    status: PrayerStatus
+    subject: str
+    answered_without_content: bool
+
+
+class SummaryService:
+    """사용자별 기도 통계 요약(user_prayer_stats) 관리"""
+
+    @staticmethod
+    def snapshot(prayer: Prayer) -> PrayerSnapshot:
+        """기도의 현재 상태를 요약 계산용으로 저장"""
+        return PrayerSnapshot(
+            status=prayer.status,
+            subject=prayer.subject,
+            answered_without_content=(
+                prayer.status == PrayerStatus.ANSWERED and prayer.answer_content is None
+            )
+        )
+
+    @staticmethod
+    async def apply_change(
+        db: AsyncSession,
+        user_id: UUID,
+        before: Optional[PrayerSnapshot],
+        after: Optional[PrayerSnapshot]
+    ) -> None:
+        """기도 생성/수정/삭제에 따른 요약 증감과 데이터 버전 반영 (커밋하지 않음)
+
+        생성은 before=None, 삭제는 after=None으로 호출합니다.
+        요약에 영향이 없는 수정이어도 데이터 버전은 증가합니다.
+        """
+        await SummaryService.apply_changes(db, user_id, [(before, after)])
+
+    @staticmethod
+    async def apply_changes(
+        db: AsyncSession,
+        user_id: UUID,
+        changes: Iterable[Tuple[Optional[PrayerSnapshot], Optional[PrayerSnapshot]]]
+    ) -> None:
+        """여러 기도 변경의 요약 증감을 한 번의 UPDATE로 반영 (커밋하지 않음)"""
+        totals = Counter()
+        subjects = Counter()
+        for before, after in changes:
+            for snapshot, sign in ((before, -1), (after, 1)):
+                if snapshot is None:
+                    continue
+                totals["total_prayers"] += sign
+                if snapshot.status == PrayerStatus.ACTIVE:
+                    totals["active_prayers"] += sign
+                else:
+                    totals["answered_prayers"] += sign
+                if snapshot.answered_without_content:
+                    totals["answered_without_content"] += sign
+                subjects[snapshot.subject] += sign
+
+        # 주제별 개수: 증감 후 0이 된 주제는 제거
+        by_subject = UserPrayerStats.by_subject
+        for subject, delta in subjects.items():
+            if delta == 0:
+                continue
+            current = func.coalesce(
+                UserPrayerStats.by_subject[subject].astext.cast(Integer),
+                0
+            )
+            by_subject = by_subject.op("||")(
+                func.jsonb_build_object(subject, func.nullif(current + delta, 0))
+            )
+
+        values = {
+            field: getattr(UserPrayerStats, field) + delta
+            for field, delta in totals.items()
+            if delta != 0
+        }
+        if any(subjects.values()):
+            values["by_subject"] = func.jsonb_strip_nulls(by_subject)
+        values["data_version"] = UserPrayerStats.data_version + 1
+        record_user_write(db, user_id)
+
+        result = await db.execute(
+            update(UserPrayerStats)
+            .where(UserPrayerStats.user_id == user_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+        # 요약 행이 없던 사용자는 원본 테이블에서 새로 계산
+        if result.rowcount == 0:
+            await SummaryService.rebuild(db, user_id)
+
+    @staticmethod
+    async def bump_version(db: AsyncSession, user_id: UUID) -> None:
+        """요약 개수에 영향이 없는 쓰기(응답 과정 등)의 데이터 버전 증가 (커밋하지 않음)"""
+        record_user_write(db, user_id)
+        result = await db.execute(
+            update(UserPrayerStats)
+            .where(UserPrayerStats.user_id == user_id)
+            .values(data_version=UserPrayerStats.data_version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+        if result.rowcount == 0:
+            await SummaryService.rebuild(db, user_id)
+
+    @staticmethod
+    async def get_version(db: AsyncSession, user_id: UUID) -> Optional[int]:
+        """사용자 데이터 버전 조회 (요약 행이 없으면 None)"""
+        result = await db.execute(DATA_VERSION, {"user_id": user_id})
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def get_summary(
+        db: AsyncSession,
+        user_id: UUID
+    ) -> Optional[UserPrayerStats]:
+        """사용자 통계 요약 조회"""
+        result = await db.execute(SUMMARY, {"user_id": user_id})
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def rebuild(
+        db: AsyncSession,
+        user_id: Optional[UUID] = None
+    ) -> int:
+        """prayers 테이블에서 요약을 다시 계산하여 저장 (커밋하지 않음)
+
+        user_id가 없으면 모든 사용자를 대상으로 하며, 갱신된 사용자 수를 반환합니다.
+        재계산된 사용자의 데이터 버전도 증가합니다.
+        """
+        # 사용자 x 주제별 집계
+        per_subject = (
+            select(
+                Prayer.user_id,
+                Prayer.subject,
+                func.count().label("total"),
+                func.count().filter(Prayer.status == PrayerStatus.ACTIVE).label("active"),
+                func.count().filter(Prayer.status == PrayerStatus.ANSWERED).label("answered"),
+                func.count().filter(
+                    Prayer.status == PrayerStatus.ANSWERED,
+                    Prayer.answer_content.is_(None)
+                ).label("without_content")
+            )
+            .group_by(Prayer.user_id, Prayer.subject)
+        )
+        if user_id is not None:
+            per_subject = per_subject.where(Prayer.user_id == user_id)
+        per_subject = per_subject.subquery()
+
+        # 사용자별 합계 (기도가 없는 사용자도 0으로 포함)
+        summary = (
+            select(
+                User.id,
+                func.coalesce(func.sum(per_subject.c.total), 0),
+                func.coalesce(func.sum(per_subject.c.active), 0),
+                func.coalesce(func.sum(per_subject.c.answered), 0),
+                func.coalesce(func.sum(per_subject.c.without_content), 0),
+                func.coalesce(
+                    func.jsonb_object_agg(per_subject.c.subject, per_subject.c.total)
+                    .filter(per_subject.c.subject.isnot(None)),
+                    literal({}, UserPrayerStats.by_subject.type)
+                ),
+                func.timezone("utc", func.now()),
+                literal(1, UserPrayerStats.data_version.type)
+            )
+            .outerjoin(per_subject, per_subject.c.user_id == User.id)
+            .group_by(User.id)
+        )
+        if user_id is not None:
+            summary = summary.where(User.id == user_id)
+            record_user_write(db, user_id)
+
+        stmt = insert(UserPrayerStats).from_select(
+            [
+                "user_id",
+                "total_prayers",
+                "active_prayers",
+                "answered_prayers",
+                "answered_without_content",
+                "by_subject",
+                "updated_at",
+                "data_version"
+            ],
+            summary
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserPrayerStats.user_id],
+            set_={
+                "total_prayers": stmt.excluded.total_prayers,
+                "active_prayers": stmt.excluded.active_prayers,
+                "answered_prayers": stmt.excluded.answered_prayers,
+                "answered_without_content": stmt.excluded.answered_without_content,
+                "by_subject": stmt.excluded.by_subject,
+                "updated_at": stmt.excluded.updated_at,
+                "data_version": UserPrayerStats.data_version + 1
+            }
+        )
+
+        result = await db.execute(stmt)
+        return result.rowcount
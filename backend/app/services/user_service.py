@@ -1,10 +1,50 @@
 from typing import Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import bindparam, event, inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.core.config import settings
 from app.models.user import User
+from app.models.user_prayer_stats import UserPrayerStats
 from app.schemas.user import UserCreate
-from app.core.security import get_password_hash, verify_password
+from app.core.security import get_password_hash_async, verify_password_async
+from app.utils.cache import TTLCache
+
+
+# 인증된 사용자 캐시 (ID -> 세션에 속하지 않은 User 사본)
+user_cache: TTLCache[User] = TTLCache(
+    "user",
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
+# 로그인/인증마다 실행되는 조회 문장 (값은 바인드 파라미터, 모듈 로드 시 한 번만 구성)
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
+
+def _detached_copy(user: User) -> User:
+    """요청 세션과 분리된 User 사본 (다른 요청에서 읽기 전용으로 공유)"""
+    copy = User(**{column.key: getattr(user, column.key) for column in User.__table__.columns})
+    make_transient_to_detached(copy)
+    return copy
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target: User) -> None:
+    """ORM으로 사용자를 수정/삭제하면 캐시에서 제거"""
+    user_cache.delete(target.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_users_on_bulk_write(orm_execute_state) -> None:
+    """update(User)/delete(User) 문은 대상 ID를 알 수 없으므로 캐시 전체 비우기"""
+    if (
+        (orm_execute_state.is_update or orm_execute_state.is_delete)
+        and orm_execute_state.bind_mapper is inspect(User)
+    ):
+        user_cache.clear()
 
 
 class UserService:
@@ -13,23 +53,34 @@ class UserService:
     @staticmethod
     async def get_by_email(db: AsyncSession, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
-        result = await db.execute(
-            select(User).where(User.email == email)
-        )
+        result = await db.execute(USER_BY_EMAIL, {"email": email})
         return result.scalar_one_or_none()
     
     @staticmethod
     async def get_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
         """ID로 사용자 조회"""
-        result = await db.execute(
-            select(User).where(User.id == user_id)
-        )
+        result = await db.execute(USER_BY_ID, {"user_id": user_id})
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_cached_by_id(db: AsyncSession, user_id: UUID) -> Optional[User]:
+        """ID로 사용자 조회 (캐시 우선, 반환값은 세션에 속하지 않은 읽기 전용 사본)"""
+        user = user_cache.get(user_id)
+        if user is not None:
+            return user
+
+        user = await UserService.get_by_id(db, user_id)
+        if user is None:
+            return None
+
+        user = _detached_copy(user)
+        user_cache.set(user_id, user)
+        return user
+    
     @staticmethod
     async def create_user(db: AsyncSession, user_data: UserCreate) -> User:
-        """사용자 생성"""
-        hashed_password = get_password_hash(user_data.password)
+        """사용자 생성 (해싱 대기열이 가득 차면 PasswordHasherBusy)"""
+        hashed_password = await get_password_hash_async(user_data.password)
         
         user = User(
             email=user_data.email,
@@ -38,6 +89,10 @@ class UserService:
         )
         
         db.add(user)
+        await db.flush()
+        
+        # 빈 통계 요약 행 생성
+        db.add(UserPrayerStats(user_id=user.id))
         await db.commit()
         await db.refresh(user)
         
@@ -49,13 +104,13 @@ class UserService:
         email: str,
         password: str
     ) -> Optional[User]:
-        """사용자 인증"""
+        """사용자 인증 (해싱 대기열이 가득 차면 PasswordHasherBusy)"""
         user = await UserService.get_by_email(db, email)
         
         if not user:
             return None
         
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password_async(password, user.hashed_password):
             return None
         
         return user
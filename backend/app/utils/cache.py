@@ -0,0 +1,61 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+from app.core import metrics
+
+
+V = TypeVar("V")
+
+CACHE_REQUESTS = metrics.counter(
+    "cache_requests_total",
+    "In-process cache lookups by cache name and result",
+    ["cache", "result"]
+)
+
+
+class TTLCache(Generic[V]):
+    """만료 시간이 있는 LRU 캐시 (프로세스 내, 이벤트 루프 스레드에서 사용)
+
+    maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    항목마다 ttl(초)이 지나면 조회 시 없는 것으로 처리합니다.
+    조회 결과는 cache_requests_total{cache=name}에 기록됩니다.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # 키 -> (만료 시각(monotonic), 값)
+        self._items: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: Hashable) -> Optional[V]:
+        item = self._items.get(key)
+        if item is not None and item[0] > time.monotonic():
+            self._items.move_to_end(key)
+            CACHE_REQUESTS.inc(cache=self.name, result="hit")
+            return item[1]
+
+        if item is not None:
+            del self._items[key]
+        CACHE_REQUESTS.inc(cache=self.name, result="miss")
+        return None
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl을 주면 기본 ttl 대신 사용, 0 이하이면 저장하지 않음)"""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+
+        self._items[key] = (time.monotonic() + ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
@@ -0,0 +1,37 @@
+from functools import lru_cache
+from typing import FrozenSet, Optional, Type
+from pydantic import BaseModel, create_model
+
+
+def parse_fields(
+    fields: Optional[str],
+    model: Type[BaseModel],
+    required: FrozenSet[str] = frozenset({"id"})
+) -> Optional[FrozenSet[str]]:
+    """쉼표로 구분된 fields 파라미터를 필드 이름 집합으로 변환
+
+    값이 없으면 None(전체 필드)을 반환하고, 모델에 없는 필드는 ValueError를 발생시킵니다.
+    """
+    if not fields:
+        return None
+
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    if not names:
+        return None
+
+    unknown = names - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    return frozenset(names | required)
+
+
+@lru_cache(maxsize=256)
+def sparse_model(model: Type[BaseModel], fields: FrozenSet[str]) -> Type[BaseModel]:
+    """선택한 필드만 가진 응답 모델 생성 (필드 조합별로 캐시)"""
+    definitions = {
+        name: (info.annotation, info)
+        for name, info in model.model_fields.items()
+        if name in fields
+    }
+    return create_model(f"{model.__name__}Fields", **definitions)
@@ -0,0 +1,67 @@
+import base64
+import json
+from typing import Any, List, Sequence, Tuple
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import tuple_
+from sqlalchemy.sql import ColumnElement
+
+
+# 정렬 컬럼 정의: (컬럼 또는 표현식, 내림차순 여부)
+SortColumns = Sequence[Tuple[ColumnElement, bool]]
+
+
+def _serialize(value: Any) -> Any:
+    """커서에 담을 수 있는 JSON 값으로 변환"""
+    if value is None or isinstance(value, (int, float, str)):
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(sort_key: str, values: Sequence[Any]) -> str:
+    """정렬 키와 마지막 행의 정렬 값으로 불투명 커서 생성"""
+    payload = {"s": sort_key, "v": [_serialize(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, columns: SortColumns) -> List[Any]:
+    """커서를 정렬 값 목록으로 복원 (형식 오류 시 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        values = payload["v"]
+        cursor_sort_key = payload["s"]
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    if cursor_sort_key != sort_key or len(values) != len(columns):
+        raise ValueError("Cursor does not match sort order")
+
+    try:
+        return [
+            TypeAdapter(column.type.python_type).validate_python(value)
+            for (column, _), value in zip(columns, values)
+        ]
+    except ValidationError:
+        raise ValueError("Invalid cursor")
+
+
+def order_by_clauses(columns: SortColumns) -> List[ColumnElement]:
+    """정렬 컬럼 정의를 ORDER BY 절로 변환"""
+    return [column.desc() if desc else column.asc() for column, desc in columns]
+
+
+def keyset_condition(columns: SortColumns, values: Sequence[Any]) -> ColumnElement:
+    """커서 이후 행만 선택하는 조건 (행 값 비교로 인덱스 사용)"""
+    directions = {desc for _, desc in columns}
+    if len(directions) != 1:
+        raise ValueError("Keyset pagination requires a single sort direction")
+
+    row = tuple_(*[column for column, _ in columns])
+    boundary = tuple_(*values)
+
+    return row < boundary if directions.pop() else row > boundary
@@ -0,0 +1,98 @@
+"""
+기도 일괄 작업 벤치마크: 단건 POST /prayers 방식 vs POST /prayers/bulk 방식
+
+사용법 (DATABASE_URL의 데이터베이스에 벤치마크용 사용자를 만들고 끝나면 삭제):
+    python -m benchmarks.bulk_benchmark --items 1000
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date
+from sqlalchemy import delete
+from app.core.database import AsyncSessionLocal, engine, init_db
+from app.models.user import User
+from app.models.user_prayer_stats import UserPrayerStats
+from app.schemas.prayer import PrayerCreate, PrayerAnswer, PrayerBulkCreate, PrayerBulkAnswer
+from app.services.prayer_service import PrayerService
+
+
+def make_prayer(i: int) -> PrayerCreate:
+    """벤치마크용 기도 입력"""
+    return PrayerCreate(
+        subject=f"주제 {i % 10}",
+        title=f"기도 {i}",
+        content=f"기도 내용 {i}",
+        prayer_type="간구",
+        start_date=date(2024, 1, 1)
+    )
+
+
+async def create_user() -> uuid.UUID:
+    """벤치마크용 사용자 생성"""
+    user_id = uuid.uuid4()
+    async with AsyncSessionLocal() as session:
+        session.add(User(id=user_id, email=f"bench-{user_id}@example.com", hashed_password="-", name="bench"))
+        session.add(UserPrayerStats(user_id=user_id))
+        await session.commit()
+    return user_id
+
+
+async def run_single(user_id: uuid.UUID, items: int) -> float:
+    """단건 API와 같은 방식으로 생성 + 응답 기록 (항목마다 커밋 및 refresh)"""
+    answer = PrayerAnswer(answer_date=date(2024, 2, 1), answer_content="응답")
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        for i in range(items):
+            prayer = await PrayerService.create_prayer(session, user_id, make_prayer(i))
+            if i % 2 == 0:
+                await PrayerService.answer_prayer(session, prayer.id, user_id, answer)
+    return time.perf_counter() - started
+
+
+async def run_bulk(user_id: uuid.UUID, items: int) -> float:
+    """일괄 API와 같은 방식으로 생성 후 응답 기록 (요청당 한 번 커밋)"""
+    answer = PrayerAnswer(answer_date=date(2024, 2, 1), answer_content="응답")
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        results = await PrayerService.bulk_apply(
+            session,
+            user_id,
+            [PrayerBulkCreate(op="create", data=make_prayer(i)) for i in range(items)]
+        )
+        await PrayerService.bulk_apply(
+            session,
+            user_id,
+            [
+                PrayerBulkAnswer(op="answer", id=result.id, data=answer)
+                for result in results[::2]
+            ]
+        )
+    return time.perf_counter() - started
+
+
+async def main(items: int) -> None:
+    """벤치마크 실행"""
+    await init_db()
+
+    user_ids = [await create_user(), await create_user()]
+    try:
+        single = await run_single(user_ids[0], items)
+        bulk = await run_bulk(user_ids[1], items)
+
+        print(f"{'단건 API 방식':<16} {items}건 {single:8.2f}s  {items / single:10.1f}건/s")
+        print(f"{'일괄 API 방식':<16} {items}건 {bulk:8.2f}s  {items / bulk:10.1f}건/s")
+        print(f"처리량 {single / bulk:.1f}배")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(User).where(User.id.in_(user_ids)))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기도 일괄 작업 벤치마크")
+    parser.add_argument("--items", type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.items))
@@ -0,0 +1,74 @@
+"""
+대량 가져오기 벤치마크: CSV 파일 검증 + COPY 스테이징 + 단일 병합
+
+사용법 (DATABASE_URL의 데이터베이스에 벤치마크용 사용자를 만들고 끝나면 삭제):
+    python -m benchmarks.import_benchmark --rows 1000000
+"""
+import argparse
+import asyncio
+import csv
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+from sqlalchemy import delete
+from app.core.database import AsyncSessionLocal, engine, init_db
+from app.models.user import User
+from app.models.user_prayer_stats import UserPrayerStats
+from app.services.import_service import ImportService
+
+
+def write_journal(file, rows: int) -> None:
+    """기도 하나에 응답 과정 4개씩인 CSV 작성 (행 = 응답 과정)"""
+    writer = csv.writer(file)
+    writer.writerow([
+        "prayer_ref", "subject", "title", "content", "prayer_type", "prayer_targets",
+        "start_date", "progress_content", "progress_recorded_date", "progress_tags"
+    ])
+    for i in range(rows):
+        prayer = i // 4
+        start = date(2015, 1, 1) + timedelta(days=prayer % 3000)
+        writer.writerow([
+            prayer, f"주제 {prayer % 10}", f"기도 {prayer}", f"기도 내용 {prayer} 가족과 건강을 위하여",
+            "간구", '["가족"]', start.isoformat(),
+            f"응답 과정 {i}", (start + timedelta(days=i % 4)).isoformat(), '["감사"]'
+        ])
+
+
+async def main(rows: int) -> None:
+    """벤치마크 실행"""
+    await init_db()
+
+    user_id = uuid.uuid4()
+    async with AsyncSessionLocal() as session:
+        session.add(User(id=user_id, email=f"bench-{user_id}@example.com", hashed_password="-", name="bench"))
+        session.add(UserPrayerStats(user_id=user_id))
+        await session.commit()
+
+    try:
+        with tempfile.TemporaryFile("w+b") as file:
+            with open(file.fileno(), "w", encoding="utf-8", newline="", closefd=False) as text:
+                write_journal(text, rows)
+            file.seek(0)
+
+            started = time.perf_counter()
+            async with AsyncSessionLocal() as session:
+                result = await ImportService.import_file(session, user_id, file, "csv")
+            elapsed = time.perf_counter() - started
+
+        print(f"{'가져온 기도':<12} {result.prayers}건")
+        print(f"{'가져온 응답 과정':<12} {result.progress}건")
+        print(f"{'CSV 행':<12} {rows}행 {elapsed:8.2f}s  {rows / elapsed:10.1f}행/s")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대량 가져오기 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows))
@@ -0,0 +1,110 @@
+"""
+자주 실행되는 조회의 요청당 CPU 시간 벤치마크 (사용자 조회, 기도 목록/개수, 대시보드 통계, 데이터 버전)
+
+요청마다 새 세션으로 서비스 메서드를 호출하고, 프로세스 CPU 시간(time.process_time)을 호출 수로 나눠
+SQL 구성/컴파일/결과 처리에 드는 애플리케이션 측 비용을 비교합니다.
+
+사용법 (DATABASE_URL의 데이터베이스에 벤치마크용 사용자를 만들고 끝나면 삭제):
+    python -m benchmarks.query_cpu_benchmark --iterations 2000 --prayers 50
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date
+from sqlalchemy import delete
+from app.core.database import AsyncSessionLocal, engine, init_db
+from app.models.prayer import PrayerStatus
+from app.models.user import User
+from app.models.user_prayer_stats import UserPrayerStats
+from app.schemas.prayer import PrayerCreate, PrayerBulkCreate
+from app.services.prayer_service import PrayerService
+from app.services.stats_service import StatsService
+from app.services.summary_service import SummaryService
+from app.services.user_service import UserService
+
+
+async def create_user(prayers: int) -> uuid.UUID:
+    """벤치마크용 사용자와 기도 생성"""
+    user_id = uuid.uuid4()
+    async with AsyncSessionLocal() as session:
+        session.add(User(id=user_id, email=f"bench-{user_id}@example.com", hashed_password="-", name="bench"))
+        session.add(UserPrayerStats(user_id=user_id))
+        await session.commit()
+
+        await PrayerService.bulk_apply(
+            session,
+            user_id,
+            [
+                PrayerBulkCreate(
+                    op="create",
+                    data=PrayerCreate(
+                        subject=f"주제 {i % 5}",
+                        title=f"기도 {i}",
+                        content=f"기도 내용 {i}",
+                        prayer_type="간구",
+                        start_date=date(2024, 1, 1)
+                    )
+                )
+                for i in range(prayers)
+            ]
+        )
+    return user_id
+
+
+def hot_queries(user_id: uuid.UUID, email: str) -> dict:
+    """요청 한 번에 해당하는 조회 (세션을 받아 실행)"""
+    return {
+        "사용자 조회 (ID)": lambda db: UserService.get_by_id(db, user_id),
+        "사용자 조회 (이메일)": lambda db: UserService.get_by_email(db, email),
+        "데이터 버전": lambda db: SummaryService.get_version(db, user_id),
+        "대시보드 통계": lambda db: StatsService.get_dashboard_stats(db, user_id),
+        "기도 목록 + 개수": lambda db: PrayerService.get_prayers(db, user_id),
+        "기도 목록 (상태 필터)": lambda db: PrayerService.get_prayers(
+            db, user_id, status=PrayerStatus.ACTIVE, include_total=False
+        ),
+    }
+
+
+async def measure(query, iterations: int) -> tuple[float, float]:
+    """요청당 CPU 시간과 경과 시간 (µs)"""
+    for _ in range(min(100, iterations)):
+        async with AsyncSessionLocal() as session:
+            await query(session)
+
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        async with AsyncSessionLocal() as session:
+            await query(session)
+    cpu = time.process_time() - cpu_started
+    elapsed = time.perf_counter() - started
+    return cpu / iterations * 1e6, elapsed / iterations * 1e6
+
+
+async def main(iterations: int, prayers: int) -> None:
+    """벤치마크 실행"""
+    await init_db()
+
+    user_id = await create_user(prayers)
+    try:
+        total_cpu = 0.0
+        for name, query in hot_queries(user_id, f"bench-{user_id}@example.com").items():
+            cpu, elapsed = await measure(query, iterations)
+            total_cpu += cpu
+            print(f"{name:<20} CPU {cpu:8.1f}µs/회  경과 {elapsed:8.1f}µs/회")
+        print(f"{'합계':<20} CPU {total_cpu:8.1f}µs")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="자주 실행되는 조회의 요청당 CPU 시간 벤치마크")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--prayers", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations, args.prayers))
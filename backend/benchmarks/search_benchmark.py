@@ -0,0 +1,143 @@
+"""
+기도 검색 벤치마크: 기존 ILIKE 순차 스캔 vs tsvector/trigram 인덱스 검색
+
+사용법 (DATABASE_URL의 데이터베이스에 벤치마크용 사용자를 만들고 끝나면 삭제):
+    python -m benchmarks.search_benchmark --rows 100000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import date, datetime
+from sqlalchemy import select, delete, insert, or_, text
+from app.core.database import AsyncSessionLocal, engine, init_db
+from app.models.prayer import Prayer, PrayerStatus
+from app.models.user import User
+from app.services.search_service import SearchService
+
+
+WORDS = [
+    "가족", "건강", "회복", "감사", "평안", "직장", "진로", "믿음", "소망", "사랑",
+    "지혜", "인도", "보호", "치유", "관계", "화해", "위로", "기쁨", "순종", "섬김",
+    "교회", "말씀", "예배", "자녀", "부모님", "친구", "학업", "시험", "재정", "결혼"
+]
+RARE_WORD = "선교지"
+BATCH_SIZE = 5000
+
+
+def make_sentence(rng: random.Random, length: int) -> str:
+    """임의의 한글 문장 생성 (조사 포함)"""
+    particles = ["을", "를", "이", "가", "의", "에", ""]
+    return " ".join(rng.choice(WORDS) + rng.choice(particles) for _ in range(length))
+
+
+async def seed(user_id: uuid.UUID, rows: int) -> None:
+    """벤치마크용 기도 데이터 생성 (약 0.5%에 드문 단어 포함)"""
+    rng = random.Random(42)
+    now = datetime.utcnow()
+
+    async with AsyncSessionLocal() as session:
+        for offset in range(0, rows, BATCH_SIZE):
+            batch = []
+            for i in range(offset, min(offset + BATCH_SIZE, rows)):
+                content = make_sentence(rng, 25)
+                if rng.random() < 0.005:
+                    content += f" {RARE_WORD}의 안전"
+                batch.append({
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "subject": rng.choice(WORDS[:10]),
+                    "title": make_sentence(rng, 3),
+                    "content": content,
+                    "prayer_type": "간구",
+                    "prayer_targets": [],
+                    "category_tags": [],
+                    "status": PrayerStatus.ACTIVE,
+                    "start_date": date(2024, 1, 1),
+                    "created_at": now,
+                    "updated_at": now
+                })
+            await session.execute(insert(Prayer), batch)
+        await session.commit()
+
+        await session.execute(text("ANALYZE prayers"))
+        await session.commit()
+
+
+async def measure(label: str, statement, repeat: int, disable_indexes: bool = False) -> None:
+    """쿼리를 반복 실행하여 중앙값/최소값 출력"""
+    timings = []
+    async with AsyncSessionLocal() as session:
+        if disable_indexes:
+            # 인덱스가 없던 기존 스키마 재현
+            await session.execute(text("SET LOCAL enable_indexscan = off"))
+            await session.execute(text("SET LOCAL enable_bitmapscan = off"))
+
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = await session.execute(statement)
+            rows = result.all()
+            timings.append((time.perf_counter() - started) * 1000)
+
+    print(
+        f"{label:<32} rows={len(rows):<6} "
+        f"median={statistics.median(timings):8.2f}ms  min={min(timings):8.2f}ms"
+    )
+
+
+async def main(rows: int, repeat: int, term: str) -> None:
+    """벤치마크 실행"""
+    await init_db()
+
+    user_id = uuid.uuid4()
+    async with AsyncSessionLocal() as session:
+        session.add(User(id=user_id, email=f"bench-{user_id}@example.com", hashed_password="-", name="bench"))
+        await session.commit()
+
+    try:
+        print(f"{rows}개 기도 생성 중...")
+        started = time.perf_counter()
+        await seed(user_id, rows)
+        print(f"생성 완료 ({time.perf_counter() - started:.1f}s), 검색어: '{term}'\n")
+
+        search_term = f"%{term}%"
+        legacy = (
+            select(Prayer.id)
+            .where(
+                Prayer.user_id == user_id,
+                or_(Prayer.title.ilike(search_term), Prayer.content.ilike(search_term))
+            )
+            .order_by(Prayer.created_at.desc())
+            .limit(20)
+        )
+        indexed = (
+            select(Prayer.id)
+            .where(Prayer.user_id == user_id, SearchService.prayer_match(term))
+            .order_by(Prayer.created_at.desc())
+            .limit(20)
+        )
+
+        await measure("ILIKE (seq scan, 기존)", legacy, repeat, disable_indexes=True)
+        await measure("tsvector + trigram (목록 필터)", indexed, repeat)
+
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as session:
+            hits = await SearchService.search(session, user_id, term, limit=20)
+        print(f"{'통합 검색 (순위 + 스니펫)':<32} rows={len(hits):<6} elapsed={(time.perf_counter() - started) * 1000:8.2f}ms")
+    finally:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기도 검색 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--term", default=RARE_WORD)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.repeat, args.term))
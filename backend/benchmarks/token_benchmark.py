@@ -0,0 +1,57 @@
+"""
+JWT 디코드 마이크로 벤치마크: 매번 서명 검증(jwt.decode) vs 검증된 payload 캐시(decode_token)
+
+데이터베이스를 사용하지 않습니다 (설정 로딩을 위해 DATABASE_URL/SECRET_KEY는 필요).
+    python -m benchmarks.token_benchmark --iterations 100000 --tokens 10
+"""
+import argparse
+import time
+import uuid
+from jose import jwt
+from app.core.config import settings
+from app.core.security import create_access_token, decode_token, token_cache
+from app.utils.cache import CACHE_REQUESTS
+
+
+def run_uncached(tokens: list, iterations: int) -> float:
+    """캐시 이전 방식: 요청마다 jwt.decode로 서명 검증"""
+    started = time.perf_counter()
+    for i in range(iterations):
+        jwt.decode(tokens[i % len(tokens)], settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    return time.perf_counter() - started
+
+
+def run_cached(tokens: list, iterations: int) -> float:
+    """decode_token: 토큰별 첫 호출만 검증하고 이후는 캐시 조회"""
+    started = time.perf_counter()
+    for i in range(iterations):
+        decode_token(tokens[i % len(tokens)])
+    return time.perf_counter() - started
+
+
+def main(iterations: int, token_count: int) -> None:
+    """벤치마크 실행"""
+    # 여러 클라이언트가 각자의 토큰으로 반복 요청하는 상황
+    tokens = [create_access_token(subject=str(uuid.uuid4())) for _ in range(token_count)]
+    token_cache.clear()
+    hits = CACHE_REQUESTS.value(cache="jwt", result="hit")
+    misses = CACHE_REQUESTS.value(cache="jwt", result="miss")
+
+    uncached = run_uncached(tokens, iterations)
+    cached = run_cached(tokens, iterations)
+
+    hits = CACHE_REQUESTS.value(cache="jwt", result="hit") - hits
+    misses = CACHE_REQUESTS.value(cache="jwt", result="miss") - misses
+
+    print(f"{'jwt.decode':<16} {iterations}회 {uncached:8.3f}s  {uncached / iterations * 1e6:8.1f}µs/회")
+    print(f"{'decode_token':<16} {iterations}회 {cached:8.3f}s  {cached / iterations * 1e6:8.1f}µs/회")
+    print(f"캐시 적중률 {hits / (hits + misses):.1%}, 처리량 {uncached / cached:.1f}배")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JWT 디코드 마이크로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--tokens", type=int, default=10)
+    args = parser.parse_args()
+
+    main(args.iterations, args.tokens)
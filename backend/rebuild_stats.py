@@ -0,0 +1,27 @@
+"""
+사용자별 기도 통계 요약(user_prayer_stats) 재생성 스크립트
+"""
+import asyncio
+from app.core.database import AsyncSessionLocal, engine
+from app.services.summary_service import SummaryService
+
+
+async def main():
+    """prayers 테이블에서 모든 사용자의 통계 요약 재생성"""
+    print("통계 요약 재생성 중...")
+
+    try:
+        async with AsyncSessionLocal() as session:
+            rebuilt = await SummaryService.rebuild(session)
+            await session.commit()
+
+        print(f"✅ {rebuilt}명의 통계 요약을 재생성했습니다.")
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        raise
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,37 @@
+"""
+기도별 응답 과정 집계(progress_count, last_progress_date) 재계산 스크립트
+"""
+import argparse
+import asyncio
+from app.core.database import AsyncSessionLocal, engine
+from app.services.progress_service import ProgressService
+
+
+async def main(chunk_size: int):
+    """집계 재계산 및 불일치 보고"""
+    print("응답 과정 집계 재계산 중...")
+
+    try:
+        async with AsyncSessionLocal() as session:
+            report = await ProgressService.reconcile_counters(session, chunk_size)
+
+        print(f"✅ {report['checked']}개 기도 확인, {len(report['drifted'])}개 불일치 수정")
+        for drift in report["drifted"]:
+            print(
+                f"   - {drift['prayer_id']}: "
+                f"count {drift['progress_count']} -> {drift['actual_count']}, "
+                f"last {drift['last_progress_date']} -> {drift['actual_last_date']}"
+            )
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        raise
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="응답 과정 집계 재계산")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.chunk_size))
@@ -3,17 +3,32 @@
 -- UUID 확장 활성화
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- 한글 부분 문자열 검색용 trigram 확장
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 제목 정렬용 한국어 콜레이션 (ICU 미지원 빌드에서는 "C"로 대체)
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_collation WHERE collname = 'ko_kr') THEN
+        BEGIN
+            CREATE COLLATION ko_kr (provider = icu, locale = 'ko-KR');
+        EXCEPTION WHEN feature_not_supported THEN
+            CREATE COLLATION ko_kr FROM "C";
+        END;
+    END IF;
+END
+$$;
+
 -- 기존 테이블 삭제 (개발 환경용, 프로덕션에서는 주의)
+DROP TABLE IF EXISTS rate_limit_buckets;
+DROP TABLE IF EXISTS user_prayer_stats CASCADE;
 DROP TABLE IF EXISTS prayer_progress CASCADE;
 DROP TABLE IF EXISTS prayers CASCADE;
 DROP TABLE IF EXISTS users CASCADE;
 
--- ENUM 타입 삭제 (존재하는 경우)
+-- 이전 스키마의 ENUM 타입 삭제 (status는 ORM/마이그레이션과 같은 이름 기반 VARCHAR 컬럼)
 DROP TYPE IF EXISTS prayer_status CASCADE;
 
--- ENUM 타입 생성
-CREATE TYPE prayer_status AS ENUM ('active', 'answered');
-
 -- 사용자 테이블
 CREATE TABLE users (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -43,40 +58,94 @@ CREATE TABLE prayers (
     category_tags JSONB NOT NULL DEFAULT '[]'::jsonb,
 
     -- 상태 및 날짜
-    status prayer_status NOT NULL DEFAULT 'active',
+    status VARCHAR(50) NOT NULL DEFAULT 'ACTIVE',
     start_date DATE NOT NULL,
     answer_date DATE,
     answer_content TEXT,
 
+    -- 응답 과정 집계 (비정규화)
+    progress_count INTEGER NOT NULL DEFAULT 0,
+    last_progress_date DATE,
+
+    -- 검색용 tsvector (제목 > 내용 > 응답 내용 순 가중치)
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple'::regconfig, coalesce(content, '')), 'B') ||
+        setweight(to_tsvector('simple'::regconfig, coalesce(answer_content, '')), 'C')
+    ) STORED,
+
     -- 타임스탬프
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- 기도 테이블 인덱스
-CREATE INDEX idx_prayers_user_id ON prayers(user_id);
-CREATE INDEX idx_prayers_subject ON prayers(subject);
-CREATE INDEX idx_prayers_status ON prayers(status);
-CREATE INDEX idx_prayers_start_date ON prayers(start_date);
+-- 조회 패턴에 맞춘 복합/부분 인덱스 (항상 user_id로 먼저 좁힘)
+CREATE INDEX ix_prayers_user_created ON prayers(user_id, created_at DESC, id DESC);
+CREATE INDEX ix_prayers_user_start_date ON prayers(user_id, start_date DESC, id DESC);
+CREATE INDEX ix_prayers_user_answer_date ON prayers(user_id, coalesce(answer_date, '0001-01-01'::date) DESC, id DESC);
+CREATE INDEX ix_prayers_user_title ON prayers(user_id, title COLLATE ko_kr, id);
+CREATE INDEX ix_prayers_user_status ON prayers(user_id, status);
+CREATE INDEX ix_prayers_user_subject ON prayers(user_id, subject);
+CREATE INDEX ix_prayers_answered_without_content ON prayers(user_id, answer_date DESC)
+    WHERE status = 'ANSWERED' AND answer_content IS NULL;
+CREATE INDEX ix_prayers_search_vector ON prayers USING gin (search_vector);
+CREATE INDEX ix_prayers_title_trgm ON prayers USING gin (title gin_trgm_ops);
+CREATE INDEX ix_prayers_content_trgm ON prayers USING gin (content gin_trgm_ops);
 
 -- 기도 응답 과정 기록 테이블
 CREATE TABLE prayer_progress (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     prayer_id UUID NOT NULL REFERENCES prayers(id) ON DELETE CASCADE,
+    -- 기도 소유자 (비정규화, 항상 prayers.user_id와 같음)
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
 
     -- 기록 내용
     content TEXT NOT NULL,
     recorded_date DATE NOT NULL,
     tags JSONB NOT NULL DEFAULT '[]'::jsonb,
 
+    -- 검색용 tsvector
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('simple'::regconfig, coalesce(content, ''))
+    ) STORED,
+
     -- 타임스탬프
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
 -- 기도 응답 과정 테이블 인덱스
-CREATE INDEX idx_prayer_progress_prayer_id ON prayer_progress(prayer_id);
-CREATE INDEX idx_prayer_progress_recorded_date ON prayer_progress(recorded_date);
+CREATE INDEX ix_prayer_progress_prayer_timeline ON prayer_progress(prayer_id, recorded_date DESC, id DESC);
+CREATE INDEX ix_prayer_progress_user_timeline ON prayer_progress(user_id, recorded_date DESC, id DESC);
+CREATE INDEX ix_prayer_progress_search_vector ON prayer_progress USING gin (search_vector);
+CREATE INDEX ix_prayer_progress_content_trgm ON prayer_progress USING gin (content gin_trgm_ops);
+
+-- 사용자별 기도 통계 요약 테이블
+CREATE TABLE user_prayer_stats (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+
+    -- 상태별 개수
+    total_prayers INTEGER NOT NULL DEFAULT 0,
+    active_prayers INTEGER NOT NULL DEFAULT 0,
+    answered_prayers INTEGER NOT NULL DEFAULT 0,
+    answered_without_content INTEGER NOT NULL DEFAULT 0,
+
+    -- 주제별 개수 {주제: 개수}
+    by_subject JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    -- 사용자 데이터 버전 (기도/응답 과정 쓰기마다 증가, ETag로 사용)
+    data_version BIGINT NOT NULL DEFAULT 0,
+
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 요청 제한 토큰 버킷 (LOGIN_RATE_LIMIT_STORE=postgres, 재시작 시 비워져도 무방하므로 UNLOGGED)
+CREATE UNLOGGED TABLE rate_limit_buckets (
+    key VARCHAR(320) PRIMARY KEY,
+    tokens DOUBLE PRECISION NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL
+);
 
 -- updated_at 자동 업데이트 함수
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -1,5 +1,20 @@
+import asyncio
+import hashlib
+import time
 import pytest
+from datetime import timedelta
 from httpx import AsyncClient
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User
+from app.core.security import (
+    password_hasher, get_password_hash_async, PASSWORD_HASH_DURATION, PASSWORD_HASH_REJECTED,
+    create_access_token, decode_token, token_cache
+)
+from app.core.rate_limit import LoginRateLimiter, MemoryRateLimitStore, PostgresRateLimitStore
+from app.utils.cache import CACHE_REQUESTS
+from tests.conftest import TestSessionLocal
+from tests.conftest import count_queries
 
 
 @pytest.mark.asyncio
@@ -125,3 +140,167 @@ async def test_get_current_user(client: AsyncClient):
     assert response.status_code == 200
     data = response.json()
     assert data["email"] == "test@example.com"
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_does_not_block_event_loop():
+    """해싱 중에도 이벤트 루프의 다른 작업이 계속 실행됨"""
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    try:
+        await get_password_hash_async("password123")
+    finally:
+        done.set()
+        await task
+
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_login_rejected_when_hash_queue_full(client: AsyncClient, monkeypatch):
+    """해싱 대기열이 가득 차면 로그인은 기다리지 않고 503"""
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "test@example.com", "password": "password123", "name": "Test User"}
+    )
+    hashed = PASSWORD_HASH_DURATION.count(operation="hash")
+    rejected = PASSWORD_HASH_REJECTED.value(operation="verify")
+
+    monkeypatch.setattr(password_hasher, "pending", password_hasher.capacity)
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "password123"}
+    )
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert PASSWORD_HASH_REJECTED.value(operation="verify") == rejected + 1
+
+    monkeypatch.setattr(password_hasher, "pending", 0)
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "test@example.com", "password": "password123"}
+    )
+    assert response.status_code == 200
+
+    metrics = await client.get("/metrics")
+    assert metrics.status_code == 200
+    assert 'password_hash_queue_wait_seconds_count{operation="verify"}' in metrics.text
+    assert 'password_hash_duration_seconds_bucket{operation="hash",le="+Inf"}' in metrics.text
+    assert hashed >= 1
+
+
+def users_queries(statements: list) -> list:
+    return [s for s in statements if "FROM users" in s]
+
+
+@pytest.mark.asyncio
+async def test_authenticated_requests_skip_users_table(client: AsyncClient, auth_headers: dict):
+    """조회 엔드포인트는 토큰의 사용자 ID만 사용하고, 쓰기는 캐시된 사용자를 재사용"""
+    with count_queries() as statements:
+        await client.get("/api/v1/prayers/", headers=auth_headers)
+        await client.get("/api/v1/dashboard/stats", headers=auth_headers)
+    assert users_queries(statements) == []
+
+    prayer = {
+        "subject": "건강",
+        "title": "회복을 위한 기도",
+        "content": "건강 회복",
+        "prayer_type": "간구",
+        "start_date": "2024-01-01"
+    }
+    with count_queries() as statements:
+        await client.post("/api/v1/prayers/", headers=auth_headers, json=prayer)
+        await client.post("/api/v1/prayers/", headers=auth_headers, json=prayer)
+    assert len(users_queries(statements)) == 1
+
+
+@pytest.mark.asyncio
+async def test_user_cache_invalidated_on_delete(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession
+):
+    """사용자를 삭제하면 캐시된 사용자도 더 이상 반환하지 않음"""
+    response = await client.get("/api/v1/auth/me", headers=auth_headers)
+    assert response.status_code == 200
+
+    await db_session.execute(delete(User).where(User.email == "test@example.com"))
+    await db_session.commit()
+
+    response = await client.get("/api/v1/auth/me", headers=auth_headers)
+    assert response.status_code == 404
+
+
+def test_decode_token_cache_honors_exp():
+    """검증된 토큰만 캐시하고, 캐시 항목은 토큰 exp가 지나면 만료"""
+    token = create_access_token(subject="user", expires_delta=timedelta(minutes=5))
+    hits = CACHE_REQUESTS.value(cache="jwt", result="hit")
+
+    assert decode_token(token)["sub"] == "user"
+    assert decode_token(token)["sub"] == "user"
+    assert CACHE_REQUESTS.value(cache="jwt", result="hit") == hits + 1
+
+    # 서명이 다른 토큰과 만료된 토큰은 캐시하지 않음
+    size = len(token_cache)
+    assert decode_token(token[:-2] + ("AA" if not token.endswith("AA") else "BB")) is None
+    assert decode_token(create_access_token(subject="user", expires_delta=timedelta(seconds=-1))) is None
+    assert len(token_cache) == size
+
+    # 캐시 유효 시간은 남은 exp를 넘지 않음
+    short = create_access_token(subject="user", expires_delta=timedelta(seconds=30))
+    decode_token(short)
+    expires_at, _ = token_cache._items[hashlib.sha256(short.encode()).digest()]
+    assert expires_at - time.monotonic() <= 30
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limited_before_password_check(client: AsyncClient, monkeypatch):
+    """이메일별 시도 한도를 넘으면 비밀번호 검증 없이 429, 다른 이메일은 영향 없음"""
+    limiter = LoginRateLimiter(MemoryRateLimitStore(), ip_limit=(100, 60), email_limit=(2, 1))
+    monkeypatch.setattr("app.api.v1.auth.login_rate_limiter", limiter)
+    await client.post(
+        "/api/v1/auth/register",
+        json={"email": "test@example.com", "password": "password123", "name": "Test User"}
+    )
+
+    for _ in range(2):
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": "test@example.com", "password": "wrongpassword"}
+        )
+        assert response.status_code == 401
+
+    verified = PASSWORD_HASH_DURATION.count(operation="verify")
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "Test@Example.com", "password": "password123"}
+    )
+    assert response.status_code == 429
+    assert 60 <= int(response.headers["retry-after"]) <= 120
+    assert PASSWORD_HASH_DURATION.count(operation="verify") == verified
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "other@example.com", "password": "password123"}
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_postgres_rate_limit_store(db_session: AsyncSession):
+    """Postgres 저장소도 같은 토큰 버킷 규칙 (키별 독립, 한도 초과 시 음수)"""
+    store = PostgresRateLimitStore(TestSessionLocal)
+
+    assert await store.take("login:ip:10.0.0.1", 2, 0.01) == pytest.approx(1, abs=0.01)
+    assert await store.take("login:ip:10.0.0.1", 2, 0.01) == pytest.approx(0, abs=0.01)
+    assert await store.take("login:ip:10.0.0.1", 2, 0.01) < 0
+    assert await store.take("login:ip:10.0.0.2", 2, 0.01) == pytest.approx(1, abs=0.01)
@@ -0,0 +1,213 @@
+import pytest
+from datetime import date
+from httpx import AsyncClient
+from app.api import deps
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user_prayer_stats import UserPrayerStats
+from app.services.summary_service import SummaryService
+from tests.conftest import count_queries, create_prayer
+
+
+@pytest.mark.asyncio
+async def test_dashboard_stats_empty(client: AsyncClient, auth_headers: dict):
+    """기도가 없을 때 통계"""
+    response = await client.get("/api/v1/dashboard/stats", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_prayers"] == 0
+    assert data["answer_rate"] == 0.0
+    assert data["by_subject"] == []
+
+
+@pytest.mark.asyncio
+async def test_dashboard_stats_reads_summary(client: AsyncClient, auth_headers: dict):
+    """통계가 prayers 테이블 스캔 없이 요약 행에서 조회됨"""
+    await create_prayer(client, auth_headers)
+    await create_prayer(client, auth_headers, answered=True)
+    await create_prayer(client, auth_headers, subject="건강")
+
+    with count_queries() as statements:
+        response = await client.get("/api/v1/dashboard/stats", headers=auth_headers)
+
+    data = response.json()
+    assert data["total_prayers"] == 3
+    assert data["active_prayers"] == 2
+    assert data["answered_prayers"] == 1
+    assert data["answer_rate"] == 33.33
+    assert data["by_subject"] == [
+        {"subject": "가족", "count": 2},
+        {"subject": "건강", "count": 1}
+    ]
+    # ETag용 버전 조회 외에 요약 행 조회 1회
+    assert len([s for s in statements if "FROM user_prayer_stats" in s and "total_prayers" in s]) == 1
+    assert not [s for s in statements if "FROM prayers" in s]
+
+
+@pytest.mark.asyncio
+async def test_summary_follows_prayer_writes(client: AsyncClient, auth_headers: dict):
+    """기도 수정/응답/삭제 시 요약 갱신"""
+    await create_prayer(client, auth_headers)
+    response = await client.post(
+        "/api/v1/prayers/",
+        headers=auth_headers,
+        json={
+            "subject": "가족",
+            "title": "이동할 기도",
+            "content": "기도 내용",
+            "prayer_type": "간구",
+            "start_date": "2024-01-01"
+        }
+    )
+    prayer_id = response.json()["id"]
+
+    # 주제 변경
+    await client.patch(f"/api/v1/prayers/{prayer_id}", headers=auth_headers, json={"subject": "재정"})
+    data = (await client.get("/api/v1/dashboard/stats", headers=auth_headers)).json()
+    assert data["by_subject"] == [
+        {"subject": "가족", "count": 1},
+        {"subject": "재정", "count": 1}
+    ]
+
+    # 응답 처리
+    await client.post(
+        f"/api/v1/prayers/{prayer_id}/answer",
+        headers=auth_headers,
+        json={"answer_date": "2024-02-01", "answer_content": "응답받음"}
+    )
+    data = (await client.get("/api/v1/dashboard/stats", headers=auth_headers)).json()
+    assert data["active_prayers"] == 1
+    assert data["answered_prayers"] == 1
+
+    # 삭제 시 0이 된 주제는 사라짐
+    await client.delete(f"/api/v1/prayers/{prayer_id}", headers=auth_headers)
+    data = (await client.get("/api/v1/dashboard/stats", headers=auth_headers)).json()
+    assert data["total_prayers"] == 1
+    assert data["answered_prayers"] == 0
+    assert data["by_subject"] == [{"subject": "가족", "count": 1}]
+
+
+@pytest.mark.asyncio
+async def test_summary_rebuild(client: AsyncClient, auth_headers: dict, db_session: AsyncSession):
+    """요약이 없거나 어긋나도 원본 테이블에서 재생성"""
+    await create_prayer(client, auth_headers)
+    await create_prayer(client, auth_headers, subject="건강", answered=True)
+    expected = (await client.get("/api/v1/dashboard/stats", headers=auth_headers)).json()
+
+    # 요약 삭제 후에도 직접 계산으로 같은 결과
+    await db_session.execute(delete(UserPrayerStats))
+    await db_session.commit()
+    data = (await client.get("/api/v1/dashboard/stats", headers=auth_headers)).json()
+    assert data == expected
+
+    # 재생성
+    assert await SummaryService.rebuild(db_session) == 1
+    await db_session.commit()
+    db_session.expire_all()
+    data = (await client.get("/api/v1/dashboard/stats", headers=auth_headers)).json()
+    assert data == expected
+
+
+@pytest.mark.asyncio
+async def test_subject_stats(client: AsyncClient, auth_headers: dict):
+    """주제별 통계"""
+    await create_prayer(client, auth_headers)
+    await create_prayer(client, auth_headers, subject="건강")
+    await create_prayer(client, auth_headers, subject="건강")
+
+    response = await client.get("/api/v1/dashboard/subject-stats", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"subject": "건강", "count": 2},
+        {"subject": "가족", "count": 1}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304_before_queries(client: AsyncClient, auth_headers: dict):
+    """If-None-Match가 일치하면 집계 조회 없이 304"""
+    await create_prayer(client, auth_headers)
+
+    for url in ("/api/v1/dashboard/stats", "/api/v1/dashboard/subject-stats", "/api/v1/prayers/"):
+        response = await client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        with count_queries() as statements:
+            response = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+        # 버전 조회만 실행 (사용자는 토큰의 ID로 확인)
+        assert len(statements) == 1
+        assert not [s for s in statements if "FROM prayers" in s or "total_prayers" in s]
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_on_every_write(client: AsyncClient, auth_headers: dict):
+    """기도/응답 과정 쓰기마다 ETag 변경"""
+    async def current_etag() -> str:
+        response = await client.get("/api/v1/prayers/", headers=auth_headers)
+        return response.headers["etag"]
+
+    etags = [await current_etag()]
+
+    prayer_id = await create_prayer(client, auth_headers)
+    etags.append(await current_etag())
+
+    # 요약 개수에 영향이 없는 수정
+    await client.patch(f"/api/v1/prayers/{prayer_id}", headers=auth_headers, json={"title": "새 제목"})
+    etags.append(await current_etag())
+
+    response = await client.post(
+        f"/api/v1/prayers/{prayer_id}/progress",
+        headers=auth_headers,
+        json={"content": "응답 과정", "recorded_date": "2024-01-02"}
+    )
+    progress_id = response.json()["id"]
+    etags.append(await current_etag())
+
+    await client.patch(f"/api/v1/prayers/progress/{progress_id}", headers=auth_headers, json={"content": "수정"})
+    etags.append(await current_etag())
+
+    await client.delete(f"/api/v1/prayers/progress/{progress_id}", headers=auth_headers)
+    etags.append(await current_etag())
+
+    await client.delete(f"/api/v1/prayers/{prayer_id}", headers=auth_headers)
+    etags.append(await current_etag())
+
+    assert len(set(etags)) == len(etags)
+
+    response = await client.get(
+        "/api/v1/prayers/",
+        headers={**auth_headers, "If-None-Match": etags[0]}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_when_date_changes(client: AsyncClient, auth_headers: dict, monkeypatch):
+    """쓰기가 없어도 날짜가 바뀌면 ETag 변경 (기도 일수 갱신)"""
+    class FrozenDate(date):
+        today_value = date(2024, 3, 1)
+
+        @classmethod
+        def today(cls):
+            return cls.today_value
+
+    monkeypatch.setattr(deps, "date", FrozenDate)
+    await create_prayer(client, auth_headers)
+
+    response = await client.get("/api/v1/prayers/", headers=auth_headers)
+    etag = response.headers["etag"]
+
+    response = await client.get("/api/v1/prayers/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    FrozenDate.today_value = date(2024, 3, 2)
+    response = await client.get("/api/v1/prayers/", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+import pytest
+from httpx import AsyncClient
+from app.services import export_service
+from tests.test_prayers import create_prayers
+
+
+@pytest.mark.asyncio
+async def test_export_ndjson_includes_progress(client: AsyncClient, auth_headers: dict, monkeypatch):
+    """NDJSON 내보내기: 기도 한 줄에 응답 과정 포함 (여러 청크)"""
+    monkeypatch.setattr(export_service, "EXPORT_CHUNK_SIZE", 2)
+    prayer_ids = await create_prayers(client, auth_headers, 5)
+
+    response = await client.get("/api/v1/export/?format=ndjson", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [record["id"] for record in records] == prayer_ids
+    assert records[0]["status"] == "active"
+    assert [p["content"] for p in records[0]["progress"]] == ["응답 과정 1", "응답 과정 2"]
+    assert all(len(record["progress"]) == 2 for record in records)
+
+
+@pytest.mark.asyncio
+async def test_export_csv_one_row_per_progress(client: AsyncClient, auth_headers: dict):
+    """CSV 내보내기: 응답 과정마다 한 행, 응답 과정 없는 기도도 포함"""
+    await create_prayers(client, auth_headers, 2)
+    await client.post(
+        "/api/v1/prayers/",
+        headers=auth_headers,
+        json={
+            "subject": "건강",
+            "title": "기록 없는 기도",
+            "content": "내용",
+            "prayer_type": "감사",
+            "prayer_targets": ["어머니"],
+            "start_date": "2024-01-01"
+        }
+    )
+
+    response = await client.get("/api/v1/export/?format=csv", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert "attachment" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 5
+    assert rows[-1]["title"] == "기록 없는 기도"
+    assert rows[-1]["progress_id"] == ""
+    assert json.loads(rows[-1]["prayer_targets"]) == ["어머니"]
+
+
+@pytest.mark.asyncio
+async def test_export_only_own_data(client: AsyncClient, auth_headers: dict):
+    """다른 사용자의 내보내기에는 포함되지 않음"""
+    await create_prayers(client, auth_headers, 1)
+    other = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "other@example.com", "password": "password123", "name": "Other"}
+    )
+    other_headers = {"Authorization": f"Bearer {other.json()['access_token']}"}
+
+    response = await client.get("/api/v1/export/?format=csv", headers=other_headers)
+
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 1
@@ -0,0 +1,145 @@
+import json
+import pytest
+from httpx import AsyncClient
+from tests.conftest import create_prayer
+from tests.test_prayers import create_prayers
+
+
+def ndjson(*records) -> bytes:
+    return "\n".join(json.dumps(record, ensure_ascii=False) for record in records).encode()
+
+
+PRAYER = {
+    "subject": "가족",
+    "title": "가족을 위한 기도",
+    "content": "가족 모두 건강하게",
+    "prayer_type": "간구",
+    "prayer_targets": ["어머니"],
+    "start_date": "2019-03-01"
+}
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_with_row_errors(client: AsyncClient, auth_headers: dict):
+    """NDJSON 가져오기: 유효한 줄만 저장하고 실패한 줄 번호 보고"""
+    body = ndjson(
+        {**PRAYER, "progress": [
+            {"content": "조금씩 회복", "recorded_date": "2019-04-01"},
+            {"content": "완전히 회복", "recorded_date": "2019-05-01", "tags": ["감사"]}
+        ]},
+        {**PRAYER, "title": ""},
+        {**PRAYER, "progress": [{"content": "날짜 없음"}]},
+    ) + b"\n\n{not json\n"
+
+    response = await client.post(
+        "/api/v1/import/?format=ndjson",
+        headers=auth_headers,
+        files={"file": ("journal.ndjson", body)}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["prayers"] == 1
+    assert data["progress"] == 2
+    assert data["failed"] == 3
+    assert [error["row"] for error in data["errors"]] == [2, 3, 5]
+    assert data["errors"][0]["error"].startswith("title:")
+    assert data["errors"][1]["error"].startswith("progress.0.recorded_date:")
+
+    prayers = await client.get("/api/v1/prayers/", headers=auth_headers)
+    item = prayers.json()["items"][0]
+    assert item["title"] == "가족을 위한 기도"
+    assert item["prayer_targets"] == ["어머니"]
+    assert item["progress_count"] == 2
+    assert item["last_progress_date"] == "2019-05-01"
+
+    stats = await client.get("/api/v1/dashboard/stats", headers=auth_headers)
+    assert stats.json()["total_prayers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_import_csv_groups_rows_by_prayer_ref(client: AsyncClient, auth_headers: dict):
+    """CSV 가져오기: 같은 prayer_ref의 연속된 행은 한 기도의 응답 과정"""
+    body = (
+        "prayer_ref,subject,title,content,prayer_type,start_date,progress_content,progress_recorded_date\n"
+        "a,직장,이직,좋은 직장,간구,2020-01-01,면접,2020-02-01\n"
+        "a,직장,이직,좋은 직장,간구,2020-01-01,합격,2020-03-01\n"
+        "b,건강,,내용,간구,2020-01-01,,\n"
+        "b,건강,,내용,간구,2020-01-01,기록,2020-02-01\n"
+        ",교회,부흥,교회 부흥,중보,2020-01-01,,\n"
+        ",교회,선교,선교사,중보,2020-01-01,기록,not-a-date\n"
+    ).encode()
+
+    response = await client.post(
+        "/api/v1/import/?format=csv",
+        headers=auth_headers,
+        files={"file": ("journal.csv", body)}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["prayers"], data["progress"], data["failed"]) == (2, 2, 3)
+    assert [error["row"] for error in data["errors"]] == [3, 4, 6]
+    assert data["errors"][1]["error"] == "Prayer in row 3 is invalid"
+    assert data["errors"][2]["error"].startswith("progress_recorded_date:")
+
+    prayers = await client.get("/api/v1/prayers/?sort_by=created_at_asc", headers=auth_headers)
+    items = prayers.json()["items"]
+    assert [item["title"] for item in items] == ["이직", "부흥"]
+    assert items[0]["progress_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_import_exported_csv(client: AsyncClient, auth_headers: dict):
+    """내보낸 CSV를 그대로 가져오기 (응답 상태 유지)"""
+    await create_prayers(client, auth_headers, 3)
+    await create_prayer(client, auth_headers, title="응답된 기도", answered=True)
+    exported = await client.get("/api/v1/export/?format=csv", headers=auth_headers)
+
+    response = await client.post(
+        "/api/v1/import/?format=csv",
+        headers=auth_headers,
+        files={"file": ("export.csv", exported.content)}
+    )
+
+    assert response.json()["prayers"] == 4
+    assert response.json()["progress"] == 6
+    prayers = await client.get("/api/v1/prayers/", headers=auth_headers)
+    assert prayers.json()["total"] == 8
+    answered = await client.get("/api/v1/prayers/?status=answered", headers=auth_headers)
+    assert answered.json()["total"] == 2
+    imported = answered.json()["items"]
+    assert imported[0]["answer_date"] == imported[1]["answer_date"]
+    assert imported[0]["answer_content"] == imported[1]["answer_content"]
+
+
+@pytest.mark.asyncio
+async def test_import_ndjson_answered_prayer(client: AsyncClient, auth_headers: dict):
+    """NDJSON의 상태와 응답 필드 가져오기"""
+    answered = {**PRAYER, "status": "answered", "answer_date": "2024-02-01", "answer_content": "응답"}
+
+    response = await client.post(
+        "/api/v1/import/?format=ndjson",
+        headers=auth_headers,
+        files={"file": ("prayers.ndjson", ndjson(answered, {**PRAYER, "status": "unknown"}))}
+    )
+
+    assert response.json()["prayers"] == 1
+    assert [error["row"] for error in response.json()["errors"]] == [2]
+    prayers = await client.get("/api/v1/prayers/?status=answered", headers=auth_headers)
+    assert prayers.json()["total"] == 1
+    assert prayers.json()["items"][0]["answer_date"] == "2024-02-01"
+    assert prayers.json()["items"][0]["answer_content"] == "응답"
+
+
+@pytest.mark.asyncio
+async def test_import_csv_missing_columns(client: AsyncClient, auth_headers: dict):
+    """필수 열이 없으면 400"""
+    response = await client.post(
+        "/api/v1/import/?format=csv",
+        headers=auth_headers,
+        files={"file": ("journal.csv", "subject,title\n가족,기도\n".encode())}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Missing columns: content, prayer_type, start_date"
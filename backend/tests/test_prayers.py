@@ -0,0 +1,484 @@
+import base64
+import json
+import pytest
+from datetime import date
+from uuid import UUID
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.prayer import Prayer, PrayerStatus
+from app.schemas.prayer import PrayerAnswer, PrayerUpdate
+from app.services.prayer_service import PrayerService, _prayer_list_statements
+from tests.conftest import count_queries, create_prayer
+
+
+async def create_prayers(client: AsyncClient, headers: dict, count: int) -> list:
+    """테스트용 기도 여러 개 생성 (각각 응답 과정 2개 포함)"""
+    prayer_ids = []
+    for i in range(count):
+        prayer_id = await create_prayer(client, headers, title=f"기도 {i}", content=f"기도 내용 {i}")
+        prayer_ids.append(prayer_id)
+
+        for day in (1, 2):
+            await client.post(
+                f"/api/v1/prayers/{prayer_id}/progress",
+                headers=headers,
+                json={"content": f"응답 과정 {day}", "recorded_date": f"2024-01-0{day + 1}"}
+            )
+
+    return prayer_ids
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_includes_progress_count(client: AsyncClient, auth_headers: dict):
+    """기도 목록에 응답 과정 개수와 기도 일수 포함"""
+    await create_prayers(client, auth_headers, 3)
+
+    response = await client.get("/api/v1/prayers/", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 3
+    assert all(item["progress_count"] == 2 for item in data["items"])
+    assert all(item["prayer_days"] > 0 for item in data["items"])
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_constant_query_count(client: AsyncClient, auth_headers: dict):
+    """페이지 크기와 무관하게 쿼리 수가 일정"""
+    await create_prayers(client, auth_headers, 6)
+
+    with count_queries() as small_page:
+        response = await client.get("/api/v1/prayers/?limit=1", headers=auth_headers)
+    assert len(response.json()["items"]) == 1
+
+    with count_queries() as full_page:
+        response = await client.get("/api/v1/prayers/?limit=6", headers=auth_headers)
+    assert len(response.json()["items"]) == 6
+
+    assert len(small_page) == len(full_page)
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_reuses_statement_text(client: AsyncClient, auth_headers: dict):
+    """필터 값/페이지가 달라도 캐시된 문장으로 같은 SQL을 실행 (준비된 문장 재사용)"""
+    await create_prayers(client, auth_headers, 3)
+    hits = _prayer_list_statements.cache_info().hits
+
+    with count_queries() as first:
+        response = await client.get("/api/v1/prayers/?status=active&page=1&limit=2", headers=auth_headers)
+    assert len(response.json()["items"]) == 2
+
+    with count_queries() as second:
+        response = await client.get("/api/v1/prayers/?status=answered&page=2&limit=5", headers=auth_headers)
+    assert response.json()["items"] == []
+
+    assert first == second
+    assert _prayer_list_statements.cache_info().hits > hits
+
+
+@pytest.mark.asyncio
+async def test_recent_prayers_constant_query_count(client: AsyncClient, auth_headers: dict):
+    """최근 기도 목록도 쿼리 수가 일정"""
+    await create_prayers(client, auth_headers, 5)
+
+    with count_queries() as small_page:
+        response = await client.get("/api/v1/dashboard/recent?limit=1", headers=auth_headers)
+    assert response.json()["items"][0]["progress_count"] == 2
+
+    with count_queries() as full_page:
+        response = await client.get("/api/v1/dashboard/recent?limit=5", headers=auth_headers)
+    assert response.json()["total"] == 5
+
+    assert len(small_page) == len(full_page)
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_cursor_pagination(client: AsyncClient, auth_headers: dict):
+    """커서 페이지네이션으로 모든 기도를 중복 없이 순회"""
+    prayer_ids = await create_prayers(client, auth_headers, 5)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "include_total": "false"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/prayers/", headers=auth_headers, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    # 최신순 정렬
+    assert seen == list(reversed(prayer_ids))
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_invalid_cursor(client: AsyncClient, auth_headers: dict):
+    """잘못된 커서는 기도 조회(개수 포함) 없이 400"""
+    with count_queries() as statements:
+        response = await client.get("/api/v1/prayers/?cursor=invalid", headers=auth_headers)
+
+    assert response.status_code == 400
+    assert not [s for s in statements if "FROM prayers" in s]
+
+    # 형식은 맞지만 정렬 값이 목록이 아닌 커서
+    for values in [1, None, "abc", {"a": 1}]:
+        cursor = base64.urlsafe_b64encode(json.dumps({"s": "created_at_desc", "v": values}).encode()).decode()
+        response = await client.get("/api/v1/prayers/", headers=auth_headers, params={"cursor": cursor})
+        assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_sort_by_title_with_filter_and_cursor(client: AsyncClient, auth_headers: dict):
+    """제목 정렬은 필터, 커서 페이지네이션과 함께 동작"""
+    for title, subject in [("하늘", "가족"), ("가정", "가족"), ("나라", "교회"), ("다음", "가족"), ("마음", "가족")]:
+        await client.post(
+            "/api/v1/prayers/",
+            headers=auth_headers,
+            json={
+                "subject": subject,
+                "title": title,
+                "content": "내용",
+                "prayer_type": "간구",
+                "start_date": "2024-01-01"
+            }
+        )
+
+    titles = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "subject": "가족", "sort_by": "title_asc", "include_total": "false"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/api/v1/prayers/", headers=auth_headers, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        titles.extend(item["title"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+
+    assert titles == ["가정", "다음", "마음", "하늘"]
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_sort_by_dates_and_duration(client: AsyncClient, auth_headers: dict):
+    """시작일, 응답일, 기도 기간 정렬"""
+    ids = {}
+    for title, start_date in [("짧은", "2024-03-01"), ("긴", "2024-01-01"), ("진행", "2024-02-01")]:
+        response = await client.post(
+            "/api/v1/prayers/",
+            headers=auth_headers,
+            json={
+                "subject": "가족",
+                "title": title,
+                "content": "내용",
+                "prayer_type": "간구",
+                "start_date": start_date
+            }
+        )
+        ids[title] = response.json()["id"]
+
+    for title, answer_date in [("짧은", "2024-03-05"), ("긴", "2024-02-01")]:
+        response = await client.post(
+            f"/api/v1/prayers/{ids[title]}/answer",
+            headers=auth_headers,
+            json={"answer_date": answer_date, "answer_content": "응답"}
+        )
+        assert response.status_code == 200
+
+    async def titles(sort_by: str) -> list:
+        response = await client.get("/api/v1/prayers/", headers=auth_headers, params={"sort_by": sort_by})
+        assert response.status_code == 200
+        return [item["title"] for item in response.json()["items"]]
+
+    assert await titles("start_date_asc") == ["긴", "진행", "짧은"]
+    assert await titles("start_date_desc") == ["짧은", "진행", "긴"]
+    # 응답 전 기도는 응답일 정렬에서 가장 이른 것으로 취급
+    assert await titles("answer_date_desc") == ["짧은", "긴", "진행"]
+    assert await titles("duration_desc") == ["진행", "긴", "짧은"]
+    assert await titles("duration_asc") == ["짧은", "긴", "진행"]
+
+
+@pytest.mark.asyncio
+async def test_duration_sort_ignores_answer_date_of_active_prayer(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession
+):
+    """진행 중인 기도는 남아 있는 응답일과 관계없이 오늘까지의 기간으로 정렬 (prayer_days와 일치)"""
+    active_id = await create_prayer(client, auth_headers, title="진행", start_date="2024-01-01")
+    await create_prayer(client, auth_headers, title="응답", start_date="2023-01-01", answered=True)
+    await db_session.execute(
+        update(Prayer).where(Prayer.id == UUID(active_id)).values(answer_date=date(2024, 1, 2))
+    )
+    await db_session.commit()
+
+    response = await client.get("/api/v1/prayers/", headers=auth_headers, params={"sort_by": "duration_desc"})
+
+    items = response.json()["items"]
+    assert [item["title"] for item in items] == ["진행", "응답"]
+    assert items[0]["prayer_days"] > items[1]["prayer_days"]
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_invalid_sort(client: AsyncClient, auth_headers: dict):
+    """허용되지 않은 정렬 기준이나 다른 정렬의 커서는 400"""
+    await create_prayers(client, auth_headers, 3)
+
+    response = await client.get("/api/v1/prayers/?sort_by=content_desc", headers=auth_headers)
+    assert response.status_code == 400
+
+    response = await client.get("/api/v1/prayers/?limit=1", headers=auth_headers)
+    cursor = response.json()["next_cursor"]
+    response = await client.get(
+        "/api/v1/prayers/",
+        headers=auth_headers,
+        params={"cursor": cursor, "sort_by": "title_asc"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_sparse_fields(client: AsyncClient, auth_headers: dict):
+    """fields 지정 시 해당 컬럼만 조회하고 응답"""
+    prayer_ids = await create_prayers(client, auth_headers, 2)
+
+    with count_queries() as statements:
+        response = await client.get(
+            "/api/v1/prayers/?fields=title,status,prayer_days",
+            headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert set(items[0]) == {"id", "title", "status", "prayer_days"}
+    assert items[0]["prayer_days"] > 0
+    list_query = next(s for s in statements if "LIMIT" in s)
+    assert "prayers.content" not in list_query
+    assert "prayers.prayer_targets" not in list_query
+
+    response = await client.get(
+        f"/api/v1/prayers/{prayer_ids[0]}?fields=title,answer_content",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json() == {"id": prayer_ids[0], "title": "기도 0", "answer_content": None}
+
+    response = await client.get("/api/v1/dashboard/recent?fields=title", headers=auth_headers)
+    assert response.status_code == 200
+    assert set(response.json()["items"][0]) == {"id", "title"}
+
+
+@pytest.mark.asyncio
+async def test_get_prayers_unknown_fields(client: AsyncClient, auth_headers: dict):
+    """존재하지 않는 필드는 400"""
+    prayer_ids = await create_prayers(client, auth_headers, 1)
+
+    response = await client.get("/api/v1/prayers/?fields=title,password", headers=auth_headers)
+    assert response.status_code == 400
+
+    # 상세 조회에는 목록 전용 계산 필드가 없음
+    response = await client.get(
+        f"/api/v1/prayers/{prayer_ids[0]}?fields=prayer_days",
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_prayer_detail_embeds_progress(client: AsyncClient, auth_headers: dict):
+    """상세 조회에 응답 과정 포함 (최근 기록순, progress_limit 적용)"""
+    prayer_ids = await create_prayers(client, auth_headers, 1)
+
+    with count_queries() as statements:
+        response = await client.get(f"/api/v1/prayers/{prayer_ids[0]}/detail", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["content"] for p in data["progress"]] == ["응답 과정 2", "응답 과정 1"]
+    assert data["progress_count"] == 2
+    assert data["prayer_days"] > 0
+    assert sum("prayer_progress" in statement for statement in statements) == 1
+
+    response = await client.get(
+        f"/api/v1/prayers/{prayer_ids[0]}/detail?progress_limit=1",
+        headers=auth_headers
+    )
+    assert [p["content"] for p in response.json()["progress"]] == ["응답 과정 2"]
+    assert response.json()["progress_count"] == 2
+
+    response = await client.get(
+        "/api/v1/prayers/00000000-0000-0000-0000-000000000000/detail",
+        headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_write_paths_skip_loading_progress(client: AsyncClient, auth_headers: dict):
+    """수정/응답/삭제는 응답 과정을 로드하지 않고 단일 UPDATE/DELETE로 처리"""
+    prayer_ids = await create_prayers(client, auth_headers, 1)
+    url = f"/api/v1/prayers/{prayer_ids[0]}"
+
+    with count_queries() as statements:
+        response = await client.patch(url, headers=auth_headers, json={"subject": "건강"})
+    assert response.status_code == 200
+    assert response.json()["subject"] == "건강"
+    assert not [s for s in statements if "prayer_progress" in s]
+    assert not [s for s in statements if s.lstrip().startswith("SELECT") and "FROM prayers" in s]
+
+    with count_queries() as statements:
+        response = await client.post(
+            f"{url}/answer",
+            headers=auth_headers,
+            json={"answer_date": "2024-03-01", "answer_content": "응답"}
+        )
+    assert response.json()["status"] == "answered"
+    assert not [s for s in statements if "prayer_progress" in s]
+
+    stats = await client.get("/api/v1/dashboard/stats", headers=auth_headers)
+    assert stats.json()["answered_prayers"] == 1
+
+    with count_queries() as statements:
+        response = await client.delete(url, headers=auth_headers)
+    assert response.status_code == 204
+    assert [s for s in statements if "prayers" in s and s.lstrip().startswith("DELETE")]
+    assert not [s for s in statements if "prayer_progress" in s]
+
+    response = await client.get(f"{url}/progress", headers=auth_headers)
+    assert response.status_code == 404
+    response = await client.patch(url, headers=auth_headers, json={"subject": "건강"})
+    assert response.status_code == 404
+
+    stats = await client.get("/api/v1/dashboard/stats", headers=auth_headers)
+    assert stats.json()["total_prayers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_update_refreshes_prayer_loaded_in_session(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession
+):
+    """같은 세션에 이미 로드된 기도도 UPDATE ... RETURNING 값으로 갱신되어 요약이 맞음"""
+    prayer_ids = await create_prayers(client, auth_headers, 1)
+    user_id = UUID((await client.get("/api/v1/auth/me", headers=auth_headers)).json()["id"])
+    prayer_id = UUID(prayer_ids[0])
+
+    loaded = await PrayerService.get_prayer_by_id(db_session, prayer_id, user_id)
+    assert loaded.status == PrayerStatus.ACTIVE
+
+    prayer = await PrayerService.answer_prayer(
+        db_session,
+        prayer_id,
+        user_id,
+        PrayerAnswer(answer_date=date(2024, 3, 1), answer_content="응답")
+    )
+    assert prayer is loaded
+    assert prayer.status == PrayerStatus.ANSWERED
+
+    prayer = await PrayerService.update_prayer(db_session, prayer_id, user_id, PrayerUpdate(subject="건강"))
+    assert prayer.subject == "건강"
+
+    stats = await client.get("/api/v1/dashboard/stats", headers=auth_headers)
+    assert stats.json()["active_prayers"] == 0
+    assert stats.json()["answered_prayers"] == 1
+    assert stats.json()["by_subject"] == [{"subject": "건강", "count": 1}]
+
+
+def bulk_create_operation(title: str, subject: str = "가족") -> dict:
+    """일괄 작업용 생성 항목"""
+    return {
+        "op": "create",
+        "data": {
+            "subject": subject,
+            "title": title,
+            "content": "기도 내용",
+            "prayer_type": "간구",
+            "start_date": "2024-01-01"
+        }
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_prayer_operations(client: AsyncClient, auth_headers: dict):
+    """일괄 생성/수정/응답/삭제와 항목별 결과"""
+    prayer_ids = await create_prayers(client, auth_headers, 3)
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    response = await client.post(
+        "/api/v1/prayers/bulk",
+        headers=auth_headers,
+        json={
+            "operations": [
+                bulk_create_operation("새 기도 1"),
+                bulk_create_operation("새 기도 2", subject="건강"),
+                {"op": "update", "id": prayer_ids[0], "data": {"title": "수정됨", "subject": "교회"}},
+                {"op": "answer", "id": prayer_ids[1], "data": {"answer_date": "2024-03-01", "answer_content": "응답"}},
+                {"op": "delete", "id": prayer_ids[2]},
+                {"op": "delete", "id": missing_id},
+                {"op": "update", "id": prayer_ids[0], "data": {"title": "중복"}}
+            ]
+        }
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["status"] for r in data["results"]] == [201, 201, 200, 200, 204, 404, 409]
+    assert data["succeeded"] == 5
+    assert data["failed"] == 2
+    created_ids = [r["id"] for r in data["results"][:2]]
+
+    response = await client.get(f"/api/v1/prayers/{created_ids[1]}", headers=auth_headers)
+    assert response.json()["subject"] == "건강"
+
+    response = await client.get(f"/api/v1/prayers/{prayer_ids[0]}", headers=auth_headers)
+    assert response.json()["title"] == "수정됨"
+
+    response = await client.get(f"/api/v1/prayers/{prayer_ids[1]}", headers=auth_headers)
+    assert response.json()["status"] == "answered"
+
+    response = await client.get(f"/api/v1/prayers/{prayer_ids[2]}", headers=auth_headers)
+    assert response.status_code == 404
+
+    # 요약 통계도 함께 반영
+    response = await client.get("/api/v1/dashboard/stats", headers=auth_headers)
+    stats = response.json()
+    assert stats["total_prayers"] == 4
+    assert stats["answered_prayers"] == 1
+    assert stats["by_subject"] == [
+        {"subject": "가족", "count": 2},
+        {"subject": "건강", "count": 1},
+        {"subject": "교회", "count": 1}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_constant_query_count(client: AsyncClient, auth_headers: dict):
+    """일괄 생성은 항목 수와 무관하게 쿼리 수가 일정"""
+    # 첫 요청의 사용자 조회가 비교에 섞이지 않도록 사용자 캐시를 먼저 채움
+    await client.get("/api/v1/auth/me", headers=auth_headers)
+
+    with count_queries() as small_batch:
+        response = await client.post(
+            "/api/v1/prayers/bulk",
+            headers=auth_headers,
+            json={"operations": [bulk_create_operation(f"기도 {i}") for i in range(2)]}
+        )
+    assert response.json()["succeeded"] == 2
+
+    with count_queries() as large_batch:
+        response = await client.post(
+            "/api/v1/prayers/bulk",
+            headers=auth_headers,
+            json={"operations": [bulk_create_operation(f"기도 {i}") for i in range(50)]}
+        )
+    assert response.json()["succeeded"] == 50
+
+    assert len(small_batch) == len(large_batch)
@@ -0,0 +1,295 @@
+import asyncio
+import json
+import pytest
+from uuid import UUID
+from httpx import AsyncClient
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.prayer import Prayer
+from app.services.progress_service import ProgressService
+from tests.conftest import TestSessionLocal, count_queries, create_prayer
+
+
+async def get_list_item(client: AsyncClient, headers: dict) -> dict:
+    """목록 첫 번째 항목 조회"""
+    response = await client.get("/api/v1/prayers/", headers=headers)
+    return response.json()["items"][0]
+
+
+@pytest.mark.asyncio
+async def test_progress_counters_follow_writes(client: AsyncClient, auth_headers: dict):
+    """응답 과정 추가/수정/삭제 시 기도 집계 갱신"""
+    prayer_id = await create_prayer(client, auth_headers)
+
+    first = await client.post(
+        f"/api/v1/prayers/{prayer_id}/progress",
+        headers=auth_headers,
+        json={"content": "첫 기록", "recorded_date": "2024-02-01"}
+    )
+    second = await client.post(
+        f"/api/v1/prayers/{prayer_id}/progress",
+        headers=auth_headers,
+        json={"content": "두 번째 기록", "recorded_date": "2024-03-01"}
+    )
+
+    item = await get_list_item(client, auth_headers)
+    assert item["progress_count"] == 2
+    assert item["last_progress_date"] == "2024-03-01"
+
+    # 기록 날짜 수정
+    await client.patch(
+        f"/api/v1/prayers/progress/{second.json()['id']}",
+        headers=auth_headers,
+        json={"recorded_date": "2024-01-15"}
+    )
+    item = await get_list_item(client, auth_headers)
+    assert item["last_progress_date"] == "2024-02-01"
+
+    # 삭제
+    await client.delete(f"/api/v1/prayers/progress/{first.json()['id']}", headers=auth_headers)
+    item = await get_list_item(client, auth_headers)
+    assert item["progress_count"] == 1
+    assert item["last_progress_date"] == "2024-01-15"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_progress_deletes_keep_counters(client: AsyncClient, auth_headers: dict):
+    """같은 기도의 응답 과정을 동시에 삭제해도 집계가 어긋나지 않음"""
+    prayer_id = await create_prayer(client, auth_headers)
+    progress_ids = []
+    for recorded_date in ["2024-02-01", "2024-03-01"]:
+        response = await client.post(
+            f"/api/v1/prayers/{prayer_id}/progress",
+            headers=auth_headers,
+            json={"content": "기록", "recorded_date": recorded_date}
+        )
+        progress_ids.append(UUID(response.json()["id"]))
+    user_id = UUID((await client.get("/api/v1/auth/me", headers=auth_headers)).json()["id"])
+
+    async def delete(progress_id: UUID) -> bool:
+        async with TestSessionLocal() as session:
+            return await ProgressService.delete_progress(session, progress_id, user_id)
+
+    assert await asyncio.gather(*[delete(progress_id) for progress_id in progress_ids]) == [True, True]
+
+    item = await get_list_item(client, auth_headers)
+    assert item["progress_count"] == 0
+    assert item["last_progress_date"] is None
+
+
+@pytest.mark.asyncio
+async def test_create_progress_other_users_prayer(client: AsyncClient, auth_headers: dict):
+    """다른 사용자의 기도에는 응답 과정 추가 불가"""
+    prayer_id = await create_prayer(client, auth_headers)
+
+    other = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "other@example.com", "password": "password123", "name": "Other"}
+    )
+    other_headers = {"Authorization": f"Bearer {other.json()['access_token']}"}
+
+    response = await client.post(
+        f"/api/v1/prayers/{prayer_id}/progress",
+        headers=other_headers,
+        json={"content": "기록", "recorded_date": "2024-02-01"}
+    )
+
+    assert response.status_code == 404
+    item = await get_list_item(client, auth_headers)
+    assert item["progress_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reconcile_counters_reports_drift(
+    client: AsyncClient,
+    auth_headers: dict,
+    db_session: AsyncSession
+):
+    """집계 재계산 시 어긋난 값 보고 및 수정"""
+    prayer_id = await create_prayer(client, auth_headers)
+    await create_prayer(client, auth_headers)
+    await client.post(
+        f"/api/v1/prayers/{prayer_id}/progress",
+        headers=auth_headers,
+        json={"content": "기록", "recorded_date": "2024-02-01"}
+    )
+
+    # 집계를 임의로 어긋나게 만듦
+    await db_session.execute(update(Prayer).where(Prayer.id == prayer_id).values(progress_count=7))
+    await db_session.commit()
+
+    report = await ProgressService.reconcile_counters(db_session, chunk_size=1)
+
+    assert report["checked"] == 2
+    assert len(report["drifted"]) == 1
+    assert report["drifted"][0]["progress_count"] == 7
+    assert report["drifted"][0]["actual_count"] == 1
+
+    report = await ProgressService.reconcile_counters(db_session)
+    assert report["drifted"] == []
+
+
+@pytest.mark.asyncio
+async def test_progress_batch_across_prayers(client: AsyncClient, auth_headers: dict):
+    """여러 기도에 응답 과정 일괄 추가 (소유하지 않은 기도는 404)"""
+    first_id = await create_prayer(client, auth_headers)
+    second_id = await create_prayer(client, auth_headers)
+    missing_id = "00000000-0000-0000-0000-000000000000"
+
+    with count_queries() as statements:
+        response = await client.post(
+            "/api/v1/prayers/progress/batch",
+            headers=auth_headers,
+            json={
+                "items": [
+                    {"prayer_id": first_id, "content": "1주차", "recorded_date": "2024-02-01"},
+                    {"prayer_id": second_id, "content": "1주차", "recorded_date": "2024-02-01"},
+                    {"prayer_id": first_id, "content": "2주차", "recorded_date": "2024-02-08"},
+                    {"prayer_id": missing_id, "content": "없음", "recorded_date": "2024-02-08"}
+                ]
+            }
+        )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert [r["status"] for r in data["results"]] == [201, 201, 201, 404]
+    assert data["succeeded"] == 3
+    # 집계 갱신(소유 확인)과 삽입 각 한 번
+    assert len([s for s in statements if s.startswith("UPDATE prayers")]) == 1
+    assert len([s for s in statements if s.startswith("INSERT INTO prayer_progress")]) == 1
+
+    response = await client.get("/api/v1/prayers/", headers=auth_headers)
+    items = {item["id"]: item for item in response.json()["items"]}
+    assert items[first_id]["progress_count"] == 2
+    assert items[first_id]["last_progress_date"] == "2024-02-08"
+    assert items[second_id]["progress_count"] == 1
+
+    response = await client.get(f"/api/v1/prayers/{first_id}/progress", headers=auth_headers)
+    assert [p["content"] for p in response.json()["items"]] == ["2주차", "1주차"]
+
+
+@pytest.mark.asyncio
+async def test_progress_timeline_cursor_pagination(client: AsyncClient, auth_headers: dict):
+    """응답 과정 목록 커서 페이지네이션 ((recorded_date, id) 내림차순, 같은 날짜 포함)"""
+    prayer_id = await create_prayer(client, auth_headers)
+    for i in range(5):
+        await client.post(
+            f"/api/v1/prayers/{prayer_id}/progress",
+            headers=auth_headers,
+            json={"content": f"기록 {i}", "recorded_date": f"2024-02-0{1 + i // 2}"}
+        )
+    url = f"/api/v1/prayers/{prayer_id}/progress"
+
+    full = await client.get(url, headers=auth_headers)
+    expected = [item["id"] for item in full.json()["items"]]
+    assert full.json()["next_cursor"] is None
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get(url, headers=auth_headers, params=params)
+        data = response.json()
+        assert data["total"] == 5
+        seen += [item["id"] for item in data["items"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == expected
+
+    detail = await client.get(
+        f"/api/v1/prayers/{prayer_id}/detail?progress_limit=2",
+        headers=auth_headers
+    )
+    rest = await client.get(
+        url, headers=auth_headers, params={"cursor": detail.json()["progress_next_cursor"]}
+    )
+    assert [item["id"] for item in rest.json()["items"]] == expected[2:]
+
+    response = await client.get(url, headers=auth_headers, params={"cursor": "invalid"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_progress_timeline_ndjson_stream(client: AsyncClient, auth_headers: dict, monkeypatch):
+    """format=ndjson이면 응답 과정을 한 줄씩 스트리밍"""
+    monkeypatch.setattr("app.services.progress_service.PROGRESS_STREAM_CHUNK_SIZE", 2)
+    prayer_id = await create_prayer(client, auth_headers)
+    for day in range(1, 6):
+        await client.post(
+            f"/api/v1/prayers/{prayer_id}/progress",
+            headers=auth_headers,
+            json={"content": f"기록 {day}", "recorded_date": f"2024-02-0{day}"}
+        )
+
+    response = await client.get(
+        f"/api/v1/prayers/{prayer_id}/progress?format=ndjson",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["content"] for line in lines] == [f"기록 {day}" for day in range(5, 0, -1)]
+
+    # 스트리밍 응답에도 조건부 GET 헤더 유지
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "private, no-cache"
+    response = await client.get(
+        f"/api/v1/prayers/{prayer_id}/progress?format=ndjson",
+        headers={**auth_headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    response = await client.get(
+        "/api/v1/prayers/00000000-0000-0000-0000-000000000000/progress?format=ndjson",
+        headers=auth_headers
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_progress_feed_across_prayers(client: AsyncClient, auth_headers: dict):
+    """전체 기도의 응답 과정 피드 (최근 기록순, 다른 사용자 기록 제외)"""
+    first_id = await create_prayer(client, auth_headers)
+    second_id = await create_prayer(client, auth_headers)
+    for day, prayer_id in enumerate([first_id, second_id, first_id, second_id], start=1):
+        await client.post(
+            f"/api/v1/prayers/{prayer_id}/progress",
+            headers=auth_headers,
+            json={"content": f"기록 {day}", "recorded_date": f"2024-02-0{day}"}
+        )
+
+    other = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "other@example.com", "password": "password123", "name": "Other"}
+    )
+    other_headers = {"Authorization": f"Bearer {other.json()['access_token']}"}
+    other_prayer_id = await create_prayer(client, other_headers)
+    await client.post(
+        f"/api/v1/prayers/{other_prayer_id}/progress",
+        headers=other_headers,
+        json={"content": "다른 사용자 기록", "recorded_date": "2024-03-01"}
+    )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/progress/feed", headers=auth_headers, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        seen += [(item["content"], item["prayer_id"]) for item in data["items"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == [
+        ("기록 4", second_id),
+        ("기록 3", first_id),
+        ("기록 2", second_id),
+        ("기록 1", first_id),
+    ]
+
+    response = await client.get(
+        "/api/v1/progress/feed", headers=auth_headers, params={"cursor": "invalid"}
+    )
+    assert response.status_code == 400
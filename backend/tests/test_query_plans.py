@@ -0,0 +1,203 @@
+import json
+import pytest
+from datetime import date, datetime, timedelta
+from httpx import AsyncClient
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.prayer import Prayer, PrayerStatus
+from app.models.prayer_progress import PrayerProgress
+from app.models.user import User
+from tests.conftest import count_queries, test_engine
+
+
+SUBJECTS = ["가족", "건강", "교회", "직장", "선교"]
+
+
+async def seed_prayers(db: AsyncSession, count: int = 500) -> list:
+    """실행 계획 검증용 데이터 생성 (다른 사용자 데이터 포함)"""
+    owner_id = (await db.execute(select(User.id))).scalar_one()
+    other = User(email="other@example.com", hashed_password="x", name="Other")
+    db.add(other)
+    await db.flush()
+
+    rows = []
+    for user_id in (owner_id, other.id):
+        for i in range(count):
+            answered = i % 4 == 0
+            rows.append({
+                "user_id": user_id,
+                "subject": SUBJECTS[i % len(SUBJECTS)],
+                "title": f"기도 {i}",
+                "content": f"기도 내용 {i}",
+                "prayer_type": "간구",
+                "status": PrayerStatus.ANSWERED if answered else PrayerStatus.ACTIVE,
+                "start_date": date(2024, 1, 1) + timedelta(days=i % 300),
+                "answer_date": date(2024, 12, 1) if answered else None,
+                "answer_content": None if i % 40 == 0 else ("응답" if answered else None),
+                "created_at": datetime(2024, 1, 1) + timedelta(minutes=i),
+            })
+    prayer_ids = (
+        await db.execute(insert(Prayer).returning(Prayer.id, Prayer.user_id), rows)
+    ).all()
+
+    await db.execute(
+        insert(PrayerProgress),
+        [
+            {
+                "prayer_id": prayer_id,
+                "user_id": user_id,
+                "content": f"응답 과정 {day}",
+                "recorded_date": date(2024, 2, day),
+            }
+            for prayer_id, user_id in prayer_ids
+            for day in (1, 2, 3)
+        ]
+    )
+    await db.commit()
+
+    async with test_engine.begin() as conn:
+        await conn.execute(text("ANALYZE"))
+
+    return [prayer_id for prayer_id, user_id in prayer_ids if user_id == owner_id]
+
+
+def plan_nodes(plan: dict):
+    """실행 계획의 모든 노드 순회"""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+async def explain(statements: list) -> list:
+    """수집한 SELECT 문을 같은 파라미터로 EXPLAIN (순차 스캔 비활성화)"""
+    plans = []
+    async with test_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        driver = raw.driver_connection
+        await driver.execute("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            if not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            result = await driver.fetchval(
+                f"EXPLAIN (FORMAT JSON) {statement}", *(parameters or ())
+            )
+            if isinstance(result, str):
+                result = json.loads(result)
+            plans.append((statement, result[0]["Plan"]))
+    return plans
+
+
+async def assert_index_only_access(client: AsyncClient, headers: dict, url: str) -> list:
+    """엔드포인트의 모든 조회가 순차 스캔 없이 인덱스로 처리되는지 확인
+
+    사용된 인덱스 이름 목록을 반환합니다.
+    """
+    with count_queries(parameters=True) as captured:
+        response = await client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+
+    indexes = []
+    for statement, plan in await explain(captured):
+        for node in plan_nodes(plan):
+            assert node["Node Type"] != "Seq Scan", (
+                f"Seq Scan on {node.get('Relation Name')}:\n{statement}"
+            )
+            if "Index Name" in node:
+                indexes.append(node["Index Name"])
+    return indexes
+
+
+@pytest.fixture
+async def seeded(client: AsyncClient, auth_headers: dict, db_session: AsyncSession) -> list:
+    """실행 계획 검증용 데이터가 준비된 사용자의 기도 ID 목록"""
+    return await seed_prayers(db_session)
+
+
+@pytest.mark.asyncio
+async def test_prayer_list_uses_user_created_index(client: AsyncClient, auth_headers: dict, seeded: list):
+    """기도 목록/개수 조회는 (user_id, created_at) 인덱스 사용"""
+    indexes = await assert_index_only_access(client, auth_headers, "/api/v1/prayers/?limit=20")
+    assert "ix_prayers_user_created" in indexes
+
+    indexes = await assert_index_only_access(
+        client, auth_headers, "/api/v1/prayers/?limit=20&include_total=false"
+    )
+    assert "ix_prayers_user_created" in indexes
+
+
+@pytest.mark.asyncio
+async def test_prayer_list_filters_use_composite_indexes(client: AsyncClient, auth_headers: dict, seeded: list):
+    """상태/주제 필터는 순차 스캔 없이 처리"""
+    indexes = await assert_index_only_access(client, auth_headers, "/api/v1/prayers/?status=answered")
+    assert {"ix_prayers_user_status", "ix_prayers_user_created"} & set(indexes)
+
+    indexes = await assert_index_only_access(client, auth_headers, "/api/v1/prayers/?subject=가족")
+    assert {"ix_prayers_user_subject", "ix_prayers_user_created"} & set(indexes)
+
+    await assert_index_only_access(client, auth_headers, "/api/v1/prayers/?search=내용")
+
+
+@pytest.mark.asyncio
+async def test_prayer_list_sorts_use_indexes(client: AsyncClient, auth_headers: dict, seeded: list):
+    """정렬 기준별 목록 조회는 해당 정렬 인덱스 사용 (커서 이후 페이지 포함)"""
+    for sort_by, index in [
+        ("start_date_desc", "ix_prayers_user_start_date"),
+        ("start_date_asc", "ix_prayers_user_start_date"),
+        ("answer_date_desc", "ix_prayers_user_answer_date"),
+        ("title_asc", "ix_prayers_user_title"),
+        ("title_desc", "ix_prayers_user_title"),
+    ]:
+        url = f"/api/v1/prayers/?limit=20&include_total=false&sort_by={sort_by}"
+        assert index in await assert_index_only_access(client, auth_headers, url)
+
+        response = await client.get(url, headers=auth_headers)
+        cursor = response.json()["next_cursor"]
+        indexes = await assert_index_only_access(client, auth_headers, f"{url}&cursor={cursor}")
+        assert index in indexes
+
+    await assert_index_only_access(client, auth_headers, "/api/v1/prayers/?sort_by=duration_desc")
+
+
+@pytest.mark.asyncio
+async def test_dashboard_queries_use_indexes(client: AsyncClient, auth_headers: dict, seeded: list):
+    """대시보드 조회는 순차 스캔 없이 처리"""
+    await assert_index_only_access(client, auth_headers, "/api/v1/dashboard/stats")
+    await assert_index_only_access(client, auth_headers, "/api/v1/dashboard/subject-stats")
+
+    indexes = await assert_index_only_access(client, auth_headers, "/api/v1/dashboard/recent")
+    assert "ix_prayers_user_created" in indexes
+
+    indexes = await assert_index_only_access(
+        client, auth_headers, "/api/v1/dashboard/answered-without-content"
+    )
+    assert {"ix_prayers_answered_without_content", "ix_prayers_user_status"} & set(indexes)
+
+
+@pytest.mark.asyncio
+async def test_progress_list_uses_prayer_timeline_index(client: AsyncClient, auth_headers: dict, seeded: list):
+    """응답 과정 목록은 (prayer_id, recorded_date, id) 인덱스 사용 (커서 이후 페이지 포함)"""
+    indexes = await assert_index_only_access(
+        client, auth_headers, f"/api/v1/prayers/{seeded[0]}/progress"
+    )
+    assert "ix_prayer_progress_prayer_timeline" in indexes
+
+    url = f"/api/v1/prayers/{seeded[0]}/progress?limit=2"
+    response = await client.get(url, headers=auth_headers)
+    cursor = response.json()["next_cursor"]
+    indexes = await assert_index_only_access(client, auth_headers, f"{url}&cursor={cursor}")
+    assert "ix_prayer_progress_prayer_timeline" in indexes
+
+    await assert_index_only_access(client, auth_headers, "/api/v1/search/?q=응답")
+
+
+@pytest.mark.asyncio
+async def test_progress_feed_uses_user_timeline_index(client: AsyncClient, auth_headers: dict, seeded: list):
+    """응답 과정 피드는 prayers 조인 없이 (user_id, recorded_date, id) 인덱스 사용"""
+    url = "/api/v1/progress/feed?limit=20"
+    indexes = await assert_index_only_access(client, auth_headers, url)
+    assert "ix_prayer_progress_user_timeline" in indexes
+
+    response = await client.get(url, headers=auth_headers)
+    cursor = response.json()["next_cursor"]
+    indexes = await assert_index_only_access(client, auth_headers, f"{url}&cursor={cursor}")
+    assert "ix_prayer_progress_user_timeline" in indexes
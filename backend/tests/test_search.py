@@ -0,0 +1,85 @@
+import pytest
+from httpx import AsyncClient
+from tests.conftest import create_prayer
+
+
+@pytest.mark.asyncio
+async def test_search_prayers_and_progress(client: AsyncClient, auth_headers: dict):
+    """기도와 응답 과정을 함께 검색하고 강조 스니펫 반환"""
+    prayer_id = await create_prayer(client, auth_headers, title="어머니 건강", content="어머니의 수술이 잘 되기를 기도합니다")
+    await create_prayer(client, auth_headers, title="직장", content="새 직장을 위한 간구")
+    await client.post(
+        f"/api/v1/prayers/{prayer_id}/progress",
+        headers=auth_headers,
+        json={"content": "수술 후 회복이 빠릅니다", "recorded_date": "2024-02-01"}
+    )
+
+    response = await client.get("/api/v1/search/?q=수술", headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 2
+    assert {hit["type"] for hit in data["items"]} == {"prayer", "progress"}
+    assert all(hit["prayer_id"] == prayer_id for hit in data["items"])
+    assert all("<mark>" in hit["snippet"] for hit in data["items"])
+
+
+@pytest.mark.asyncio
+async def test_search_snippet_escapes_content(client: AsyncClient, auth_headers: dict):
+    """스니펫의 사용자 내용은 HTML 이스케이프하고 강조 태그만 남김"""
+    await create_prayer(client, auth_headers, title="태그", content="수술 <scr<script>ipt>alert(1)</script> 1 < 2 수술")
+
+    response = await client.get("/api/v1/search/?q=수술", headers=auth_headers)
+
+    snippet = response.json()["items"][0]["snippet"]
+    assert "<scr" not in snippet
+    assert "&lt;scr" in snippet
+    assert "1 &lt; 2" in snippet
+    assert "<mark>수술</mark>" in snippet
+
+
+@pytest.mark.asyncio
+async def test_search_korean_prefix_and_substring(client: AsyncClient, auth_headers: dict):
+    """조사가 붙은 단어(접두어)와 단어 중간 부분 문자열 검색"""
+    await create_prayer(client, auth_headers, title="가정", content="가정의 평화를 구합니다")
+    await create_prayer(client, auth_headers, title="건강", content="아버지의 건강회복을 위하여")
+
+    # 접두어: '평화' -> '평화를'
+    response = await client.get("/api/v1/search/?q=평화", headers=auth_headers)
+    assert [hit["title"] for hit in response.json()["items"]] == ["가정"]
+
+    # 부분 문자열: '회복' -> '건강회복을'
+    response = await client.get("/api/v1/search/?q=회복", headers=auth_headers)
+    assert [hit["title"] for hit in response.json()["items"]] == ["건강"]
+
+
+@pytest.mark.asyncio
+async def test_search_only_own_prayers(client: AsyncClient, auth_headers: dict):
+    """다른 사용자의 기도와 응답 과정은 검색되지 않음"""
+    prayer_id = await create_prayer(client, auth_headers, title="감사", content="감사 기도")
+    await client.post(
+        f"/api/v1/prayers/{prayer_id}/progress",
+        headers=auth_headers,
+        json={"content": "감사한 하루", "recorded_date": "2024-02-01"}
+    )
+
+    other = await client.post(
+        "/api/v1/auth/register",
+        json={"email": "other@example.com", "password": "password123", "name": "Other"}
+    )
+    other_headers = {"Authorization": f"Bearer {other.json()['access_token']}"}
+
+    response = await client.get("/api/v1/search/?q=감사", headers=other_headers)
+
+    assert response.json()["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_prayer_list_search_filter(client: AsyncClient, auth_headers: dict):
+    """기도 목록 search 필터도 같은 검색 조건 사용"""
+    await create_prayer(client, auth_headers, title="선교", content="선교지의 안전을 위하여")
+    await create_prayer(client, auth_headers, title="진로", content="진로 결정을 위하여")
+
+    response = await client.get("/api/v1/prayers/?search=안전", headers=auth_headers)
+
+    assert [item["title"] for item in response.json()["items"]] == ["선교"]
@@ -37,6 +37,7 @@ STATUS_COLORS = {
 
 # 페이지네이션
 ITEMS_PER_PAGE = 10
+PROGRESS_PAGE_SIZE = 20
 
 # 텍스트 길이 제한
 MAX_TITLE_LENGTH = 200
@@ -49,5 +50,9 @@ SORT_OPTIONS = {
     "최신순": "created_at_desc",
     "오래된순": "created_at_asc",
     "시작일 최신순": "start_date_desc",
-    "시작일 오래된순": "start_date_asc"
+    "시작일 오래된순": "start_date_asc",
+    "응답일 최신순": "answer_date_desc",
+    "기도 기간 긴 순": "duration_desc",
+    "기도 기간 짧은 순": "duration_asc",
+    "제목순": "title_asc"
 }
\ No newline at end of file
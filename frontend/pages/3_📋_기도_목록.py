@@ -100,8 +100,8 @@ try:
 
             # 기도 정보 로드
             with st.spinner("기도 정보를 불러오는 중..."):
-                prayer = api_client.get_prayer(prayer_id)
-                progress_logs = api_client.get_prayer_logs(prayer_id)
+                prayer = api_client.get_prayer_detail(prayer_id)
+                progress_logs = prayer.get("progress", [])
 
             # 모달 다이얼로그
             @st.dialog("📖 기도 상세", width="large")
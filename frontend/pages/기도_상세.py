@@ -3,6 +3,7 @@ import streamlit as st
 from datetime import date, datetime
 from utils.state import init_session_state, is_authenticated, try_auto_login
 from utils.api_client import api_client
+from config.constants import PROGRESS_PAGE_SIZE
 
 # 페이지 설정
 st.set_page_config(
@@ -35,8 +36,17 @@ prayer_id = st.session_state.selected_prayer_id
 # 기도 정보 로드
 try:
     with st.spinner("기도 정보를 불러오는 중..."):
-        prayer = api_client.get_prayer(prayer_id)
-        progress_logs = api_client.get_prayer_logs(prayer_id)
+        prayer = api_client.get_prayer_detail(prayer_id, progress_limit=PROGRESS_PAGE_SIZE)
+        progress_logs = prayer.get("progress", [])
+        next_cursor = prayer.get("progress_next_cursor")
+
+        # "이전 기록 더 보기"로 불러온 기록 (커서 페이지네이션)
+        more_logs = st.session_state.get("more_progress_logs")
+        if more_logs and more_logs["prayer_id"] == prayer_id:
+            progress_logs = progress_logs + more_logs["items"]
+            next_cursor = more_logs["next_cursor"]
+        else:
+            more_logs = None
 
     # 헤더
     col1, col2 = st.columns([4, 1])
@@ -136,6 +146,7 @@ try:
                                 "content": progress_content,
                                 "recorded_date": date.today().isoformat()
                             })
+                            st.session_state.more_progress_logs = None
                             st.success("기록이 추가되었습니다!")
                             st.rerun()
                         except Exception as e:
@@ -143,7 +154,7 @@ try:
 
     # 기존 기록 목록
     if progress_logs:
-        st.markdown(f"**총 {len(progress_logs)}개의 기록**")
+        st.markdown(f"**총 {prayer['progress_count']}개의 기록**")
 
         for log in progress_logs:
             with st.container(border=True):
@@ -202,10 +213,20 @@ try:
                         if st.button("🗑️", key=f"delete_{log['id']}", use_container_width=True):
                             try:
                                 api_client.delete_prayer_log(prayer_id, log["id"])
+                                st.session_state.more_progress_logs = None
                                 st.success("삭제되었습니다!")
                                 st.rerun()
                             except Exception as e:
                                 st.error(f"삭제 실패: {str(e)}")
+
+        if next_cursor and st.button("이전 기록 더 보기", use_container_width=True):
+            page = api_client.get_prayer_logs_page(prayer_id, cursor=next_cursor, limit=PROGRESS_PAGE_SIZE)
+            st.session_state.more_progress_logs = {
+                "prayer_id": prayer_id,
+                "items": (more_logs["items"] if more_logs else []) + page.get("items", []),
+                "next_cursor": page.get("next_cursor")
+            }
+            st.rerun()
     else:
         st.info("아직 기록이 없습니다. 첫 기록을 추가해보세요!")
 
@@ -34,6 +34,30 @@ class APIClient:
         
         return response.json()
     
+    def _conditional_get(self, url: str, params: Optional[Dict] = None) -> Any:
+        """ETag 조건부 GET (304이면 세션에 저장한 이전 응답 본문 재사용)
+        
+        Streamlit 재실행마다 같은 조회를 다시 받지 않도록 URL/파라미터별로
+        마지막 ETag와 본문을 st.session_state에 저장합니다.
+        """
+        cache = st.session_state.setdefault("etag_cache", {})
+        key = (url, tuple(sorted((params or {}).items())))
+        
+        headers = self._get_headers()
+        cached = cache.get(key)
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+        
+        response = requests.get(url, headers=headers, params=params)
+        if response.status_code == 304 and cached:
+            return cached["body"]
+        
+        result = self._handle_response(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            cache[key] = {"etag": etag, "body": result}
+        return result
+    
     # ===== 인증 =====
     def register(self, email: str, username: str, password: str) -> Dict:
         """회원가입"""
@@ -83,8 +107,7 @@ class APIClient:
         if sort_by:
             params["sort_by"] = sort_by
 
-        response = requests.get(url, headers=self._get_headers(), params=params)
-        result = self._handle_response(response)
+        result = self._conditional_get(url, params)
 
         # 응답이 dict이고 items 필드가 있으면 items 반환, 아니면 그대로 반환
         if isinstance(result, dict) and "items" in result:
@@ -97,6 +120,13 @@ class APIClient:
         response = requests.get(url, headers=self._get_headers())
         return self._handle_response(response)
     
+    def get_prayer_detail(self, prayer_id: str, progress_limit: Optional[int] = None) -> Dict:
+        """기도 상세 조회 (응답 과정 기록 포함, progress 필드)"""
+        url = f"{self.base_url}/prayers/{prayer_id}/detail"
+        params = {"progress_limit": progress_limit} if progress_limit else None
+        response = requests.get(url, headers=self._get_headers(), params=params)
+        return self._handle_response(response)
+    
     def create_prayer(self, data: Dict) -> Dict:
         """기도 등록"""
         url = f"{self.base_url}/prayers"
@@ -129,6 +159,22 @@ class APIClient:
         result = self._handle_response(response)
         return result.get("items", []) if isinstance(result, dict) else result
 
+    def get_prayer_logs_page(
+        self,
+        prayer_id: str,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Dict:
+        """응답 과정 기록 한 페이지 (items, total, next_cursor)"""
+        url = f"{self.base_url}/prayers/{prayer_id}/progress"
+        params = {}
+        if cursor:
+            params["cursor"] = cursor
+        if limit:
+            params["limit"] = limit
+        response = requests.get(url, headers=self._get_headers(), params=params)
+        return self._handle_response(response)
+
     def create_prayer_log(self, prayer_id: str, data: Dict) -> Dict:
         """응답 과정 기록 추가"""
         url = f"{self.base_url}/prayers/{prayer_id}/progress"
@@ -151,14 +197,12 @@ class APIClient:
     def get_dashboard_stats(self) -> Dict:
         """대시보드 통계"""
         url = f"{self.base_url}/dashboard/stats"
-        response = requests.get(url, headers=self._get_headers())
-        return self._handle_response(response)
+        return self._conditional_get(url)
     
     def get_subject_stats(self) -> List[Dict]:
         """주제별 통계"""
         url = f"{self.base_url}/dashboard/subject-stats"
-        response = requests.get(url, headers=self._get_headers())
-        result = self._handle_response(response)
+        result = self._conditional_get(url)
 
         # 리스트가 아니면 빈 리스트 반환
         return result if isinstance(result, list) else []